@@ -293,6 +293,18 @@ def get_roller_head_limits(roller_type):
         print(f"❌ Error loading head limits from DB: {e}")
         return 180, 240
 
+# Change counters of the inspection statistics, one per writer: the BF process,
+# the OD process and the UI (reset). A Manager key increment is an unlocked
+# read-modify-write, so two writers sharing one key would lose bumps.
+STATS_SEQ_KEYS = ("bf_stats_seq", "od_stats_seq", "ui_stats_seq")
+
+def bump_stats_seq(shared_data, key):
+    """Mark the inspection counters as changed (call after updating them)
+
+    key: The caller's own counter from STATS_SEQ_KEYS
+    """
+    shared_data[key] = shared_data.get(key, 0) + 1
+
 def annotate_detections(image, detections):
     """
     Draws bounding boxes and labels on the image using different colors per class.
@@ -382,9 +394,10 @@ def filter_detections(detections, confidence_thresholds, size_thresholds):
 
     return filtered
 
-def plc_communication(plc_ip, rack, slot, db_number, shared_data, command_queue):
+def plc_communication(plc_ip, rack, slot, db_number, shared_data, command_queue, system_ready_event=None):
     """
     Handles all PLC communication: reading sensor statuses and executing commands.
+    Sets system_ready_event (if given) once both models are ready and the lights are on.
     """
     set_priority_below_normal()
     
@@ -405,6 +418,8 @@ def plc_communication(plc_ip, rack, slot, db_number, shared_data, command_queue)
                 set_bool(data, byte_index=1, bool_index=7, value=True)
                 plc_client.write_area(Areas.DB, db_number, 0, data)
                 shared_data['overall_system_ready'] = True
+                if system_ready_event is not None:
+                    system_ready_event.set()
                 plc_client.disconnect()
                 break
         
@@ -512,7 +527,7 @@ def capture_frames_bigface(shared_frame_bigface, frame_lock_bigface, frame_shape
 
 
         
-def process_rollers_bigface(shared_frame_bigface, frame_lock_bigface, roller_queue_bigface, model_bigface_path, proximity_count_bigface, roller_updation_dict, queue_lock, shared_data, frame_shape, shared_annotated_bigface, annotated_frame_lock_bigface):
+def process_rollers_bigface(shared_frame_bigface, frame_lock_bigface, roller_queue_bigface, model_bigface_path, proximity_count_bigface, roller_updation_dict, queue_lock, shared_data, frame_shape, shared_annotated_bigface, annotated_frame_lock_bigface, annotated_frame_seq_bigface):
     """Process frames for YOLO inference."""
     set_priority_high()
     
@@ -616,6 +631,7 @@ def process_rollers_bigface(shared_frame_bigface, frame_lock_bigface, roller_que
     shared_data["bf_high_head"] = 0
     shared_data["bf_down_head"] = 0
     shared_data["bf_others"] = 0
+    bump_stats_seq(shared_data, "bf_stats_seq")
 
     allow_all = shared_data.get("allow_all", False)  
     if allow_all:
@@ -640,6 +656,7 @@ def process_rollers_bigface(shared_frame_bigface, frame_lock_bigface, roller_que
                 bf_triggered = True
                 roller_dict[roller_id_counter] = {'defect': False , 'defect_names': ["No defect"]}
                 shared_data["bf_inspected"] += 1
+                bump_stats_seq(shared_data, "bf_stats_seq")
                 log_info("inference", f"BF roller detected. Assigned Roller ID: {roller_id_counter}")
                 print(f"\n🎯 BF New roller detected! Assigned Roller ID: {roller_id_counter}")
 
@@ -749,9 +766,12 @@ def process_rollers_bigface(shared_frame_bigface, frame_lock_bigface, roller_que
                     save_path = f"{detected_folder}/{bf_file_counter}.jpg"
                     cv2.imwrite(save_path, annotated_frame)
 
+                # Fill the slot the UI is not showing (no lock needed), then publish it
+                annotated_slots = np.frombuffer(shared_annotated_bigface.get_obj(), dtype=np.uint8).reshape((2, *frame_shape))
+                next_seq = annotated_frame_seq_bigface.value + 1
+                np.copyto(annotated_slots[next_seq & 1], annotated_frame)
                 with annotated_frame_lock_bigface:
-                    np_annotated = np.frombuffer(shared_annotated_bigface.get_obj(), dtype=np.uint8).reshape(frame_shape)
-                    np.copyto(np_annotated, annotated_frame)
+                    annotated_frame_seq_bigface.value = next_seq
                     
                 if len(detections) > 0:
 
@@ -817,6 +837,8 @@ def process_rollers_bigface(shared_frame_bigface, frame_lock_bigface, roller_que
                             elif defect_lower != "no defect":
                                 shared_data["bf_others"] += 1
 
+                        bump_stats_seq(shared_data, "bf_stats_seq")
+
                     roller_queue_bigface.put(defect_detected)
                     roller_updation_dict[first_key] = int(defect_detected)
                     roller_dict.pop(first_key)
@@ -896,7 +918,7 @@ def capture_frames_od(shared_frame_od, frame_lock_od, frame_shape, shared_data):
         print(f"Camera capture error: {e}")
         shared_data["system_error"] = True
 
-def process_frames_od(shared_frame_od, frame_lock_od, roller_queue_od, model_od_path, queue_lock, shared_data, frame_shape, roller_updation_dict,shared_annotated_od, annotated_frame_lock_od):
+def process_frames_od(shared_frame_od, frame_lock_od, roller_queue_od, model_od_path, queue_lock, shared_data, frame_shape, roller_updation_dict,shared_annotated_od, annotated_frame_lock_od, annotated_frame_seq_od):
     """Process frames for YOLO inference and track roller defects with pulse debounce & proper exit handling."""
     set_priority_high()
     
@@ -963,6 +985,7 @@ def process_frames_od(shared_frame_od, frame_lock_od, roller_queue_od, model_od_
     shared_data["od_damage_on_end"] = 0
     shared_data["od_spherical_mark"] = 0
     shared_data["od_others"] = 0
+    bump_stats_seq(shared_data, "od_stats_seq")
 
     allow_all = shared_data.get("allow_all", False)
     if allow_all:
@@ -1027,9 +1050,12 @@ def process_frames_od(shared_frame_od, frame_lock_od, roller_queue_od, model_od_
                     save_path = f"{detected_folder}/{od_file_counter}.jpg"
                     cv2.imwrite(save_path, annotated_frame)
 
+                # Fill the slot the UI is not showing (no lock needed), then publish it
+                annotated_slots = np.frombuffer(shared_annotated_od.get_obj(), dtype=np.uint8).reshape((2, *frame_shape))
+                next_seq = annotated_frame_seq_od.value + 1
+                np.copyto(annotated_slots[next_seq & 1], annotated_frame)
                 with annotated_frame_lock_od:
-                    np_annotated = np.frombuffer(shared_annotated_od.get_obj(), dtype=np.uint8).reshape(frame_shape)
-                    np.copyto(np_annotated, annotated_frame)
+                    annotated_frame_seq_od.value = next_seq
 
                 if len(detections) > 0:
                     roller_only_sorted = [detection for detection in detections if detection[0] == "roller" and detection[-1] > 0.80]
@@ -1090,6 +1116,8 @@ def process_frames_od(shared_frame_od, frame_lock_od, roller_queue_od, model_od_
                                 elif defect_lower != "no defect":
                                     shared_data["od_others"] += 1
 
+                            bump_stats_seq(shared_data, "od_stats_seq")
+
 
                     roller_dict.pop(first_key) 
                     if roller_updation_dict[first_key] == 0 :
@@ -5,34 +5,102 @@ Handles MySQL database operations for BF and OD roller inspection data
 
 import mysql.connector
 from mysql.connector import Error
+from mysql.connector import pooling
 from datetime import datetime, date, time as dt_time
+import threading
 import traceback
+from types import MappingProxyType
 from frontend.utils.config import AppConfig
 
 
+def _read_pool_config():
+    """Snapshot the shared pool's connection settings from AppConfig."""
+    # Every statement run on a pooled connection is committed on its own, so
+    # autocommit spares the implicit transaction around the pool's SELECTs.
+    return MappingProxyType({
+        "host": AppConfig.DB_HOST,
+        "port": AppConfig.DB_PORT,
+        "user": AppConfig.DB_USER,
+        "password": AppConfig.DB_PASSWORD,
+        "database": AppConfig.DB_DATABASE,
+        "autocommit": True,
+        "connection_timeout": 2,
+    })
+
+
+# Connection settings of the shared pool, read from AppConfig at import and
+# again by reset_connection_pool() when the database settings change
+_POOL_CONFIG = _read_pool_config()
+
+# Shared connection pool, created on first use by get_connection_pool()
+_connection_pool = None
+_connection_pool_lock = threading.Lock()
+
+
+def get_connection_pool():
+    """
+    Get the shared MySQL connection pool, creating it on first use.
+    
+    Pooled connections keep their socket open between uses, so repeated
+    health checks and saves skip the TCP connect and auth handshake.
+    
+    Returns:
+        MySQLConnectionPool: Pool of connections to the configured database
+    """
+    global _connection_pool
+    with _connection_pool_lock:
+        if _connection_pool is None:
+            _connection_pool = pooling.MySQLConnectionPool(
+                pool_name="roller",
+                # Roller lookups, inspection saves and Info tab queries each
+                # borrow one only for the duration of an operation
+                pool_size=5,
+                # Pooled sessions carry no state worth clearing between uses
+                pool_reset_session=False,
+                **_POOL_CONFIG
+            )
+        return _connection_pool
+
+
+def reset_connection_pool():
+    """
+    Drop the shared pool so the next use connects with the current AppConfig.
+    
+    Connections already borrowed keep working until they are closed.
+    """
+    global _connection_pool, _POOL_CONFIG
+    with _connection_pool_lock:
+        _POOL_CONFIG = _read_pool_config()
+        _connection_pool = None
+
+
 class RollerDatabase:
     """Database handler for roller inspection tracking."""
     
-    def __init__(self):
+    def __init__(self, use_pool=False):
         """
         Initialize database connection.
         
         Args:
-            host: MySQL server host
-            user: Database username
-            password: Database password
-            database: Database name
+            use_pool: Borrow the connection from the shared connection pool
         """
         self.host = AppConfig.DB_HOST
         self.port = AppConfig.DB_PORT
         self.user = AppConfig.DB_USER
         self.password = AppConfig.DB_PASSWORD
         self.database = AppConfig.DB_DATABASE
+        self.use_pool = use_pool
         self.connection = None
     
     def connect(self):
         """Establish database connection."""
         try:
+            if self.use_pool:
+                self.connection = get_connection_pool().get_connection()
+                # Pooled sockets may have been dropped by the server while idle
+                self.connection.ping(reconnect=True, attempts=1, delay=0)
+                return True
+            
             self.connection = mysql.connector.connect(
                 host=self.host,
                 user=self.user,
@@ -43,11 +111,17 @@ class RollerDatabase:
                 return True
         except Error as e:
             print(f"❌ Error connecting to MySQL database: {e}")
+            self.disconnect()
             return False
     
     def disconnect(self):
-        """Close database connection."""
-        if self.connection and self.connection.is_connected():
+        """Close database connection (returns it to the pool when pooled)."""
+        if self.use_pool:
+            # Always hand a borrowed connection back, even if its socket died
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+        elif self.connection and self.connection.is_connected():
             self.connection.close()
     
     def insert_bf_tracking(self, employee_id, start_time, shared_data):
@@ -186,7 +260,7 @@ class RollerDatabase:
 # Convenience functions for easy import
 def save_to_database(employee_id, start_time, shared_data, 
                      host=AppConfig.DB_HOST, user=AppConfig.DB_USER, password=AppConfig.DB_PASSWORD, 
-                     database=AppConfig.DB_DATABASE):
+                     database=AppConfig.DB_DATABASE, use_pool=False):
     """
     Save inspection data to database.
     
@@ -198,11 +272,12 @@ def save_to_database(employee_id, start_time, shared_data,
         user: Database username
         password: Database password
         database: Database name
+        use_pool: Borrow the connection from the shared connection pool
     
     Returns:
         bool: True if successful, False otherwise
     """
-    db = RollerDatabase()
+    db = RollerDatabase(use_pool=use_pool)
     
     if db.connect():
         success = db.save_inspection_session(employee_id, start_time, shared_data)
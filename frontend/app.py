@@ -4,8 +4,10 @@ Main Application Class for WelVision System
 
 import tkinter as tk
 import numpy as np
+import threading
 import time
-from multiprocessing import Process, Array, Queue, Lock, Value, Manager
+from concurrent.futures import ThreadPoolExecutor
+from multiprocessing import Process, Array, Queue, Lock, Value, Manager, Event
 from ultralytics import YOLO
 import snap7
 from snap7.util import set_bool
@@ -36,6 +38,8 @@ from backend import (
     capture_frames_od,
     process_frames_od,
     handle_slot_control_od,
+    bump_stats_seq,
+    STATS_SEQ_KEYS,
 )
 
 import shutil
@@ -61,8 +65,30 @@ def clear_gpu_memory():
     except ImportError:
         print("⚠️ PyTorch not installed; skipping GPU memory clearance.")
 
+def _shared_counter(key):
+    """Read-only attribute that returns an inspection counter from shared_data."""
+    def getter(self):
+        shared_data = getattr(self, 'shared_data', None)
+        return shared_data.get(key, 0) if shared_data is not None else 0
+    return property(getter)
+
+
 class WelVisionApp(tk.Tk):
-    """Main WelVision Application."""
+    """
+    Main WelVision Application.
+    
+    The old statistics attributes (od_inspected, od_defective, od_good,
+    bf_inspected, bf_defective, bf_good) are live read-only views onto the
+    counters in shared_data, so resetting shared_data also resets them.
+    """
+    
+    # Old statistics names (kept for backward compatibility)
+    od_inspected = _shared_counter("od_inspected")
+    od_defective = _shared_counter("od_not_ok_rollers")
+    od_good = _shared_counter("od_ok_rollers")
+    bf_inspected = _shared_counter("bf_inspected")
+    bf_defective = _shared_counter("bf_not_ok_rollers")
+    bf_good = _shared_counter("bf_ok_rollers")
     
     def __init__(self):
         """Initialize the WelVision application."""
@@ -81,16 +107,9 @@ class WelVisionApp(tk.Tk):
         self.current_user = None
         self.current_role = None
         
-        # Statistics variables
-        self.od_inspected = 0
-        self.od_defective = 0
-        self.od_good = 0
-        self.bf_inspected = 0
-        self.bf_defective = 0
-        self.bf_good = 0
-        
         # Inspection status
         self.inspection_running = False
+        self.inspection_running_flag = threading.Event()  # Set once the inspection processes are up
         self.camera_running = False
         self.inspection_has_run = False  # Track if inspection has been run at least once
         
@@ -98,6 +117,9 @@ class WelVisionApp(tk.Tk):
         self.process_manager = ProcessManager()
         self.camera_stop_flag = ThreadStopFlag()
         
+        # Background worker for database writes triggered from the UI
+        self._db_executor = ThreadPoolExecutor(max_workers=1, thread_name_prefix="DatabaseWriter")
+        
         # Roller data update flag (for inference page refresh)
         self.roller_data_updated = False
         
@@ -419,6 +441,11 @@ class WelVisionApp(tk.Tk):
         self.shared_data["od_spherical_mark"] = 0
         self.shared_data["od_others"] = 0
         
+        # Bumped whenever the counters above change (one key per writer); the
+        # results panel only re-reads them when one of these moves
+        for key in STATS_SEQ_KEYS:
+            self.shared_data[key] = 0
+        
         # System Check Statistics (Pattern-based control)
         self.shared_data["system_check_bf_processed"] = 0
         self.shared_data["system_check_bf_accepted"] = 0
@@ -433,6 +460,9 @@ class WelVisionApp(tk.Tk):
         # Track inspection session start time
         self.inspection_start_time = None
         
+        # Set by the PLC process once both models are warmed up and lights are on
+        self.system_ready_event = Event()
+        
         # System error flag
         self.shared_data["system_error"] = False
         
@@ -454,13 +484,21 @@ class WelVisionApp(tk.Tk):
         self.frame_lock_od = Lock()
         self.queue_lock = Lock()
         
-        # Shared memory for storing annotated frames
-        self.shared_annotated_bigface = Array('B', np.zeros(self.frame_shape, dtype=np.uint8).flatten())
-        self.shared_annotated_od = Array('B', np.zeros(self.frame_shape, dtype=np.uint8).flatten())
+        # Shared memory for storing annotated frames: two frame slots per camera.
+        # The inference process fills the slot the UI is not showing, then
+        # publishes it by bumping the sequence number (slot = seq & 1).
+        annotated_size = 2 * int(np.prod(self.frame_shape))
+        self.shared_annotated_bigface = Array('B', annotated_size)
+        self.shared_annotated_od = Array('B', annotated_size)
         
+        # Guard only the sequence numbers, not the frames
         self.annotated_frame_lock_bigface = Lock()
         self.annotated_frame_lock_od = Lock()
         
+        # Sequence number of the latest published annotated frame
+        self.annotated_frame_seq_bigface = Value('I', 0, lock=False)
+        self.annotated_frame_seq_od = Value('I', 0, lock=False)
+        
         # PLC configuration
         self.PLC_IP = AppConfig.PLC_IP
         self.RACK = AppConfig.PLC_RACK
@@ -472,7 +510,8 @@ class WelVisionApp(tk.Tk):
         """Create process instances for backend operations."""
         self.plc_process = Process(
             target=plc_communication,
-            args=(self.PLC_IP, self.RACK, self.SLOT, self.DB_NUMBER, self.shared_data, self.command_queue),
+            args=(self.PLC_IP, self.RACK, self.SLOT, self.DB_NUMBER, self.shared_data, self.command_queue,
+                  self.system_ready_event),
             daemon=True
         )
         # Register PLC process
@@ -502,7 +541,8 @@ class WelVisionApp(tk.Tk):
                     self.shared_data, 
                     self.frame_shape, 
                     self.shared_annotated_bigface, 
-                    self.annotated_frame_lock_bigface
+                    self.annotated_frame_lock_bigface,
+                    self.annotated_frame_seq_bigface
                 ), 
                 daemon=True
             ),
@@ -518,7 +558,8 @@ class WelVisionApp(tk.Tk):
                     self.frame_shape, 
                     self.roller_updation_dict, 
                     self.shared_annotated_od, 
-                    self.annotated_frame_lock_od
+                    self.annotated_frame_lock_od,
+                    self.annotated_frame_seq_od
                 ), 
                 daemon=True
             ),
@@ -563,6 +604,9 @@ class WelVisionApp(tk.Tk):
             self.inspection_start_time = datetime.now().time()
             log_info(page_name, f"Inspection start time: {self.inspection_start_time}")
             
+            # New session: readiness must be signalled again by the new processes
+            self.system_ready_event.clear()
+            
             # Recreate processes before starting
             self.create_processes()
             
@@ -576,6 +620,9 @@ class WelVisionApp(tk.Tk):
                 process.start()
                 log_info(page_name, f"Subprocess {idx+1}/{len(self.processes)} started")
             
+            # Camera feed threads switch to the live annotated frames
+            self.inspection_running_flag.set()
+            
             log_info(page_name, "✅ Inspection started successfully")
             
             # Start monitoring for system errors
@@ -589,6 +636,7 @@ class WelVisionApp(tk.Tk):
             })
             # Ensure inspection is stopped if error occurs
             self.inspection_running = False
+            self.inspection_running_flag.clear()
             if self.inference_tab and self.inference_tab.control_panel:
                 self.inference_tab.control_panel.enable_start()
             raise
@@ -626,6 +674,7 @@ class WelVisionApp(tk.Tk):
                 })
             
             self.inspection_running = False
+            self.inspection_running_flag.clear()
             if self.inference_tab and self.inference_tab.control_panel:
                 self.inference_tab.control_panel.enable_start()
             
@@ -857,7 +906,7 @@ class WelVisionApp(tk.Tk):
         info_label.pack(pady=10)
     
     def start_camera_feeds(self):
-        """Start camera feed update threads."""
+        """Start camera feed updates."""
         self.camera_running = True
         if self.inference_tab:
             self.inference_tab.start_camera_threads()
@@ -867,12 +916,13 @@ class WelVisionApp(tk.Tk):
         if hasattr(self, 'od_inspected_var') and self.inspection_running:
             # Increment counters randomly for demonstration
             if np.random.random() < 0.2:  # 20% chance to update
-                self.od_inspected += 1
+                self.shared_data["od_inspected"] = self.od_inspected + 1
                 defect = np.random.random() < 0.3  # 30% chance of defect
                 if defect:
-                    self.od_defective += 1
+                    self.shared_data["od_not_ok_rollers"] = self.od_defective + 1
                 else:
-                    self.od_good += 1
+                    self.shared_data["od_ok_rollers"] = self.od_good + 1
+                bump_stats_seq(self.shared_data, "ui_stats_seq")
                 
                 # Update display variables
                 self.od_inspected_var.set(str(self.od_inspected))
@@ -885,12 +935,13 @@ class WelVisionApp(tk.Tk):
             
             # BIG FACE statistics
             if np.random.random() < 0.2:  # 20% chance to update
-                self.bf_inspected += 1
+                self.shared_data["bf_inspected"] = self.bf_inspected + 1
                 defect = np.random.random() < 0.2  # 20% chance of defect
                 if defect:
-                    self.bf_defective += 1
+                    self.shared_data["bf_not_ok_rollers"] = self.bf_defective + 1
                 else:
-                    self.bf_good += 1
+                    self.shared_data["bf_ok_rollers"] = self.bf_good + 1
+                bump_stats_seq(self.shared_data, "ui_stats_seq")
                 
                 # Update display variables
                 self.bf_inspected_var.set(str(self.bf_inspected))
@@ -997,6 +1048,7 @@ class WelVisionApp(tk.Tk):
                 
                 # Stop all processes
                 self.inspection_running = False
+                self.inspection_running_flag.clear()
                 if self.inference_tab and self.inference_tab.control_panel:
                     self.inference_tab.control_panel.enable_start()
                 
@@ -1152,6 +1204,9 @@ class WelVisionApp(tk.Tk):
         # Stop all remaining processes and threads
         self.process_manager.stop_everything()
         
+        # Let pending database saves finish
+        self._db_executor.shutdown(wait=True)
+        
         # Clean up cache and GPU memory
         delete_all_pycache(".")
         self.process_manager.cleanup_gpu_memory()
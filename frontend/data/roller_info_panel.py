@@ -7,6 +7,7 @@ import tkinter as tk
 from tkinter import messagebox
 from ..utils.styles import Colors, Fonts
 from ..utils.debug_logger import log_error, log_warning, log_info
+from ..inference.roller_queries import invalidate_roller_cache
 from .data_database import DataDatabase
 
 
@@ -230,6 +231,9 @@ class RollerInfoPanel:
                 # Refresh table if available
                 if hasattr(self.app, 'data_tab') and self.app.data_tab and self.app.data_tab.roller_data_table:
                     self.app.data_tab.roller_data_table.load_roller_data()
+                # Drop cached roller info now: the Inference tab is rebuilt
+                # (and reads the roller list) before its monitor sees the flag
+                invalidate_roller_cache()
                 # Set flag to refresh inference page roller list
                 self.app.roller_data_updated = True
             else:
@@ -354,6 +358,9 @@ class RollerInfoPanel:
                 # Refresh table
                 if hasattr(self.app, 'data_tab') and self.app.data_tab and self.app.data_tab.roller_data_table:
                     self.app.data_tab.roller_data_table.load_roller_data()
+                # Drop cached roller info now: the Inference tab is rebuilt
+                # (and reads the roller list) before its monitor sees the flag
+                invalidate_roller_cache()
                 # Set flag to refresh inference page roller list
                 self.app.roller_data_updated = True
             else:
@@ -397,6 +404,9 @@ class RollerInfoPanel:
                 # Refresh table
                 if hasattr(self.app, 'data_tab') and self.app.data_tab and self.app.data_tab.roller_data_table:
                     self.app.data_tab.roller_data_table.load_roller_data()
+                # Drop cached roller info now: the Inference tab is rebuilt
+                # (and reads the roller list) before its monitor sees the flag
+                invalidate_roller_cache()
                 # Set flag to refresh inference page roller list
                 self.app.roller_data_updated = True
             else:
@@ -4,8 +4,6 @@ Component-wise bar chart (BF and OD breakdown)
 """
 
 import tkinter as tk
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from ..utils.styles import Colors, Fonts
 
 
@@ -40,6 +38,10 @@ class DefectwiseChart:
         )
         container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
         
+        # Import matplotlib only when a chart is first created
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
         # Create matplotlib figure with increased height
         self.figure = Figure(figsize=(7, 6), dpi=100, facecolor='white')
         self.ax = self.figure.add_subplot(111)
@@ -4,6 +4,10 @@ Date & Time-Based Report Sheet with charts and export functionality
 """
 
 import tkinter as tk
+from itertools import chain
+from operator import itemgetter
+
+import numpy as np
 
 from frontend.utils.config import AppConfig
 from ..utils.styles import Colors, Fonts
@@ -14,6 +18,28 @@ from .control_panel import ControlPanel
 from .action_panel import ActionPanel
 from .status_chart import StatusChart
 from .defectwise_chart import DefectwiseChart
+from .report_stats import acceptance_rates
+
+
+# Chart columns per report type: (status chart columns, defectwise chart columns)
+_BF_STATUS = ('BF Inspected', 'BF Accepted', 'BF Rejected')
+_OD_STATUS = ('OD Inspected', 'OD Accepted', 'OD Rejected')
+_OVERALL_STATUS = ('Overall Inspected', 'Overall Accepted', 'Overall Rejected')
+_BF_DEFECT = ('Rust', 'Damage', 'Dent', 'High Head', 'Down Head', 'Others')
+_OD_DEFECT = ('Rust', 'Damage', 'Dent', 'Damage on End', 'Spherical Mark', 'Others')
+_CHART_COLUMNS = {
+    'BF': (_BF_STATUS, _BF_DEFECT),
+    'OD': (_OD_STATUS, _OD_DEFECT),
+    'Overall': (_OVERALL_STATUS, _BF_STATUS + _OD_STATUS),
+}
+# Single getter per report type pulling every chart column out of a row
+_CHART_ROW_GETTERS = {
+    report_type: itemgetter(*(status + defect))
+    for report_type, (status, defect) in _CHART_COLUMNS.items()
+}
+
+# Rows fetched per round trip when streaming report results
+REPORT_FETCH_SIZE = 5000
 
 
 class DiagnosisTab:
@@ -543,12 +569,12 @@ class DiagnosisTab:
                     """
                     cursor.execute(query, (from_date, to_date))
                 
-                for row in cursor.fetchall():
+                rows, rates = self._fetch_rows_with_rates(cursor)
+                
+                for row, acc_rate in zip(rows, rates):
                     comp_type, emp_id, rep_date, start, end, inspected, accepted, rejected, \
                     rust, dent, damage, high_head, low_head, others = row
                     
-                    acc_rate = (accepted / inspected * 100) if inspected > 0 else 0
-                    
                     all_data.append({
                         'Component Type': comp_type,
                         'Employee ID': emp_id,
@@ -595,12 +621,12 @@ class DiagnosisTab:
                     """
                     cursor.execute(query, (from_date, to_date))
                 
-                for row in cursor.fetchall():
+                rows, rates = self._fetch_rows_with_rates(cursor)
+                
+                for row, acc_rate in zip(rows, rates):
                     comp_type, emp_id, rep_date, start, end, inspected, accepted, rejected, \
                     rust, dent, damage, damage_on_end, spherical, others = row
                     
-                    acc_rate = (accepted / inspected * 100) if inspected > 0 else 0
-                    
                     all_data.append({
                         'Component Type': comp_type,
                         'Employee ID': emp_id,
@@ -620,112 +646,74 @@ class DiagnosisTab:
                     })
             
             else:  # Overall
-                # Query both tables and combine
-                if use_component_filter:
-                    bf_query = """
-                        SELECT 
+                # Merge BF and OD sessions and derive the overall figures in SQL
+                # (Overall Inspected = BF inspected, Overall Accepted = OD accepted)
+                component_clause = "roller_type = %s AND " if use_component_filter else ""
+                source_columns = """
                             roller_type, employee_id, report_date, start_time, end_time,
                             total_inspected, total_accepted, total_rejected
-                        FROM bf_roller_tracking
-                        WHERE roller_type = %s AND report_date BETWEEN %s AND %s
-                        ORDER BY report_date DESC, start_time DESC
-                    """
-                    cursor.execute(bf_query, (component_type, from_date, to_date))
-                else:
-                    # Get all roller types
-                    bf_query = """
-                        SELECT 
-                            roller_type, employee_id, report_date, start_time, end_time,
-                            total_inspected, total_accepted, total_rejected
-                        FROM bf_roller_tracking
-                        WHERE report_date BETWEEN %s AND %s
-                        ORDER BY report_date DESC, start_time DESC
-                    """
-                    cursor.execute(bf_query, (from_date, to_date))
-                bf_rows = cursor.fetchall()
-                
+                """
+                query = f"""
+                    SELECT
+                        roller_type, employee_id, report_date, start_time, end_time,
+                        bf_inspected, bf_accepted, bf_rejected,
+                        od_inspected, od_accepted, od_rejected,
+                        bf_inspected AS overall_inspected,
+                        od_accepted AS overall_accepted,
+                        bf_rejected + od_rejected AS overall_rejected,
+                        ROUND(100.0 * od_accepted / NULLIF(bf_inspected, 0), 2) AS acceptance_rate
+                    FROM (
+                        SELECT
+                            MAX(roller_type) AS roller_type, employee_id, report_date, start_time,
+                            MAX(end_time) AS end_time,
+                            SUM(CASE WHEN src = 'BF' THEN total_inspected ELSE 0 END) AS bf_inspected,
+                            SUM(CASE WHEN src = 'BF' THEN total_accepted ELSE 0 END) AS bf_accepted,
+                            SUM(CASE WHEN src = 'BF' THEN total_rejected ELSE 0 END) AS bf_rejected,
+                            SUM(CASE WHEN src = 'OD' THEN total_inspected ELSE 0 END) AS od_inspected,
+                            SUM(CASE WHEN src = 'OD' THEN total_accepted ELSE 0 END) AS od_accepted,
+                            SUM(CASE WHEN src = 'OD' THEN total_rejected ELSE 0 END) AS od_rejected
+                        FROM (
+                            SELECT 'BF' AS src, {source_columns}
+                            FROM bf_roller_tracking
+                            WHERE {component_clause}report_date BETWEEN %s AND %s
+                            UNION ALL
+                            SELECT 'OD' AS src, {source_columns}
+                            FROM od_roller_tracking
+                            WHERE {component_clause}report_date BETWEEN %s AND %s
+                        ) AS sessions
+                        GROUP BY employee_id, report_date, start_time
+                    ) AS merged
+                    ORDER BY report_date DESC, start_time DESC
+                """
+                params = (from_date, to_date)
                 if use_component_filter:
-                    od_query = """
-                        SELECT 
-                            roller_type, employee_id, report_date, start_time, end_time,
-                            total_inspected, total_accepted, total_rejected
-                        FROM od_roller_tracking
-                        WHERE roller_type = %s AND report_date BETWEEN %s AND %s
-                        ORDER BY report_date DESC, start_time DESC
-                    """
-                    cursor.execute(od_query, (component_type, from_date, to_date))
-                else:
-                    # Get all roller types
-                    od_query = """
-                        SELECT 
-                            roller_type, employee_id, report_date, start_time, end_time,
-                            total_inspected, total_accepted, total_rejected
-                        FROM od_roller_tracking
-                        WHERE report_date BETWEEN %s AND %s
-                        ORDER BY report_date DESC, start_time DESC
-                    """
-                    cursor.execute(od_query, (from_date, to_date))
-                od_rows = cursor.fetchall()
+                    params = (component_type,) + params
+                cursor.execute(query, params * 2)
                 
-                # Create a dictionary to group by date and employee
-                combined_data = {}
-                
-                for row in bf_rows:
-                    comp_type, emp_id, rep_date, start, end, inspected, accepted, rejected = row
-                    key = (emp_id, rep_date, start)
+                for row in chain.from_iterable(self._fetch_batches(cursor)):
+                    comp_type, emp_id, rep_date, start, end, \
+                    bf_inspected, bf_accepted, bf_rejected, \
+                    od_inspected, od_accepted, od_rejected, \
+                    overall_inspected, overall_accepted, overall_rejected, acc_rate = row
                     
-                    if key not in combined_data:
-                        combined_data[key] = {
-                            'Component Type': comp_type,
-                            'Employee ID': emp_id,
-                            'Report Date': rep_date.strftime('%Y-%m-%d'),
-                            'Start Time': str(start),
-                            'End Time': str(end),
-                            'BF Inspected': inspected,
-                            'BF Accepted': accepted,
-                            'BF Rejected': rejected,
-                            'OD Inspected': 0,
-                            'OD Accepted': 0,
-                            'OD Rejected': 0
-                        }
-                    else:
-                        combined_data[key]['BF Inspected'] = inspected
-                        combined_data[key]['BF Accepted'] = accepted
-                        combined_data[key]['BF Rejected'] = rejected
-                
-                for row in od_rows:
-                    comp_type, emp_id, rep_date, start, end, inspected, accepted, rejected = row
-                    key = (emp_id, rep_date, start)
-                    
-                    if key not in combined_data:
-                        combined_data[key] = {
-                            'Component Type': comp_type,
-                            'Employee ID': emp_id,
-                            'Report Date': rep_date.strftime('%Y-%m-%d'),
-                            'Start Time': str(start),
-                            'End Time': str(end),
-                            'BF Inspected': 0,
-                            'BF Accepted': 0,
-                            'BF Rejected': 0,
-                            'OD Inspected': inspected,
-                            'OD Accepted': accepted,
-                            'OD Rejected': rejected
-                        }
-                    else:
-                        combined_data[key]['OD Inspected'] = inspected
-                        combined_data[key]['OD Accepted'] = accepted
-                        combined_data[key]['OD Rejected'] = rejected
-                
-                # Calculate overall values
-                for key, data in combined_data.items():
-                    data['Overall Inspected'] = data['BF Inspected']
-                    data['Overall Accepted'] = data['OD Accepted']
-                    data['Overall Rejected'] = data['BF Rejected'] + data['OD Rejected']
-                    
-                    acc_rate = (data['Overall Accepted'] / data['Overall Inspected'] * 100) if data['Overall Inspected'] > 0 else 0
-                    data['Acceptance Rate'] = f"{acc_rate:.2f}%"
-                    
-                    all_data.append(data)
+                    # SUM() comes back as Decimal; keep counts as plain ints
+                    all_data.append({
+                        'Component Type': comp_type,
+                        'Employee ID': emp_id,
+                        'Report Date': rep_date.strftime('%Y-%m-%d'),
+                        'Start Time': str(start),
+                        'End Time': str(end),
+                        'BF Inspected': int(bf_inspected),
+                        'BF Accepted': int(bf_accepted),
+                        'BF Rejected': int(bf_rejected),
+                        'OD Inspected': int(od_inspected),
+                        'OD Accepted': int(od_accepted),
+                        'OD Rejected': int(od_rejected),
+                        'Overall Inspected': int(overall_inspected),
+                        'Overall Accepted': int(overall_accepted),
+                        'Overall Rejected': int(overall_rejected),
+                        'Acceptance Rate': f"{float(acc_rate or 0):.2f}%"
+                    })
             
             cursor.close()
             connection.close()
@@ -745,6 +733,41 @@ class DiagnosisTab:
             traceback.print_exc()
             DatabaseErrorHandler.handle_db_error(e, self.parent, "fetching report data")
     
+    @staticmethod
+    def _fetch_batches(cursor):
+        """Yield result rows from the cursor in chunks of REPORT_FETCH_SIZE."""
+        while True:
+            batch = cursor.fetchmany(REPORT_FETCH_SIZE)
+            if not batch:
+                return
+            yield batch
+    
+    def _fetch_rows_with_rates(self, cursor):
+        """
+        Stream BF/OD result rows and compute their acceptance rates.
+        
+        Inspected/accepted counts (columns 5 and 6) are collected chunk by
+        chunk into NumPy arrays while the rows are fetched.
+        
+        Returns:
+            Tuple of (rows, acceptance rate array)
+        """
+        rows = []
+        inspected_chunks = []
+        accepted_chunks = []
+        for batch in self._fetch_batches(cursor):
+            rows.extend(batch)
+            columns = list(zip(*batch))
+            inspected_chunks.append(np.asarray(columns[5], dtype=np.float64))
+            accepted_chunks.append(np.asarray(columns[6], dtype=np.float64))
+        
+        if not rows:
+            return rows, np.zeros(0, dtype=np.float64)
+        
+        inspected = np.concatenate(inspected_chunks)
+        accepted = np.concatenate(accepted_chunks)
+        return rows, acceptance_rates(inspected, accepted)
+    
     def _update_charts(self, data, report_type):
         """Update both charts with the report data based on report type."""
         # LAZY LOADING: Create charts only when needed
@@ -761,71 +784,24 @@ class DiagnosisTab:
             self.defectwise_chart.create()
         
         # Always update charts, even if data is empty
-        if report_type == 'BF':
-            # Calculate BF statistics for status chart
-            total_inspected = sum(row.get('BF Inspected', 0) for row in data) if data else 0
-            total_accepted = sum(row.get('BF Accepted', 0) for row in data) if data else 0
-            total_rejected = sum(row.get('BF Rejected', 0) for row in data) if data else 0
-            
-            status_data = {
-                'BF Inspected': total_inspected,
-                'BF Accepted': total_accepted,
-                'BF Rejected': total_rejected
-            }
-            
-            # Calculate defect statistics
-            defect_data = {
-                'Rust': sum(row.get('Rust', 0) for row in data) if data else 0,
-                'Damage': sum(row.get('Damage', 0) for row in data) if data else 0,
-                'Dent': sum(row.get('Dent', 0) for row in data) if data else 0,
-                'High Head': sum(row.get('High Head', 0) for row in data) if data else 0,
-                'Down Head': sum(row.get('Down Head', 0) for row in data) if data else 0,
-                'Others': sum(row.get('Others', 0) for row in data) if data else 0
-            }
-            
-        elif report_type == 'OD':
-            # Calculate OD statistics for status chart
-            total_inspected = sum(row.get('OD Inspected', 0) for row in data) if data else 0
-            total_accepted = sum(row.get('OD Accepted', 0) for row in data) if data else 0
-            total_rejected = sum(row.get('OD Rejected', 0) for row in data) if data else 0
-            
-            status_data = {
-                'OD Inspected': total_inspected,
-                'OD Accepted': total_accepted,
-                'OD Rejected': total_rejected
-            }
-            
-            # Calculate defect statistics
-            defect_data = {
-                'Rust': sum(row.get('Rust', 0) for row in data) if data else 0,
-                'Damage': sum(row.get('Damage', 0) for row in data) if data else 0,
-                'Dent': sum(row.get('Dent', 0) for row in data) if data else 0,
-                'Damage on End': sum(row.get('Damage on End', 0) for row in data) if data else 0,
-                'Spherical Mark': sum(row.get('Spherical Mark', 0) for row in data) if data else 0,
-                'Others': sum(row.get('Others', 0) for row in data) if data else 0
-            }
-            
-        else:  # Overall
-            # Calculate overall statistics for status chart
-            total_inspected = sum(row.get('Overall Inspected', 0) for row in data) if data else 0
-            total_accepted = sum(row.get('Overall Accepted', 0) for row in data) if data else 0
-            total_rejected = sum(row.get('Overall Rejected', 0) for row in data) if data else 0
-            
-            status_data = {
-                'Overall Inspected': total_inspected,
-                'Overall Accepted': total_accepted,
-                'Overall Rejected': total_rejected
-            }
-            
-            # Calculate component-wise statistics for defectwise chart
-            defect_data = {
-                'BF Inspected': sum(row.get('BF Inspected', 0) for row in data) if data else 0,
-                'BF Accepted': sum(row.get('BF Accepted', 0) for row in data) if data else 0,
-                'BF Rejected': sum(row.get('BF Rejected', 0) for row in data) if data else 0,
-                'OD Inspected': sum(row.get('OD Inspected', 0) for row in data) if data else 0,
-                'OD Accepted': sum(row.get('OD Accepted', 0) for row in data) if data else 0,
-                'OD Rejected': sum(row.get('OD Rejected', 0) for row in data) if data else 0
-            }
+        if report_type not in _CHART_COLUMNS:
+            report_type = 'Overall'
+        status_columns, defect_columns = _CHART_COLUMNS[report_type]
+        
+        # One NumPy reduction over all chart columns instead of a sum() per column
+        column_count = len(status_columns) + len(defect_columns)
+        if data:
+            row_values = _CHART_ROW_GETTERS[report_type]
+            totals = np.fromiter(
+                (row_values(row) for row in data),
+                dtype=(np.int64, column_count),
+                count=len(data)
+            ).sum(axis=0).tolist()
+        else:
+            totals = [0] * column_count
+        
+        status_data = dict(zip(status_columns, totals))
+        defect_data = dict(zip(defect_columns, totals[len(status_columns):]))
         
         # Update charts
         if self.status_chart:
@@ -5,12 +5,20 @@ Displays inspection data in a scrollable table
 
 import tkinter as tk
 import tkinter.ttk as ttk
+from functools import lru_cache
+from types import MappingProxyType
 from ..utils.styles import Colors, Fonts
 
 
 class ReportDataTable:
     """Table displaying report data."""
     
+    # Columns that are never summed into the totals row
+    TEXT_COLUMNS = frozenset({
+        "S.No", "Component Type", "Employee ID", "Report Date",
+        "Start Time", "End Time", "Acceptance Rate"
+    })
+    
     def __init__(self, parent, tab_instance):
         """
         Initialize the report data table.
@@ -24,6 +32,7 @@ class ReportDataTable:
         self.tree = None
         self.container = None
         self.current_columns = []
+        self._current_report_type = None
         
     def create(self):
         """Create the report data table UI."""
@@ -52,8 +61,15 @@ class ReportDataTable:
         # Initialize with default columns (Overall)
         self._create_tree_for_report_type("Overall")
     
-    def _create_tree_for_report_type(self, report_type):
-        """Create treeview with columns based on report type."""
+    @staticmethod
+    @lru_cache(maxsize=4)
+    def _columns_for(report_type):
+        """
+        Get column names and widths for a report type.
+        
+        Returns:
+            Tuple of (columns, read-only column width mapping)
+        """
         # Define columns based on report type
         if report_type == "BF":
             columns = (
@@ -96,7 +112,14 @@ class ReportDataTable:
                 "OD Inspected": 100, "OD Accepted": 100, "OD Rejected": 100
             }
         
+        return columns, MappingProxyType(column_widths)
+    
+    def _create_tree_for_report_type(self, report_type):
+        """Create treeview with columns based on report type."""
+        columns, column_widths = self._columns_for(report_type)
+        
         self.current_columns = columns
+        self._current_report_type = report_type
         
         # Destroy existing tree if it exists
         if self.tree:
@@ -159,37 +182,38 @@ class ReportDataTable:
             data: List of dictionaries with report data
             report_type: Type of report (BF, OD, Overall)
         """
-        # Recreate tree with appropriate columns
-        self._create_tree_for_report_type(report_type)
+        # Recreate tree only when the columns change
+        if report_type != self._current_report_type:
+            self._create_tree_for_report_type(report_type)
         
-        # Clear existing data
-        for item in self.tree.get_children():
-            self.tree.delete(item)
+        # Clear existing data in one call
+        children = self.tree.get_children()
+        if children:
+            self.tree.delete(*children)
         
-        # Insert new data
+        # Sum numeric columns column-wise instead of cell by cell
+        columns = self.current_columns
         totals = {}
-        for col in self.current_columns:
-            totals[col] = 0
+        if data:
+            import pandas as pd
+            numeric_columns = [col for col in columns if col not in self.TEXT_COLUMNS]
+            frame = pd.DataFrame(data).reindex(columns=numeric_columns, fill_value=0)
+            totals = (
+                frame.apply(pd.to_numeric, errors='coerce')
+                .fillna(0)
+                .sum()
+                .astype(int)
+                .to_dict()
+            )
         
-        for idx, row in enumerate(data, start=1):
-            values = []
-            for col in self.current_columns:
-                if col == "S.No":
-                    val = idx
-                else:
-                    val = row.get(col, 0)
-                values.append(val)
-                
-                # Sum numeric columns
-                if col not in ["S.No", "Component Type", "Employee ID", "Report Date", "Start Time", "End Time", "Acceptance Rate"]:
-                    try:
-                        if isinstance(val, str) and '%' in val:
-                            continue
-                        totals[col] += int(val) if val else 0
-                    except:
-                        pass
-            
-            self.tree.insert("", tk.END, values=values)
+        # Insert new data
+        rows = [
+            tuple(idx if col == "S.No" else row.get(col, 0) for col in columns)
+            for idx, row in enumerate(data, start=1)
+        ]
+        insert = self.tree.insert
+        for values in rows:
+            insert("", tk.END, values=values)
         
         # Add totals row
         if data:
@@ -0,0 +1,22 @@
+"""
+Report Statistics
+Acceptance-rate computation for report result sets
+"""
+
+import numpy as np
+
+
+def acceptance_rates(inspected, accepted):
+    """
+    Compute per-row acceptance rates.
+
+    Args:
+        inspected: 1-D float64 array of inspected counts
+        accepted: 1-D float64 array of accepted counts
+
+    Returns:
+        1-D float64 array of acceptance rates in percent
+    """
+    rates = np.zeros(inspected.shape[0], dtype=np.float64)
+    np.divide(accepted * 100.0, inspected, out=rates, where=inspected > 0)
+    return rates
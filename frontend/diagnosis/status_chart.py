@@ -3,11 +3,44 @@ Status Chart Component
 Overall status bar chart (Inspected, Accepted, Rejected)
 """
 
+import math
 import tkinter as tk
-from matplotlib.figure import Figure
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
 from ..utils.styles import Colors, Fonts
 
+# Chart title and bar categories of each report type
+_REPORT_CHARTS = {
+    'BF': ("BF Status Chart", ('BF Inspected', 'BF Accepted', 'BF Rejected')),
+    'OD': ("OD Status Chart", ('OD Inspected', 'OD Accepted', 'OD Rejected')),
+    'Overall': ("Overall Status Chart",
+                ('Overall Inspected', 'Overall Accepted', 'Overall Rejected')),
+}
+
+# Bar colors of the Inspected, Accepted and Rejected categories
+_BAR_COLORS = ('#4472C4', '#70AD47', '#FF0000')
+
+# Room above the tallest bar for its value label
+_Y_HEADROOM = 1.15
+
+# The y scale only shrinks once the data needs less than this share of it
+_Y_SHRINK_FRACTION = 0.25
+
+
+def _nice_ceiling(value):
+    """
+    Round a positive value up to the next 1, 2 or 5 x 10^k.
+    
+    Args:
+        value: Value to round up (> 0)
+    
+    Returns:
+        float: Smallest 1/2/5 x 10^k that is >= value
+    """
+    scale = 10 ** math.floor(math.log10(value))
+    for step in (1, 2, 5):
+        if step * scale >= value:
+            return step * scale
+    return 10 * scale
+
 
 class StatusChart:
     """Status chart displaying overall inspection statistics."""
@@ -25,7 +58,12 @@ class StatusChart:
         self.canvas = None
         self.figure = None
         self.ax = None
-        
+        self._bar_sets = {}  # Report type -> (bars, value labels)
+        self._report_type = None  # Report type whose bar set is shown
+        self._category_labels = []
+        self._y_top = None
+        self._background = None
+    
     def create(self):
         """Create the status chart UI."""
         # Container frame
@@ -40,6 +78,10 @@ class StatusChart:
         )
         container.pack(side=tk.LEFT, fill=tk.BOTH, expand=True, padx=(0, 5))
         
+        # Import matplotlib only when a chart is first created
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+        
         # Create matplotlib figure with increased height
         self.figure = Figure(figsize=(7, 6), dpi=100, facecolor='white')
         self.ax = self.figure.add_subplot(111)
@@ -48,42 +90,99 @@ class StatusChart:
         self.canvas = FigureCanvasTkAgg(self.figure, container)
         self.canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # Re-capture the blit background after every full draw (including resizes)
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+        
+        self._setup_axes()
+        
         # Initialize with empty chart
         self._draw_empty_chart()
     
-    def _draw_empty_chart(self):
-        """Draw empty chart with placeholder."""
-        self.ax.clear()
-        self.ax.set_title("Overall Status Chart", fontsize=14, fontweight='bold')
-        self.ax.set_ylabel("Count", fontsize=12)
-        
-        # Empty bars
-        categories = ['Overall Inspected', 'Overall Accepted', 'Overall Rejected']
-        values = [0, 0, 0]
+    def _setup_axes(self):
+        """Build the static axes chrome shared by every report type."""
+        title, categories = _REPORT_CHARTS['Overall']
         
-        bars = self.ax.bar(categories, values, color=['#4472C4', '#70AD47', '#FF0000'], width=0.6)
-        
-        # Add value labels on bars
-        for i, (bar, val) in enumerate(zip(bars, values)):
-            height = bar.get_height()
-            self.ax.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{int(val)}',
-                        ha='center', va='bottom', fontsize=10, fontweight='bold')
-        
-        # Rotate x-axis labels for better readability (fix matplotlib warning)
+        self.ax.set_ylabel("Count", fontsize=12)
+        self.ax.set_xlim(-0.5, len(categories) - 0.5)
         self.ax.set_xticks(range(len(categories)))
-        self.ax.set_xticklabels(categories, rotation=15, ha='right')
-        
-        # Set y-axis to start from 0 with minimum scale
-        self.ax.set_ylim(bottom=0, top=1)
+        self.ax.set_xticklabels([])
         
         # Add grid
         self.ax.grid(axis='y', alpha=0.3, linestyle='--')
         
-        # Adjust layout
+        # Title and category names change with the report type, so they are
+        # animated and blitted with the bars instead of baked into the background
+        self.ax.set_title(title, fontsize=14, fontweight='bold').set_animated(True)
+        self._category_labels = [
+            self.ax.text(i, -0.02, category, transform=self.ax.get_xaxis_transform(),
+                         rotation=15, ha='right', va='top', animated=True)
+            for i, category in enumerate(categories)
+        ]
+        
+        # Adjust layout (the Overall texts are the longest)
         self.figure.tight_layout()
+    
+    def _draw_empty_chart(self):
+        """Draw empty chart with placeholder."""
+        self.update_chart({}, 'Overall')
+    
+    def _on_draw(self, event):
+        """Save the static background and paint the animated artists on top of it."""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_animated()
+    
+    def _draw_animated(self):
+        """Draw the title, category labels and the shown bars and value labels."""
+        self.ax.draw_artist(self.ax.title)
+        for label in self._category_labels:
+            self.ax.draw_artist(label)
+        if self._report_type is not None:
+            bars, labels = self._bar_sets[self._report_type]
+            for bar, label in zip(bars, labels):
+                self.ax.draw_artist(bar)
+                self.ax.draw_artist(label)
+    
+    def _get_bar_set(self, report_type):
+        """
+        Get the bars and value labels of a report type, creating them once.
         
-        self.canvas.draw()
+        Args:
+            report_type: 'BF', 'OD', or 'Overall'
+        
+        Returns:
+            tuple: (bars, value labels)
+        """
+        bar_set = self._bar_sets.get(report_type)
+        if bar_set is None:
+            # Bars and labels are animated so they can be blitted over the cached background
+            bars = list(self.ax.bar(
+                range(len(_BAR_COLORS)), [0] * len(_BAR_COLORS),
+                color=_BAR_COLORS, width=0.6, animated=True
+            ))
+            labels = [
+                self.ax.text(bar.get_x() + bar.get_width()/2., 0, '0',
+                            ha='center', va='bottom', fontsize=10, fontweight='bold', animated=True)
+                for bar in bars
+            ]
+            bar_set = self._bar_sets[report_type] = (bars, labels)
+        return bar_set
+    
+    def _show_report_type(self, report_type):
+        """Switch the shown bar set, title and category labels to a report type."""
+        # Only the shown set stays visible, so savefig exports just that one
+        if self._report_type is not None:
+            for artists in self._bar_sets[self._report_type]:
+                for artist in artists:
+                    artist.set_visible(False)
+        for artists in self._get_bar_set(report_type):
+            for artist in artists:
+                artist.set_visible(True)
+        self._report_type = report_type
+        
+        title, categories = _REPORT_CHARTS[report_type]
+        self.ax.title.set_text(title)
+        for label, category in zip(self._category_labels, categories):
+            label.set_text(category)
     
     def update_chart(self, data, report_type='Overall'):
         """
@@ -93,61 +192,36 @@ class StatusChart:
             data: Dictionary with status counts based on report type
             report_type: 'BF', 'OD', or 'Overall'
         """
-        self.ax.clear()
-        
-        # Set title and categories based on report type
-        if report_type == 'BF':
-            self.ax.set_title("BF Status Chart", fontsize=14, fontweight='bold')
-            categories = ['BF Inspected', 'BF Accepted', 'BF Rejected']
-            values = [
-                data.get('BF Inspected', 0),
-                data.get('BF Accepted', 0),
-                data.get('BF Rejected', 0)
-            ]
-        elif report_type == 'OD':
-            self.ax.set_title("OD Status Chart", fontsize=14, fontweight='bold')
-            categories = ['OD Inspected', 'OD Accepted', 'OD Rejected']
-            values = [
-                data.get('OD Inspected', 0),
-                data.get('OD Accepted', 0),
-                data.get('OD Rejected', 0)
-            ]
-        else:  # Overall
-            self.ax.set_title("Overall Status Chart", fontsize=14, fontweight='bold')
-            categories = ['Overall Inspected', 'Overall Accepted', 'Overall Rejected']
-            values = [
-                data.get('Overall Inspected', 0),
-                data.get('Overall Accepted', 0),
-                data.get('Overall Rejected', 0)
-            ]
-        
-        # Set ylabel
-        self.ax.set_ylabel("Count", fontsize=12)
-        
-        # Create bars with specific colors
-        bars = self.ax.bar(categories, values, color=['#4472C4', '#70AD47', '#FF0000'], width=0.6)
-        
-        # Add value labels on bars
-        for i, (bar, val) in enumerate(zip(bars, values)):
-            height = bar.get_height()
-            self.ax.text(bar.get_x() + bar.get_width()/2., height,
-                        f'{int(val)}',
-                        ha='center', va='bottom', fontsize=10, fontweight='bold')
-        
-        # Rotate x-axis labels (fix matplotlib warning by setting ticks first)
-        self.ax.set_xticks(range(len(categories)))
-        self.ax.set_xticklabels(categories, rotation=15, ha='right')
-        
-        # Set y-axis limits (handle case when all values are 0)
-        max_val = max(values) if values else 1
-        if max_val == 0:
-            max_val = 1  # Set minimum scale to avoid singular transformation
-        self.ax.set_ylim(bottom=0, top=max_val * 1.15)
-        
-        # Add grid
-        self.ax.grid(axis='y', alpha=0.3, linestyle='--')
-        
-        # Adjust layout
-        self.figure.tight_layout()
-        
-        self.canvas.draw()
+        if report_type not in _REPORT_CHARTS:
+            report_type = 'Overall'
+        _, categories = _REPORT_CHARTS[report_type]
+        values = [data.get(category, 0) for category in categories]
+        
+        # Round the y scale up to a stable step and keep it while the data fits,
+        # so most updates (and report type flips) can be blitted
+        needed = max(max(values), 1) * _Y_HEADROOM
+        y_top = self._y_top
+        if y_top is None or needed > y_top or needed < y_top * _Y_SHRINK_FRACTION:
+            y_top = _nice_ceiling(needed)
+        
+        if report_type != self._report_type:
+            self._show_report_type(report_type)
+        
+        bars, labels = self._bar_sets[report_type]
+        for bar, label, val in zip(bars, labels, values):
+            bar.set_height(val)
+            label.set_y(val)
+            label.set_text(f'{int(val)}')
+        
+        # The y scale is part of the cached background: full redraw, after which
+        # _on_draw re-captures the background and paints the animated artists
+        if self._background is None or y_top != self._y_top:
+            self._y_top = y_top
+            self.ax.set_ylim(bottom=0, top=y_top)
+            self.canvas.draw()
+            return
+        
+        # Same background: blit the bars, title and category labels over it
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.figure.bbox)
@@ -11,6 +11,7 @@ from .results_panel import ResultsPanel
 from .roller_info_panel import RollerInfoPanel
 from .threshold_panel import ThresholdPanel
 from .state_manager import InspectionStateManager
+from .reset_dialog import ResetDialog
 
 __all__ = [
     'InferenceTab',
@@ -21,5 +22,6 @@ __all__ = [
     'ResultsPanel',
     'RollerInfoPanel',
     'ThresholdPanel',
-    'InspectionStateManager'
+    'InspectionStateManager',
+    'ResetDialog'
 ]
@@ -4,13 +4,29 @@ Displays live camera feeds with annotations
 """
 
 import tkinter as tk
-import cv2
-import PIL.Image
-import PIL.ImageTk
 import numpy as np
 import time
+from functools import lru_cache
 from ..utils.styles import Colors, Fonts
 from ..utils.config import AppConfig
+from ..utils.debug_logger import log_warning
+
+# Minimum spacing between logged render errors for one feed
+ERROR_LOG_INTERVAL_S = 1.0
+
+
+@lru_cache(maxsize=None)
+def _imaging():
+    """
+    Import the imaging libraries on first use instead of at module load.
+    
+    Returns:
+        tuple: (cv2, PIL.Image, PIL.ImageTk) modules
+    """
+    import cv2
+    import PIL.Image
+    import PIL.ImageTk
+    return cv2, PIL.Image, PIL.ImageTk
 
 
 class CameraFeed:
@@ -32,6 +48,9 @@ class CameraFeed:
         self._last_update_time = 0
         self._frame_skip_counter = 0
         self._image_id = None  # Track canvas image ID for efficient updates
+        self._photo = None  # Persistent PhotoImage, pasted into on every frame
+        self._last_error_time = 0.0  # Rate-limits render error logging
+        self._resize_buf = np.empty((AppConfig.CAMERA_HEIGHT, AppConfig.CAMERA_WIDTH, 3), dtype=np.uint8)
         
     def create(self, row, column):
         """
@@ -71,37 +90,67 @@ class CameraFeed:
         
         Args:
             frame: OpenCV frame (BGR format)
+            
+        Returns:
+            bool: True if the frame was drawn, False if it was skipped
         """
         if self.canvas is None:
-            return
+            return False
         
         try:
             # Check if canvas still exists (not destroyed)
             if not self.canvas.winfo_exists():
-                return
+                return False
             
-            # Resize frame to fit canvas
-            resized_frame = cv2.resize(frame, (AppConfig.CAMERA_WIDTH, AppConfig.CAMERA_HEIGHT))
+            # Throttle redraws to the UI target rate; dropped frames skip the whole pipeline
+            current_time = time.monotonic()
+            if current_time - self._last_update_time < 1.0 / AppConfig.UI_TARGET_FPS:
+                self._frame_skip_counter += 1
+                return False
+            self._last_update_time = current_time
+            cv2, Image, ImageTk = _imaging()
             
-            # Convert from BGR to RGB
-            img = PIL.Image.fromarray(cv2.cvtColor(resized_frame, cv2.COLOR_BGR2RGB))
-            imgtk = PIL.ImageTk.PhotoImage(image=img)
+            # Downsample to the canvas size before conversion (skipped when it already
+            # matches); area averaging avoids aliasing
+            if frame.shape[:2] == (AppConfig.CAMERA_HEIGHT, AppConfig.CAMERA_WIDTH):
+                resized_frame = frame
+            else:
+                resized_frame = cv2.resize(
+                    frame,
+                    (AppConfig.CAMERA_WIDTH, AppConfig.CAMERA_HEIGHT),
+                    dst=self._resize_buf,
+                    interpolation=cv2.INTER_AREA
+                )
             
-            # Memory leak fix: Create new image first, then delete old one (prevents flicker)
-            old_image_id = self._image_id
-            self._image_id = self.canvas.create_image(0, 0, anchor=tk.NW, image=imgtk)
-            self.canvas.image = imgtk  # Keep a reference to prevent garbage collection
+            # Let PIL's raw decoder swap BGR to RGB while it reads the buffer,
+            # instead of staging an RGB copy in numpy first
+            img = Image.frombuffer(
+                "RGB", (AppConfig.CAMERA_WIDTH, AppConfig.CAMERA_HEIGHT),
+                np.ascontiguousarray(resized_frame), "raw", "BGR", 0, 1
+            )
             
-            # Delete old image after new one is displayed
-            if old_image_id is not None:
-                self.canvas.delete(old_image_id)
+            # Reuse a single PhotoImage and canvas item instead of allocating per frame
+            if self._photo is None:
+                self._photo = ImageTk.PhotoImage(
+                    "RGB", (AppConfig.CAMERA_WIDTH, AppConfig.CAMERA_HEIGHT)
+                )
+            self._photo.paste(img)
+            
+            if self._image_id is None:
+                self._image_id = self.canvas.create_image(0, 0, anchor=tk.NW, image=self._photo)
+                self.canvas.image = self._photo  # Keep a reference to prevent garbage collection
+            return True
         except tk.TclError:
             # Widget has been destroyed, stop updating
-            return
+            return False
         except Exception as e:
-            # Handle any other exceptions silently
-            print(f"Error updating camera feed: {e}")
-            return
+            # At most one warning per second per feed, so a failing camera cannot
+            # flood the log at frame rate; no stdout on the render path
+            now = time.monotonic()
+            if now - self._last_error_time >= ERROR_LOG_INTERVAL_S:
+                self._last_error_time = now
+                log_warning("inference", f"Error updating {self.canvas_id} camera feed", str(e))
+            return False
     
     def cleanup(self):
         """Clean up resources and clear canvas."""
@@ -113,7 +162,8 @@ class CameraFeed:
                 if hasattr(self.canvas, 'image'):
                     delattr(self.canvas, 'image')
             self._image_id = None
-        except:
+        except tk.TclError:
+            # Canvas already destroyed
             pass
 
 
@@ -128,7 +178,9 @@ class CameraFeedManager:
             parent: Parent frame
         """
         self.parent = parent
-        self.feeds = {}
+        self.bf = None
+        self.od = None
+        self.feeds = {}  # Same feeds keyed by id, for callers that iterate them
         self.camera_frame = None
         
     def setup(self, parent=None):
@@ -148,11 +200,13 @@ class CameraFeedManager:
         # Create BF camera feed (left)
         bf_feed = CameraFeed(self.camera_frame, "BF Feed", "bf")
         bf_feed.create(row=0, column=0)
+        self.bf = bf_feed
         self.feeds['bf'] = bf_feed
         
         # Create OD camera feed (right)
         od_feed = CameraFeed(self.camera_frame, "OD Feed", "od")
         od_feed.create(row=0, column=1)
+        self.od = od_feed
         self.feeds['od'] = od_feed
         
         return self.feeds
@@ -167,4 +221,8 @@ class CameraFeedManager:
         Returns:
             CameraFeed instance or None
         """
-        return self.feeds.get(feed_id)
+        if feed_id == 'bf':
+            return self.bf
+        if feed_id == 'od':
+            return self.od
+        return None
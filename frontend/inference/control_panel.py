@@ -3,14 +3,71 @@ Control Panel Component
 Contains start/stop/reset buttons and allow images checkbox
 """
 
+import threading
+import time
 import tkinter as tk
 from tkinter import messagebox
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime
+from functools import wraps
 from ..utils.styles import Colors, Fonts
 from ..utils.config import AppConfig
-from database import save_to_database
+from ..utils.camera_probe import count_camera_devices
 from .state_manager import InspectionStateManager
-import snap7
-import cv2
+from .reset_dialog import ResetDialog
+
+
+# Inspection counters cleared by Reset
+_RESET_ZEROS = {
+    # BF Statistics
+    "bf_inspected": 0,
+    "bf_ok_rollers": 0,
+    "bf_not_ok_rollers": 0,
+    "rust": 0,
+    "dent": 0,
+    "damage": 0,
+    "high_head": 0,
+    "down_head": 0,
+    "others": 0,
+    
+    # OD Statistics
+    "od_inspected": 0,
+    "od_ok_rollers": 0,
+    "od_not_ok_rollers": 0,
+    "od_rust": 0,
+    "od_dent": 0,
+    "od_damage": 0,
+    "od_damage_on_end": 0,
+    "od_spherical_mark": 0,
+    "od_others": 0,
+}
+
+# How often the "System Ready" waiter wakes to notice that inspection was stopped
+_READY_WAIT_SLICE_S = 1.0
+
+# How long a passed readiness check is trusted before it is probed again
+_CHECK_OK_TTL_S = 10.0
+
+
+def _cache_success(deadline_attr):
+    """
+    Skip a readiness check while its last success is younger than _CHECK_OK_TTL_S.
+    
+    Args:
+        deadline_attr: Attribute holding the time.monotonic() deadline of the cached success
+    """
+    def decorator(check):
+        @wraps(check)
+        def wrapper(self):
+            if time.monotonic() < getattr(self, deadline_attr):
+                return True, ""
+            ok, message = check(self)
+            if ok:
+                setattr(self, deadline_attr, time.monotonic() + _CHECK_OK_TTL_S)
+            return ok, message
+        return wrapper
+    return decorator
 
 
 class ControlPanel:
@@ -30,6 +87,27 @@ class ControlPanel:
         self.stop_button = None
         self.reset_button = None
         
+        # True while the background readiness checks of a Start request are running
+        self._validating = False
+        
+        # Last options applied to each control button, to skip no-op config() calls
+        self._last_states = {}
+        
+        # Cached header checkbox refs (resolved in setup)
+        self._allow_cb = None
+        self._debug_cb = None
+        
+        # Nesting depth of _batched_ui() blocks
+        self._ui_batch_depth = 0
+        
+        # "System Ready" polling state for the current inspection session
+        self._ready_session = 0
+        
+        # Readiness checks that passed recently are not probed again until these deadlines
+        self._plc_ok_until = 0.0
+        self._cameras_ok_until = 0.0
+        self._db_ok_until = 0.0
+        
         # State manager for UI state changes
         self.state_manager = InspectionStateManager(app_instance)
         
@@ -83,110 +161,179 @@ class ControlPanel:
         )
         self.reset_button.pack(side=tk.LEFT, padx=10, pady=5)
         
+        # Resolve header checkboxes once; refs are dropped when the widgets are destroyed
+        self._allow_cb = self._track_header_widget('allow_images_checkbutton', '_allow_cb')
+        self._debug_cb = self._track_header_widget('debug_checkbutton', '_debug_cb')
+        
         # Apply inspection state if inspection is running
         self._restore_inspection_state()
         
         return control_frame
     
-    def _reset_results(self):
-        """Reset all inspection results and save to database."""
-        # Show confirmation dialog first
-        confirm_reset = messagebox.askyesno(
-            "Reset Counters",
-            "Are you sure you want to reset all inspection counters?\n\n"
-            "This will clear all current statistics."
-        )
+    def _track_header_widget(self, app_attr, cache_attr):
+        """
+        Look up a header widget on the app and clear its cached ref on destroy.
         
-        if not confirm_reset:
-            return  # User cancelled - keep Reset button enabled
+        Args:
+            app_attr: Attribute name of the widget on the app instance
+            cache_attr: Attribute name on this panel that caches the widget
+            
+        Returns:
+            The widget, or None if it does not exist
+        """
+        widget = getattr(self.app, app_attr, None)
+        if widget is None or not widget.winfo_exists():
+            return None
+        widget.bind('<Destroy>', lambda e: setattr(self, cache_attr, None), add='+')
+        return widget
+    
+    def apply_button_state(self, widget, **options):
+        """
+        Configure a control button, sending only options that changed.
         
-        # User confirmed - proceed with reset and then disable the button
+        All state changes of the Start/Stop/Reset buttons must go through this
+        method (including from InspectionStateManager) to keep the cache valid.
         
-        # Check if there's data to save
-        if hasattr(self.app, 'shared_data') and self.app.shared_data:
-            bf_inspected = self.app.shared_data.get("bf_inspected", 0)
-            od_inspected = self.app.shared_data.get("od_inspected", 0)
-            
-            # Only save if there's actual data
-            if bf_inspected > 0 or od_inspected > 0:
-                # Ask for confirmation
-                response = messagebox.askyesno(
-                    "Save Data",
-                    f"Do you want to save the current inspection data to database?\n\n"
-                    f"BF Inspected: {bf_inspected}\n"
-                    f"OD Inspected: {od_inspected}\n\n"
-                    f"This will also reset all counters."
-                )
+        Args:
+            widget: Button to configure
+            **options: Tk widget options
+        """
+        last = self._last_states.setdefault(widget, {})
+        changed = {key: value for key, value in options.items() if last.get(key) != value}
+        if changed:
+            widget.config(**changed)
+            last.update(changed)
+    
+    @contextmanager
+    def _batched_ui(self):
+        """
+        Group widget updates so pending redraws are flushed once at the end.
+        
+        Re-entrant: only the outermost block calls update_idletasks().
+        """
+        self._ui_batch_depth += 1
+        try:
+            yield
+        finally:
+            self._ui_batch_depth -= 1
+            if self._ui_batch_depth == 0:
+                self.parent.update_idletasks()
+    
+    def _reset_results(self):
+        """Ask (in one dialog) whether to reset the counters and save them first."""
+        # Check if there's data to save (one snapshot serves the check and the save)
+        snapshot = {}
+        if self._shared() is not None:
+            snapshot = self._snapshot_shared_data()
+        
+        ResetDialog(
+            self.parent,
+            snapshot.get("bf_inspected", 0),
+            snapshot.get("od_inspected", 0),
+            on_confirm=lambda save: self._apply_reset(snapshot if save else None)
+        ).show()
+    
+    def _apply_reset(self, snapshot):
+        """
+        Reset all inspection results, optionally saving them to the database first.
+        
+        Args:
+            snapshot: shared_data snapshot to save, or None to reset without saving
+        """
+        if snapshot is not None:
+            try:
+                from database import save_to_database
                 
-                if response:
-                    try:
-                        # Get employee ID (use current user email or ID)
-                        employee_id = self.app.current_user if self.app.current_user is not None else "Unknown"
-                        
-                        # Get start time (or use current time if not set)
-                        start_time = self.app.inspection_start_time if hasattr(self.app, 'inspection_start_time') and self.app.inspection_start_time else None
-                        if start_time is None:
-                            from datetime import datetime
-                            start_time = datetime.now().time()
-                        
-                        # Save to database
-                        success = save_to_database(
-                            employee_id=employee_id,
-                            start_time=start_time,
-                            shared_data=dict(self.app.shared_data)
-                        )
-                        
-                        if success:
-                            messagebox.showinfo("Success", "✅ Data saved successfully to database!")
-                        else:
-                            messagebox.showerror("Error", "❌ Failed to save data to database. Check console for details.")
-                    
-                    except Exception as e:
-                        messagebox.showerror("Error", f"❌ Error saving data: {str(e)}")
-                        print(f"Error details: {e}")
-                        import traceback
-                        traceback.print_exc()
-        
-        # Reset all statistics in shared_data
-        if hasattr(self.app, 'shared_data') and self.app.shared_data:
-            # BF Statistics
-            self.app.shared_data["bf_inspected"] = 0
-            self.app.shared_data["bf_ok_rollers"] = 0
-            self.app.shared_data["bf_not_ok_rollers"] = 0
-            self.app.shared_data["rust"] = 0
-            self.app.shared_data["dent"] = 0
-            self.app.shared_data["damage"] = 0
-            self.app.shared_data["high_head"] = 0
-            self.app.shared_data["down_head"] = 0
-            self.app.shared_data["others"] = 0
+                # Get employee ID (use current user email or ID)
+                employee_id = self.app.current_user if self.app.current_user is not None else "Unknown"
+                
+                # Get start time (or use current time if not set)
+                start_time = getattr(self.app, 'inspection_start_time', None) or datetime.now().time()
+                
+                # Save to database on the background executor; the snapshot was
+                # taken before the counters are reset below
+                future = self.app._db_executor.submit(
+                    save_to_database,
+                    employee_id=employee_id,
+                    start_time=start_time,
+                    shared_data=snapshot,
+                    use_pool=True
+                )
+                self.parent.after(100, self._poll_save_result, future)
             
-            # OD Statistics
-            self.app.shared_data["od_inspected"] = 0
-            self.app.shared_data["od_ok_rollers"] = 0
-            self.app.shared_data["od_not_ok_rollers"] = 0
-            self.app.shared_data["od_rust"] = 0
-            self.app.shared_data["od_dent"] = 0
-            self.app.shared_data["od_damage"] = 0
-            self.app.shared_data["od_damage_on_end"] = 0
-            self.app.shared_data["od_spherical_mark"] = 0
-            self.app.shared_data["od_others"] = 0
-        
-        # Reset old statistics (for backward compatibility)
-        self.app.od_inspected = 0
-        self.app.od_defective = 0
-        self.app.od_good = 0
-        self.app.bf_inspected = 0
-        self.app.bf_defective = 0
-        self.app.bf_good = 0
+            except Exception as e:
+                messagebox.showerror("Error", f"❌ Error saving data: {str(e)}")
+                print(f"Error details: {e}")
+                import traceback
+                traceback.print_exc()
+        
+        # Reset all statistics in shared_data in one update; the app's old
+        # statistics attributes read from shared_data, so they reset too.
+        # Bumping the UI's stats sequence makes the results panel pick up the zeros.
+        shared_data = self._shared()
+        if shared_data is not None:
+            stats_seq = shared_data.get("ui_stats_seq", 0) + 1
+            shared_data.update({**_RESET_ZEROS, "ui_stats_seq": stats_seq})
         
         # Disable reset button after successful reset
         if self.reset_button:
-            self.reset_button.config(state=tk.DISABLED, bg="#6c757d")
+            self.apply_button_state(self.reset_button, state=tk.DISABLED, bg="#6c757d")
+    
+    def _shared(self):
+        """
+        Get the app's shared_data, if the backend has been initialized.
+        
+        Returns:
+            The shared_data dict proxy, or None
+        """
+        return getattr(self.app, 'shared_data', None)
+    
+    def _snapshot_shared_data(self):
+        """
+        Copy shared_data into a plain dict.
+        
+        shared_data is a Manager dict proxy: dict(proxy) costs one IPC call per
+        key, while _getvalue() transfers the whole dict in a single round-trip.
+        
+        Returns:
+            dict: Snapshot of shared_data
+        """
+        shared_data = self._shared()
+        if hasattr(shared_data, '_getvalue'):
+            return shared_data._getvalue()
+        return dict(shared_data)
+    
+    def _poll_save_result(self, future):
+        """
+        Wait for a background database save without blocking Tk, then report it.
+        
+        Args:
+            future: Future returned by submitting save_to_database
+        """
+        if not future.done():
+            self.parent.after(100, self._poll_save_result, future)
+            return
+        
+        try:
+            success = future.result()
+        except Exception as e:
+            messagebox.showerror("Error", f"❌ Error saving data: {str(e)}")
+            print(f"Error details: {e}")
+            import traceback
+            traceback.print_exception(type(e), e, e.__traceback__)
+            return
+        
+        if success:
+            messagebox.showinfo("Success", "✅ Data saved successfully to database!")
+        else:
+            messagebox.showerror("Error", "❌ Failed to save data to database. Check console for details.")
     
     def _restore_inspection_state(self):
         """Restore button states if inspection is running."""
         if hasattr(self.app, 'inspection_running') and self.app.inspection_running:
-            self.state_manager.restore_control_panel_state(self)
+            # Buttons are rebuilt in their idle look; flush the switch in one redraw
+            with self._batched_ui():
+                self.state_manager.restore_control_panel_state(self)
     
     def _check_models_available(self):
         """
@@ -203,6 +350,7 @@ class ControlPanel:
         
         return True, ""
     
+    @_cache_success('_plc_ok_until')
     def _check_plc_connection(self):
         """
         Check PLC connection.
@@ -211,11 +359,19 @@ class ControlPanel:
             tuple: (bool, str) - (success, error_message)
         """
         try:
-            plc = snap7.client.Client()
-            plc.connect(AppConfig.PLC_IP, AppConfig.PLC_RACK, AppConfig.PLC_SLOT)
+            import snap7
             
-            if plc.get_connected():
+            # Fresh connection per check: get_connected() on a kept-open client only
+            # reports local state, and the backend already holds its own session.
+            # Repeated clicks are covered by the success cache.
+            plc = snap7.client.Client()
+            try:
+                plc.connect(AppConfig.PLC_IP, AppConfig.PLC_RACK, AppConfig.PLC_SLOT)
+                connected = plc.get_connected()
+            finally:
                 plc.disconnect()
+            
+            if connected:
                 return True, ""
             else:
                 return False, f"⚠️ PLC Not Connected\n\nCannot connect to PLC at {AppConfig.PLC_IP}\n\nPlease check PLC connection and try again."
@@ -223,6 +379,7 @@ class ControlPanel:
         except Exception as e:
             return False, f"⚠️ PLC Connection Failed\n\nError: {str(e)}\n\nPlease check PLC connection and try again."
     
+    @_cache_success('_cameras_ok_until')
     def _check_cameras_connected(self):
         """
         Check if cameras are connected.
@@ -230,20 +387,36 @@ class ControlPanel:
         Returns:
             tuple: (bool, str) - (success, error_message)
         """
-        cameras_connected = []
+        # Cheap OS device enumeration first; opening a capture stream takes seconds
+        camera_count = count_camera_devices()
         
-        # Check camera indices 0 and 1
-        for idx in [0, 1]:
-            cap = cv2.VideoCapture(idx)
-            if cap.isOpened():
-                cameras_connected.append(idx)
-                cap.release()
+        if camera_count is None or camera_count < 2:
+            # Enumeration unavailable or inconclusive: confirm by opening the cameras
+            # (re-probed every time, so an unplugged camera is always noticed)
+            import cv2
+            
+            cameras_connected = []
+            
+            # Check camera indices 0 and 1
+            for idx in [0, 1]:
+                cap = cv2.VideoCapture(idx)
+                try:
+                    # Probe only: keep the driver from allocating a frame queue
+                    cap.set(cv2.CAP_PROP_BUFFERSIZE, 1)
+                    if cap.isOpened():
+                        cameras_connected.append(idx)
+                finally:
+                    # Always release, or the device stays locked for the next probe
+                    cap.release()
+            
+            camera_count = len(cameras_connected)
         
-        if len(cameras_connected) < 2:
-            return False, f"⚠️ Cameras Not Connected\n\nRequired: 2 cameras\nDetected: {len(cameras_connected)} camera(s)\n\nPlease connect all cameras and try again."
+        if camera_count < 2:
+            return False, f"⚠️ Cameras Not Connected\n\nRequired: 2 cameras\nDetected: {camera_count} camera(s)\n\nPlease connect all cameras and try again."
         
         return True, ""
     
+    @_cache_success('_db_ok_until')
     def _check_database_connection(self):
         """
         Check database connection.
@@ -252,19 +425,18 @@ class ControlPanel:
             tuple: (bool, str) - (success, error_message)
         """
         try:
-            import mysql.connector
-            
-            connection = mysql.connector.connect(
-                host=AppConfig.DB_HOST,
-                port=AppConfig.DB_PORT,
-                user=AppConfig.DB_USER,
-                password=AppConfig.DB_PASSWORD,
-                database=AppConfig.DB_DATABASE,
-                connection_timeout=5
-            )
+            from database import get_connection_pool
             
-            if connection.is_connected():
+            # Borrow a warm connection from the pool instead of a fresh handshake
+            connection = get_connection_pool().get_connection()
+            try:
+                connection.ping(reconnect=True, attempts=1, delay=0)
+                connected = connection.is_connected()
+            finally:
+                # Returns the connection to the pool
                 connection.close()
+            
+            if connected:
                 return True, ""
             else:
                 return False, f"⚠️ Database Not Connected\n\nCannot connect to database at {AppConfig.DB_HOST}:{AppConfig.DB_PORT}\n\nPlease check database connection and try again."
@@ -272,41 +444,65 @@ class ControlPanel:
         except Exception as e:
             return False, f"⚠️ Database Connection Failed\n\nError: {str(e)}\n\nPlease check database connection and try again."
     
-    def _validate_system_ready(self):
+    def _validate_system_ready(self, on_ready):
         """
         Validate that all prerequisites are met before starting inference.
         
-        Returns:
-            bool: True if system is ready, False otherwise
+        The PLC, camera and database checks block on I/O, so they run
+        concurrently on worker threads while the Tk loop keeps running.
+        
+        Args:
+            on_ready: Callback invoked on the Tk thread once every check passed
         """
-        # Check 1: Models available
+        # Check 1: Models available (attribute reads only, run inline)
         models_ok, models_error = self._check_models_available()
         if not models_ok:
             messagebox.showerror("System Not Ready", models_error)
-            return False
-        
-        # Check 2: PLC connection
-        plc_ok, plc_error = self._check_plc_connection()
-        if not plc_ok:
-            messagebox.showerror("System Not Ready", plc_error)
-            return False
-        
-        # Check 3: Cameras connected
-        cameras_ok, cameras_error = self._check_cameras_connected()
-        if not cameras_ok:
-            messagebox.showerror("System Not Ready", cameras_error)
-            return False
-        
-        # Check 4: Database connection
-        db_ok, db_error = self._check_database_connection()
-        if not db_ok:
-            messagebox.showerror("System Not Ready", db_error)
-            return False
-        
-        return True
+            return
+        
+        # Checks 2-4: PLC, cameras and database, in error-reporting priority order
+        executor = ThreadPoolExecutor(max_workers=3, thread_name_prefix="ReadinessCheck")
+        futures = [
+            executor.submit(self._check_plc_connection),
+            executor.submit(self._check_cameras_connected),
+            executor.submit(self._check_database_connection)
+        ]
+        executor.shutdown(wait=False)
+        
+        self._validating = True
+        self.parent.after(100, self._poll_readiness_checks, futures, on_ready)
+    
+    def _poll_readiness_checks(self, futures, on_ready):
+        """
+        Wait for the readiness checks without blocking Tk, then report the result.
+        
+        Args:
+            futures: Check futures in priority order
+            on_ready: Callback invoked if every check passed
+        """
+        if not all(future.done() for future in futures):
+            self.parent.after(100, self._poll_readiness_checks, futures, on_ready)
+            return
+        
+        self._validating = False
+        
+        # Show the first failure in priority order
+        for future in futures:
+            try:
+                check_ok, check_error = future.result()
+            except Exception as e:
+                check_ok, check_error = False, f"⚠️ System Check Failed\n\nError: {str(e)}\n\nPlease check the system and try again."
+            if not check_ok:
+                messagebox.showerror("System Not Ready", check_error)
+                return
+        
+        on_ready()
     
     def _on_start_inspection(self):
         """Handle start button click and monitor system readiness."""
+        if self._validating:
+            return  # Checks for a previous click are still running
+        
         # Show confirmation dialog
         response = messagebox.askyesno(
             "Start Inspection",
@@ -317,18 +513,19 @@ class ControlPanel:
             return  # User cancelled
         
         # Validate system prerequisites before starting
-        if not self._validate_system_ready():
-            return  # Exit if validation fails
-        
+        self._validate_system_ready(on_ready=self._begin_inspection)
+    
+    def _begin_inspection(self):
+        """Start the inspection once all readiness checks have passed."""
         # Mark that inspection has been run at least once
         self.app.inspection_has_run = True
         
-        if hasattr(self.app, 'shared_data') and self.app.shared_data is not None:
+        shared_data = self._shared()
+        if shared_data is not None:
             # Get allow_all value from header checkbox if it exists
-            if hasattr(self.app, 'allow_images_var'):
-                self.app.shared_data['allow_all'] = self.app.allow_images_var.get()
-            else:
-                self.app.shared_data['allow_all'] = False
+            updates = {
+                'allow_all': self.app.allow_images_var.get() if hasattr(self.app, 'allow_images_var') else False
+            }
             
             # Store selected roller type in shared_data
             if hasattr(self.app, 'inference_tab') and self.app.inference_tab:
@@ -337,46 +534,73 @@ class ControlPanel:
                     if selected_roller:
                         roller_type = selected_roller.get()
                         if roller_type and roller_type != "No Rollers":
-                            self.app.shared_data['selected_roller_type'] = roller_type
+                            updates['selected_roller_type'] = roller_type
                         else:
-                            self.app.shared_data['selected_roller_type'] = None
-        
-        # Disable allow_images checkbox in header during inspection
-        if (hasattr(self.app, 'allow_images_checkbutton') and 
-            self.app.allow_images_checkbutton and 
-            self.app.allow_images_checkbutton.winfo_exists()):
-            self.app.allow_images_checkbutton.config(state=tk.DISABLED, fg="#808080")  # Grey when disabled
-        
-        # Disable debug checkbox in header during inspection (change color)
-        if (hasattr(self.app, 'debug_checkbutton') and 
-            self.app.debug_checkbutton and 
-            self.app.debug_checkbutton.winfo_exists()):
-            # Store original color before changing
-            if not hasattr(self.app, '_debug_original_fg'):
-                self.app._debug_original_fg = self.app.debug_checkbutton.cget('fg')
-            self.app.debug_checkbutton.config(state=tk.DISABLED, fg="#808080")  # Grey when disabled
+                            updates['selected_roller_type'] = None
+            
+            # Write both settings in one manager round-trip
+            shared_data.update(updates)
         
-        self.state_manager.on_inspection_start(self)
+        # Apply all start-of-inspection widget changes as one repaint
+        with self._batched_ui():
+            # Disable allow_images checkbox in header during inspection
+            if self._allow_cb is not None:
+                self._allow_cb.config(state=tk.DISABLED, fg="#808080")  # Grey when disabled
+        
+            # Disable debug checkbox in header during inspection (change color)
+            if self._debug_cb is not None:
+                # Store original color before changing
+                if not hasattr(self.app, '_debug_original_fg'):
+                    self.app._debug_original_fg = self._debug_cb.cget('fg')
+                self._debug_cb.config(state=tk.DISABLED, fg="#808080")  # Grey when disabled
+        
+            self.state_manager.on_inspection_start(self)
         
         self.app.start_inspection()
         
-        self._check_system_ready()
+        # New session: wait for the backend's readiness signal off the Tk thread
+        self._cancel_ready_wait()
+        system_ready_event = getattr(self.app, 'system_ready_event', None)
+        if system_ready_event is not None:
+            threading.Thread(
+                target=self._await_system_ready,
+                args=(system_ready_event, self._ready_session),
+                name="SystemReadyWaiter",
+                daemon=True
+            ).start()
     
-    def _check_system_ready(self):
-        """Check if both BF and OD models are ready and show popup."""
-        if hasattr(self.app, 'shared_data') and self.app.shared_data:
-            # Check if overall system is ready
-            if self.app.shared_data.get('overall_system_ready', False):
-                # Show success popup
-                messagebox.showinfo(
-                    "System Ready",
-                    "✅ System is Ready!\n\nBoth BF and OD models have been loaded and warmed up successfully.\nLights are ON and the system is ready for inspection."
-                )
+    def _await_system_ready(self, system_ready_event, session):
+        """
+        Block until the backend signals that the system is ready (worker thread).
+        
+        Args:
+            system_ready_event: multiprocessing.Event set by the PLC process
+            session: Value of _ready_session when the wait started
+        """
+        while session == self._ready_session:
+            if system_ready_event.wait(timeout=_READY_WAIT_SLICE_S):
+                self.parent.after(0, self._show_system_ready, session)
                 return
-            
-            # If not ready yet, check again after 500ms
-            if self.app.inspection_running:
-                self.parent.after(500, self._check_system_ready)
+    
+    def _show_system_ready(self, session):
+        """
+        Show the "System Ready" popup if its inspection session is still active.
+        
+        Args:
+            session: Value of _ready_session when the wait started
+        """
+        if session != self._ready_session or not self.app.inspection_running:
+            return
+        
+        # Show success popup
+        messagebox.showinfo(
+            "System Ready",
+            "✅ System is Ready!\n\nBoth BF and OD models have been loaded and warmed up successfully.\nLights are ON and the system is ready for inspection."
+        )
+    
+    def _cancel_ready_wait(self):
+        """Stop waiting for the "System Ready" signal of the current session."""
+        self._ready_session += 1
     
     def _on_stop_inspection(self):
         """Handle stop button click and re-enable all buttons."""
@@ -391,82 +615,75 @@ class ControlPanel:
         
         # User confirmed - stop the inspection process
         self.app.stop_inspection()
-        
-        # Re-enable the allow_images checkbox in header after inspection stops
-        if (hasattr(self.app, 'allow_images_checkbutton') and 
-            self.app.allow_images_checkbutton and 
-            self.app.allow_images_checkbutton.winfo_exists()):
-            self.app.allow_images_checkbutton.config(state=tk.NORMAL, fg=Colors.WHITE)  # White when enabled
-        
-        # Re-enable debug checkbox in header after inspection stops (restore color)
-        if (hasattr(self.app, 'debug_checkbutton') and 
-            self.app.debug_checkbutton and 
-            self.app.debug_checkbutton.winfo_exists()):
-            # Restore original color or white
-            original_fg = getattr(self.app, '_debug_original_fg', Colors.WHITE)
-            self.app.debug_checkbutton.config(state=tk.NORMAL, fg=original_fg)
-        
-        # Apply all UI state changes for inspection stop
-        self.state_manager.on_inspection_stop(self)
-        
-        # Enable Reset button ONLY if there's data to reset (after stop is confirmed)
-        if hasattr(self.app, 'shared_data') and self.app.shared_data:
-            bf_inspected = self.app.shared_data.get("bf_inspected", 0)
-            od_inspected = self.app.shared_data.get("od_inspected", 0)
+        self._cancel_ready_wait()
+        
+        # Apply all end-of-inspection widget changes as one repaint
+        with self._batched_ui():
+            # Re-enable the allow_images checkbox in header after inspection stops
+            if self._allow_cb is not None:
+                self._allow_cb.config(state=tk.NORMAL, fg=Colors.WHITE)  # White when enabled
+        
+            # Re-enable debug checkbox in header after inspection stops (restore color)
+            if self._debug_cb is not None:
+                # Restore original color or white
+                original_fg = getattr(self.app, '_debug_original_fg', Colors.WHITE)
+                self._debug_cb.config(state=tk.NORMAL, fg=original_fg)
+        
+            # Apply all UI state changes for inspection stop
+            self.state_manager.on_inspection_stop(self)
             
-            if bf_inspected > 0 or od_inspected > 0:
-                # There's data - enable Reset button with orange color
-                if self.reset_button:
-                    self.reset_button.config(state=tk.NORMAL, bg="#ff8c00")
-            else:
-                # No data - keep Reset button disabled
-                if self.reset_button:
-                    self.reset_button.config(state=tk.DISABLED, bg="#6c757d")
+            # Enable Reset button ONLY if there's data to reset (after stop is confirmed);
+            # decided inside the batch so it lands in the same repaint as the rest
+            if self._shared() is not None:
+                snapshot = self._snapshot_shared_data()
+                bf_inspected = snapshot.get("bf_inspected", 0)
+                od_inspected = snapshot.get("od_inspected", 0)
+                
+                if bf_inspected > 0 or od_inspected > 0:
+                    # There's data - enable Reset button with orange color
+                    if self.reset_button:
+                        self.apply_button_state(self.reset_button, state=tk.NORMAL, bg="#ff8c00")
+                else:
+                    # No data - keep Reset button disabled
+                    if self.reset_button:
+                        self.apply_button_state(self.reset_button, state=tk.DISABLED, bg="#6c757d")
     
     def enable_start(self):
         """Enable the start button and disable stop button."""
         if self.start_button:
-            self.start_button.config(state=tk.NORMAL, bg=Colors.SUCCESS)
+            self.apply_button_state(self.start_button, state=tk.NORMAL, bg=Colors.SUCCESS)
         if self.stop_button:
-            self.stop_button.config(state=tk.DISABLED, bg="#6c757d")
+            self.apply_button_state(self.stop_button, state=tk.DISABLED, bg="#6c757d")
         
         # Note: Reset button state is controlled by _on_stop_inspection
         # Don't modify it here - it should remain in its current state
         
         # Re-enable allow_images checkbox in header when inspection is not running
-        if (hasattr(self.app, 'allow_images_checkbutton') and 
-            self.app.allow_images_checkbutton and 
-            self.app.allow_images_checkbutton.winfo_exists()):
-            self.app.allow_images_checkbutton.config(state=tk.NORMAL, fg=Colors.WHITE)  # White when enabled
+        if self._allow_cb is not None:
+            self._allow_cb.config(state=tk.NORMAL, fg=Colors.WHITE)  # White when enabled
         
         # Re-enable debug checkbox in header when inspection is not running (restore color)
-        if (hasattr(self.app, 'debug_checkbutton') and 
-            self.app.debug_checkbutton and 
-            self.app.debug_checkbutton.winfo_exists()):
+        if self._debug_cb is not None:
             # Restore original color or white
             original_fg = getattr(self.app, '_debug_original_fg', Colors.WHITE)
-            self.app.debug_checkbutton.config(state=tk.NORMAL, fg=original_fg)
+            self._debug_cb.config(state=tk.NORMAL, fg=original_fg)
     
     def enable_stop(self):
         """Enable the stop button and disable start and reset buttons."""
         if self.start_button:
-            self.start_button.config(state=tk.DISABLED, bg="#6c757d")
+            self.apply_button_state(self.start_button, state=tk.DISABLED, bg="#6c757d")
         if self.stop_button:
-            self.stop_button.config(state=tk.NORMAL, bg=Colors.DANGER)
+            self.apply_button_state(self.stop_button, state=tk.NORMAL, bg=Colors.DANGER)
         # Disable Reset button during inspection
         if self.reset_button:
-            self.reset_button.config(state=tk.DISABLED, bg="#6c757d")
+            self.apply_button_state(self.reset_button, state=tk.DISABLED, bg="#6c757d")
         # Keep allow_images checkbox in header disabled during inspection
-        if (hasattr(self.app, 'allow_images_checkbutton') and 
-            self.app.allow_images_checkbutton and 
-            self.app.allow_images_checkbutton.winfo_exists()):
-            self.app.allow_images_checkbutton.config(state=tk.DISABLED, fg="#808080")  # Grey when disabled
+        if self._allow_cb is not None:
+            self._allow_cb.config(state=tk.DISABLED, fg="#808080")  # Grey when disabled
         
         # Keep debug checkbox in header disabled during inspection (change color)
-        if (hasattr(self.app, 'debug_checkbutton') and 
-            self.app.debug_checkbutton and 
-            self.app.debug_checkbutton.winfo_exists()):
+        if self._debug_cb is not None:
             # Store original color before changing
             if not hasattr(self.app, '_debug_original_fg'):
-                self.app._debug_original_fg = self.app.debug_checkbutton.cget('fg')
-            self.app.debug_checkbutton.config(state=tk.DISABLED, fg="#808080")  # Grey when disabled
+                self.app._debug_original_fg = self._debug_cb.cget('fg')
+            self._debug_cb.config(state=tk.DISABLED, fg="#808080")  # Grey when disabled
@@ -5,8 +5,7 @@ Modularized layout with status panel, camera feeds, results, and roller info
 
 import tkinter as tk
 import numpy as np
-import time
-import threading
+from backend import STATS_SEQ_KEYS
 from ..utils.styles import Colors
 from ..utils.config import AppConfig
 from ..utils.debug_logger import log_error, log_warning, log_info
@@ -15,6 +14,13 @@ from .camera_feed import CameraFeedManager
 from .control_panel import ControlPanel
 from .results_panel import ResultsPanel
 from .roller_info_panel import RollerInfoPanel
+from .roller_queries import invalidate_roller_cache
+
+# Interval of the shared camera feed tick (~40 FPS; feeds throttle to UI_TARGET_FPS)
+CAMERA_TICK_MS = 25
+
+# Last-shown marker before a feed's first update (sequence numbers are unsigned)
+_NOTHING_SHOWN = -1
 
 
 class InferenceTab:
@@ -38,6 +44,15 @@ class InferenceTab:
         self.results_panel = None
         self.roller_info_panel = None
         
+        # Status monitor state (see _monitor_status_updates)
+        self._model_update_counter = 0
+        self._monitor_error_logged = False
+        self._last_stats_seq = None
+        
+        # Camera feed tick state (see start_camera_threads)
+        self._ticking = False
+        self._camera_after_id = None
+        
     def setup(self):
         """Setup the inference tab UI in a single-frame layout."""
         try:
@@ -79,189 +94,195 @@ class InferenceTab:
             log_error("inference", "Failed to setup Inference tab", e)
             raise
     
-    def update_od_camera(self):
-        """Update OD camera feed display."""
-        od_feed = self.camera_manager.get_feed('od')
+    def _update_camera_feed(self, feed, slots, frame_seq, last_seq, inspection_running):
+        """
+        Push the newest annotated frame (or the idle black frame) to one feed.
         
-        # Optimize sleep timing for better performance
-        frame_delay = 0.025  # ~40 FPS target (reduced from 30ms)
+        Args:
+            feed: CameraFeed to update
+            slots: (2, H, W, 3) view onto the camera's shared annotated frame slots
+            frame_seq: Shared sequence number of the latest published slot
+            last_seq: Sequence number last shown on this feed (None once black
+                      is shown, _NOTHING_SHOWN before the first update)
+            inspection_running: Whether the inspection processes are running
+            
+        Returns:
+            Sequence number now shown on the feed (None while showing black)
+        """
+        if not inspection_running:
+            # Inspection is stopped - show black screen once
+            if last_seq is None or feed.update_frame(self._black_frame):
+                return None
+            return last_seq
         
-        while not self.app.camera_stop_flag.is_set():
-            try:
-                # Check if feed still exists
-                if od_feed is None or od_feed.canvas is None:
-                    break
-                
-                # Check if inspection is running by checking if processes exist
-                inspection_running = (
-                    hasattr(self.app, 'processes') and 
-                    self.app.processes is not None and 
-                    len(self.app.processes) > 0 and
-                    self.app.inspection_running
-                )
-                
-                if inspection_running:
-                    # Inspection is running - show live feed from shared memory
-                    with self.app.annotated_frame_lock_od:
-                        np_frame = np.frombuffer(
-                            self.app.shared_annotated_od.get_obj(), 
-                            dtype=np.uint8
-                        ).reshape(self.app.frame_shape)
-                        frame = np_frame.copy()
-                else:
-                    # Inspection is stopped - show black screen
-                    frame = np.zeros(self.app.frame_shape, dtype=np.uint8)
-
-
-                # Update the camera feed
-                od_feed.update_frame(frame)
-                
-                # Optimized sleep
-                time.sleep(frame_delay)
-            except Exception as e:
-                # Handle exceptions and exit gracefully
-                error_msg = f"OD camera thread error: {e}"
-                print(error_msg)
-                log_error("inference", "OD camera update failed", e, {
-                    "camera_id": "OD",
-                    "inspection_running": getattr(self.app, 'inspection_running', False)
-                })
-                # Set system error flag
-                if hasattr(self.app, 'shared_data') and self.app.shared_data:
-                    self.app.shared_data['system_error'] = True
-                break
-
-    def update_bf_camera(self):
-        """Update Bigface camera feed display."""
-        bf_feed = self.camera_manager.get_feed('bf')
+        seq = frame_seq.value
+        if seq == last_seq:
+            # Nothing new from the producer - leave the canvas as it is
+            return last_seq
+        
+        # Render straight from the published slot (update_frame resizes/pastes
+        # into its own buffers). A frame dropped by the feed's rate throttle is
+        # retried on the next tick
+        if not feed.update_frame(slots[seq & 1]):
+            return last_seq
+        
+        # The producer writes the other slot next and only returns to this one
+        # after publishing seq + 1, so the drawn frame was whole if the sequence
+        # number has not moved meanwhile; otherwise leave seq unrecorded so the
+        # next tick redraws from the newer slot
+        if frame_seq.value != seq:
+            return last_seq
+        return seq
+    
+    def _camera_tick(self):
+        """Update both camera feeds on the Tk main loop and reschedule."""
+        self._camera_after_id = None
+        if not self._ticking or self.app.camera_stop_flag.is_set():
+            self._ticking = False
+            return
         
-        # Optimize sleep timing for better performance
-        frame_delay = 0.025  # ~40 FPS target (reduced from 30ms)
+        inspection_running = self.app.inspection_running_flag.is_set()
         
-        while not self.app.camera_stop_flag.is_set():
+        for camera_id, feed, slots, frame_seq in self._camera_sources:
+            if camera_id in self._failed_cameras:
+                continue
             try:
-                # Check if feed still exists
-                if bf_feed is None or bf_feed.canvas is None:
-                    break
+                # Feed widgets go away when the tab is rebuilt
+                if feed is None or feed.canvas is None or not feed.canvas.winfo_exists():
+                    self._ticking = False
+                    return
                 
-               # Check if inspection is running by checking if processes exist
-                inspection_running = (
-                    hasattr(self.app, 'processes') and 
-                    self.app.processes is not None and 
-                    len(self.app.processes) > 0 and
-                    self.app.inspection_running
+                self._last_seqs[camera_id] = self._update_camera_feed(
+                    feed, slots, frame_seq, self._last_seqs[camera_id], inspection_running
                 )
-                
-                if inspection_running:
-                    # Inspection is running - show live feed from shared memory
-                    with self.app.annotated_frame_lock_bigface:
-                        np_frame = np.frombuffer(
-                            self.app.shared_annotated_bigface.get_obj(), 
-                            dtype=np.uint8
-                        ).reshape(self.app.frame_shape)
-                        frame = np_frame.copy()
-                else:
-                    # Inspection is stopped - show black screen
-                    frame = np.zeros(self.app.frame_shape, dtype=np.uint8)
-
-                # Update the camera feed
-                bf_feed.update_frame(frame)
-                
-                # Optimized sleep
-                time.sleep(frame_delay)
             except Exception as e:
-                # Handle exceptions and exit gracefully
-                error_msg = f"BF camera thread error: {e}"
-                print(error_msg)
-                log_error("inference", "BF camera update failed", e, {
-                    "camera_id": "BF",
+                # Stop updating this camera only; the other feed keeps running
+                self._failed_cameras.add(camera_id)
+                log_error("inference", f"{camera_id.upper()} camera update failed", e, {
+                    "camera_id": camera_id.upper(),
                     "inspection_running": getattr(self.app, 'inspection_running', False)
                 })
                 # Set system error flag
                 if hasattr(self.app, 'shared_data') and self.app.shared_data:
                     self.app.shared_data['system_error'] = True
-                break
+        
+        # Scheduled on the app window, which outlives this tab's widgets
+        self._camera_after_id = self.app.after(CAMERA_TICK_MS, self._camera_tick)
+    
+    def stop_camera_updates(self):
+        """Stop the camera feed tick and cancel its pending callback."""
+        self._ticking = False
+        if self._camera_after_id is not None:
+            try:
+                self.app.after_cancel(self._camera_after_id)
+            except tk.TclError:
+                pass
+            self._camera_after_id = None
     
     def start_camera_threads(self):
-        """Start camera feed update threads."""
+        """Start the camera feed updates (one Tk after() tick for both feeds)."""
         try:
-            log_info("inference", "Starting camera feed threads")
+            log_info("inference", "Starting camera feed updates")
+            
+            # Restarting replaces any tick already scheduled for this tab
+            self.stop_camera_updates()
             
             # Clear stop flag
             self.app.camera_stop_flag.clear()
             
-            self.app.od_thread = threading.Thread(target=self.update_od_camera, name="OD_Camera_Thread")
-            self.app.od_thread.daemon = True
-            self.app.od_thread.start()
-            
-            # Register thread with process manager
-            self.app.process_manager.register_inference_thread(self.app.od_thread)
+            # Views onto the two shared annotated frame slots per camera, so the
+            # tick never allocates
+            frame_shape = self.app.frame_shape
+            od_slots = np.frombuffer(
+                self.app.shared_annotated_od.get_obj(), dtype=np.uint8
+            ).reshape((2, *frame_shape))
+            bf_slots = np.frombuffer(
+                self.app.shared_annotated_bigface.get_obj(), dtype=np.uint8
+            ).reshape((2, *frame_shape))
+            self._black_frame = np.zeros(frame_shape, dtype=np.uint8)
+            self._black_frame.flags.writeable = False
             
-            self.app.bf_thread = threading.Thread(target=self.update_bf_camera, name="BF_Camera_Thread")
-            self.app.bf_thread.daemon = True
-            self.app.bf_thread.start()
+            od_feed = self.camera_manager.get_feed('od')
+            bf_feed = self.camera_manager.get_feed('bf')
+            self._camera_sources = (
+                ('od', od_feed, od_slots, self.app.annotated_frame_seq_od),
+                ('bf', bf_feed, bf_slots, self.app.annotated_frame_seq_bigface),
+            )
+            self._last_seqs = {'od': _NOTHING_SHOWN, 'bf': _NOTHING_SHOWN}
+            self._failed_cameras = set()
             
-            # Register thread with process manager
-            self.app.process_manager.register_inference_thread(self.app.bf_thread)
+            self._ticking = True
+            self._camera_after_id = self.app.after(0, self._camera_tick)
             
-            log_info("inference", "Camera feed threads started successfully")
+            log_info("inference", "Camera feed updates started successfully")
             
         except Exception as e:
-            log_error("inference", "Failed to start camera threads", e)
+            log_error("inference", "Failed to start camera updates", e)
             raise
     
     def _monitor_status_updates(self):
         """Monitor shared_data for status updates and update status panel."""
+        shared_data = getattr(self.app, 'shared_data', None)
         try:
-            if hasattr(self.app, 'shared_data') and self.app.shared_data and self.status_panel:
+            if shared_data is not None and self.status_panel:
                 # Get system_ready flag (master control)
-                system_ready = self.app.shared_data.get('system_ready', False)
-                
-                if system_ready:
-                    # System is ready - show actual status
-                    
-                    # Update Machine Mode based on system_mode flag
-                    system_mode = self.app.shared_data.get('system_mode', False)
-                    if system_mode:
-                        self.status_panel.update_machine_mode("AUTO", "#00ff00")  # Green
+                if shared_data.get('system_ready', False):
+                    # System is ready - show actual status (green/red)
+                    if shared_data.get('system_mode', False):
+                        machine_mode = ("AUTO", "#00ff00")
                     else:
-                        self.status_panel.update_machine_mode("MANUAL", "#ff0000")  # Red
-                    
-                    # Update Disc Status based on disc_status flag
-                    disc_status = self.app.shared_data.get('disc_status', False)
-                    if disc_status:
-                        self.status_panel.update_disc_status("READY", "#00ff00")  # Green
+                        machine_mode = ("MANUAL", "#ff0000")
+                    if shared_data.get('disc_status', False):
+                        disc_status = ("READY", "#00ff00")
                     else:
-                        self.status_panel.update_disc_status("NOT READY", "#ff0000")  # Red
+                        disc_status = ("NOT READY", "#ff0000")
                 else:
                     # System is not ready - show "Not Available" in yellow for both
-                    self.status_panel.update_machine_mode("Not Available", "#ffff00")  # Yellow
-                    self.status_panel.update_disc_status("Not Available", "#ffff00")  # Yellow
+                    machine_mode = disc_status = ("Not Available", "#ffff00")
                 
-                # Update results panel from shared_data
-                if self.results_panel:
-                    self.results_panel.update_from_shared_data(self.app.shared_data)
+                stats_seq = tuple(shared_data.get(key, 0) for key in STATS_SEQ_KEYS)
                 
-                # Update model names in status panel (less frequently)
-                if self.status_panel and not hasattr(self, '_model_update_counter'):
-                    self._model_update_counter = 0
-                
-                if hasattr(self, '_model_update_counter'):
+                try:
+                    self.status_panel.update_machine_mode(*machine_mode)
+                    self.status_panel.update_disc_status(*disc_status)
+                    
+                    # Update results panel only when the producers changed a counter
+                    if self.results_panel and stats_seq != self._last_stats_seq:
+                        self._last_stats_seq = stats_seq
+                        self.results_panel.update_from_shared_data(shared_data)
+                    
+                    # Update model names in status panel (less frequently)
                     self._model_update_counter += 1
                     if self._model_update_counter >= 10:  # Update every 5 seconds instead of 500ms
                         self.status_panel.update_model_names()
                         self._model_update_counter = 0
+                except tk.TclError:
+                    pass  # Panel widgets destroyed while the tab is being rebuilt
             
             # Refresh roller list if data was updated (check flag)
-            if hasattr(self.app, 'roller_data_updated') and self.app.roller_data_updated:
-                if self.status_panel and hasattr(self.status_panel, 'refresh_roller_list'):
-                    self.status_panel.refresh_roller_list()
+            if getattr(self.app, 'roller_data_updated', False):
+                # Roller geometry may have been edited in the Data tab
+                invalidate_roller_cache()
+                try:
+                    if self.status_panel and hasattr(self.status_panel, 'refresh_roller_list'):
+                        self.status_panel.refresh_roller_list()
+                except tk.TclError:
+                    pass  # Panel widgets destroyed while the tab is being rebuilt
                 self.app.roller_data_updated = False
-        except:
-            pass  # Silently continue on errors
+        except (OSError, EOFError) as e:
+            # The shared_data manager is gone (shutdown)
+            self._log_monitor_error("Status monitor lost shared_data", e)
+        except Exception as e:
+            self._log_monitor_error("Status monitor update failed", e)
         
         # Continue monitoring every 500ms
         try:
             self.parent.after(500, self._monitor_status_updates)
-        except:
+        except tk.TclError:
             pass  # Tab might be destroyed
+    
+    def _log_monitor_error(self, message, error):
+        """Log a status monitor failure once, instead of on every 500ms poll."""
+        if not self._monitor_error_logged:
+            self._monitor_error_logged = True
+            log_warning("inference", message, str(error))
@@ -0,0 +1,137 @@
+"""
+Reset Dialog Component
+Single confirmation dialog for resetting counters and optionally saving them first
+"""
+
+import tkinter as tk
+from ..utils.styles import Colors, Fonts
+
+
+class ResetDialog:
+    """Modal dialog asking whether to reset counters and whether to save them first."""
+    
+    WIDTH = 420
+    HEIGHT = 260
+    
+    def __init__(self, parent, bf_inspected, od_inspected, on_confirm):
+        """
+        Initialize reset dialog.
+        
+        Args:
+            parent: Parent widget
+            bf_inspected: Number of BF rollers inspected in the current session
+            od_inspected: Number of OD rollers inspected in the current session
+            on_confirm: Callback invoked as on_confirm(save) when the user confirms
+        """
+        self.parent = parent
+        self.bf_inspected = bf_inspected
+        self.od_inspected = od_inspected
+        self.on_confirm = on_confirm
+        self.dialog = None
+        self.save_var = None
+        
+    @property
+    def has_data(self):
+        """Whether there is inspection data that could be saved."""
+        return self.bf_inspected > 0 or self.od_inspected > 0
+        
+    def show(self):
+        """Display the dialog (returns immediately; the result goes to on_confirm)."""
+        self.dialog = tk.Toplevel(self.parent)
+        self.dialog.title("Reset Counters")
+        self.dialog.configure(bg=Colors.PRIMARY_BG)
+        self.dialog.resizable(False, False)
+        
+        # Center window
+        self.dialog.update_idletasks()
+        x = (self.dialog.winfo_screenwidth() // 2) - (self.WIDTH // 2)
+        y = (self.dialog.winfo_screenheight() // 2) - (self.HEIGHT // 2)
+        self.dialog.geometry(f"{self.WIDTH}x{self.HEIGHT}+{x}+{y}")
+        
+        # Make dialog modal
+        self.dialog.transient(self.parent)
+        self.dialog.grab_set()
+        self.dialog.protocol("WM_DELETE_WINDOW", self._on_cancel)
+        
+        self._create_content()
+        
+    def _create_content(self):
+        """Create dialog content."""
+        main_frame = tk.Frame(self.dialog, bg=Colors.PRIMARY_BG)
+        main_frame.pack(fill=tk.BOTH, expand=True, padx=20, pady=15)
+        
+        tk.Label(
+            main_frame,
+            text="Are you sure you want to reset all inspection counters?\n\n"
+                 "This will clear all current statistics.",
+            font=Fonts.TEXT,
+            fg=Colors.WHITE,
+            bg=Colors.PRIMARY_BG,
+            justify=tk.LEFT
+        ).pack(anchor="w")
+        
+        # Offer saving only when there is something to save (pre-checked)
+        self.save_var = tk.BooleanVar(value=self.has_data)
+        if self.has_data:
+            tk.Label(
+                main_frame,
+                text=f"BF Inspected: {self.bf_inspected}\nOD Inspected: {self.od_inspected}",
+                font=Fonts.TEXT_BOLD,
+                fg=Colors.WHITE,
+                bg=Colors.PRIMARY_BG,
+                justify=tk.LEFT
+            ).pack(anchor="w", pady=(10, 0))
+            
+            tk.Checkbutton(
+                main_frame,
+                text="Save to database before reset",
+                variable=self.save_var,
+                font=Fonts.TEXT_BOLD,
+                bg=Colors.PRIMARY_BG,
+                fg=Colors.WHITE,
+                selectcolor=Colors.SECONDARY_BG,
+                activebackground=Colors.PRIMARY_BG,
+                activeforeground=Colors.WHITE,
+                cursor="hand2"
+            ).pack(anchor="w", pady=(10, 0))
+            
+        # Buttons
+        button_frame = tk.Frame(main_frame, bg=Colors.PRIMARY_BG)
+        button_frame.pack(side=tk.BOTTOM, fill=tk.X)
+        
+        tk.Button(
+            button_frame,
+            text="Cancel",
+            font=Fonts.TEXT_BOLD,
+            bg="#6c757d",  # Gray
+            fg=Colors.WHITE,
+            width=10,
+            command=self._on_cancel
+        ).pack(side=tk.RIGHT, padx=(10, 0))
+        
+        tk.Button(
+            button_frame,
+            text="Reset",
+            font=Fonts.TEXT_BOLD,
+            bg="#ff8c00",  # Orange, matching the Reset button
+            fg=Colors.WHITE,
+            width=10,
+            command=self._on_ok
+        ).pack(side=tk.RIGHT)
+        
+    def _on_ok(self):
+        """Close the dialog and report the user's choice."""
+        save = self.has_data and self.save_var.get()
+        self._close()
+        self.on_confirm(save)
+        
+    def _on_cancel(self):
+        """Close the dialog without resetting."""
+        self._close()
+        
+    def _close(self):
+        """Release the modal grab and destroy the dialog."""
+        if self.dialog is not None:
+            self.dialog.grab_release()
+            self.dialog.destroy()
+            self.dialog = None
@@ -4,9 +4,33 @@ Displays inspection results for Bigface, OD, and Overall
 """
 
 import tkinter as tk
+from functools import lru_cache
 
-from frontend.utils.config import AppConfig
+from ..utils.debug_logger import log_info
 from ..utils.styles import Colors, Fonts
+from .roller_queries import (
+    NO_ROLLER_INFO, format_roller, get_cached_roller, get_roller,
+    preload_rollers, query_async
+)
+
+
+# Result StringVars written by update_from_shared_data, in update order
+_STAT_KEYS = (
+    "bf_inspected", "bf_ok", "bf_not_ok", "bf_percentage",
+    "od_inspected", "od_ok", "od_not_ok", "od_percentage",
+    "overall_inspected", "overall_ok", "overall_not_ok", "overall_percentage",
+)
+
+
+@lru_cache(maxsize=None)
+def _percent_text(tenths):
+    """Percentage label text for a value in tenths of a percent (0..1000)."""
+    return f"{tenths / 10:.1f}%"
+
+
+def _percent_tenths(ok, inspected):
+    """OK share of inspected rollers in whole tenths of a percent."""
+    return round(ok * 1000 / inspected) if inspected > 0 else 0
 
 
 class ResultsPanel:
@@ -24,6 +48,20 @@ class ResultsPanel:
         self.app = app_instance
         self.result_vars = {}
         
+        # Counters last written by update_from_shared_data (None forces a refresh)
+        self._last_stats = None
+        
+        # The _STAT_KEYS StringVars (bound in create) and the text last set on each
+        self._stat_vars = ()
+        self._stat_texts = ()
+        
+        # Text last set on each roller info StringVar by update_roller_info
+        self._roller_texts = {}
+        
+        # Incremented per roller info query (see roller_queries.query_async);
+        # only the latest result is shown
+        self._roller_request = 0
+        
     def create(self):
         """Create the results panel UI."""
         # Main container - not expanding to full width
@@ -35,6 +73,10 @@ class ResultsPanel:
         self._create_od_results(container, 1)
         self._create_overall_results(container, 2)
         
+        # Bind the result StringVars once so updates skip the per-key dict lookups
+        self._stat_vars = tuple(self.result_vars[key] for key in _STAT_KEYS)
+        self._stat_texts = tuple(var.get() for var in self._stat_vars)
+        
         # Create roller info section (4th column)
         self._create_roller_info(container, 3)
         
@@ -191,6 +233,10 @@ class ResultsPanel:
         self.result_vars[f"{section}_ok"].set(str(ok_rollers))
         self.result_vars[f"{section}_not_ok"].set(str(not_ok_rollers))
         self.result_vars[f"{section}_percentage"].set(f"{percentage:.1f}%")
+        
+        # Displayed values no longer match the cached counters and texts
+        self._last_stats = None
+        self._stat_texts = (None,) * len(_STAT_KEYS)
     
     def update_roller_info(self, **kwargs):
         """
@@ -199,149 +245,114 @@ class ResultsPanel:
         Args:
             **kwargs: Key-value pairs to update (e.g., outer_diameter="25 mm")
         """
+        # Only touch the StringVars whose text actually changes
+        result_vars = self.result_vars
+        texts = self._roller_texts
         for key, value in kwargs.items():
-            if key in self.result_vars:
-                self.result_vars[key].set(value)
+            var = result_vars.get(key)
+            if var is not None and texts.get(key) != value:
+                var.set(value)
+                texts[key] = value
     
     def _load_initial_roller_info(self):
         """Load initial roller data from database."""
-        try:
-            # First, check if there's a previously selected roller type in app
-            previously_selected = getattr(self.app, 'selected_roller_type', None)
-            
-            if previously_selected and previously_selected != "No Rollers":
-                # Load the previously selected roller's info
-                self.load_roller_from_db(previously_selected)
-                return
-            
-            # Fallback: Load first roller from database
-            import mysql.connector
-            
-            connection = mysql.connector.connect(
-                host=AppConfig.DB_HOST,
-                user=AppConfig.DB_USER,
-                password=AppConfig.DB_PASSWORD,
-                database=AppConfig.DB_DATABASE
-            )
-            
-            cursor = connection.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT roller_type, outer_diameter, dimple_diameter, small_diameter, 
-                       length_mm, high_head_pixels, down_head_pixels
-                FROM roller_data
-                ORDER BY roller_type
-                LIMIT 1
-            """)
-            result = cursor.fetchone()
-            
-            cursor.close()
-            connection.close()
-            
-            if result:
-                self.update_roller_info(
-                    outer_diameter=f"{result['outer_diameter']} mm",
-                    dimple_diameter=f"{result['dimple_diameter']} mm",
-                    small_diameter=f"{result['small_diameter']} mm",
-                    roller_length=f"{result['length_mm']} mm",
-                    high_head=f"{result['high_head_pixels']} pixels",
-                    down_head=f"{result['down_head_pixels']} pixels"
-                )
-                print(f"📋 Loaded first roller from DB: {result['roller_type']}")
-        
-        except Exception as e:
-            print(f"❌ Error loading initial roller info: {e}")
-            import traceback
-            traceback.print_exc()
+        # First, check if there's a previously selected roller type in app
+        previously_selected = getattr(self.app, 'selected_roller_type', None)
+        
+        if previously_selected and previously_selected != "No Rollers":
+            # Load the previously selected roller's info
+            self.load_roller_from_db(previously_selected)
+            return
+        
+        # Fallback: Load first roller from database
+        query_async(
+            self.parent, self, preload_rollers, self._show_first_roller,
+            "Error loading initial roller info"
+        )
     
     def load_roller_from_db(self, roller_type):
         """
         Load roller information from database by roller type.
         
+        Cached rollers are shown immediately; otherwise the query runs on a
+        worker thread and the panel is updated on the Tk thread.
+        
         Args:
             roller_type: Name of the roller type to load
         """
-        try:
-            import mysql.connector
-            
-            connection = mysql.connector.connect(
-                host=AppConfig.DB_HOST,
-                user=AppConfig.DB_USER,
-                password=AppConfig.DB_PASSWORD,
-                database=AppConfig.DB_DATABASE
-            )
-            
-            cursor = connection.cursor(dictionary=True)
-            query = """
-                SELECT outer_diameter, dimple_diameter, small_diameter, 
-                       length_mm, high_head_pixels, down_head_pixels
-                FROM roller_data
-                WHERE roller_type = %s
-            """
-            cursor.execute(query, (roller_type,))
-            result = cursor.fetchone()
-            
-            cursor.close()
-            connection.close()
-            
-            if result:
-                self.update_roller_info(
-                    outer_diameter=f"{result['outer_diameter']} mm",
-                    dimple_diameter=f"{result['dimple_diameter']} mm",
-                    small_diameter=f"{result['small_diameter']} mm",
-                    roller_length=f"{result['length_mm']} mm",
-                    high_head=f"{result['high_head_pixels']} pixels",
-                    down_head=f"{result['down_head_pixels']} pixels"
-                )
-            else:
-                # Set to "No Data" if not found
-                self.update_roller_info(
-                    outer_diameter="No Data",
-                    dimple_diameter="No Data",
-                    small_diameter="No Data",
-                    roller_length="No Data",
-                    high_head="No Data",
-                    down_head="No Data"
-                )
-        
-        except Exception as e:
-            print(f"❌ Error loading roller from database: {e}")
+        found, row = get_cached_roller(roller_type)
+        if found:
+            # Supersede any query still in flight for an earlier selection
+            self._roller_request += 1
+            self._show_roller(row)
+            return
+        
+        query_async(
+            self.parent, self, lambda: get_roller(roller_type), self._show_roller,
+            "Error loading roller from database"
+        )
+    
+    def _show_first_roller(self, result):
+        """Show the fallback (first) roller's info."""
+        if result:
+            self._show_roller(result)
+            log_info("inference", f"Loaded first roller from DB: {result[6]}")
+    
+    def _show_roller(self, result):
+        """
+        Show a roller's info, or "No Data" if it was not found.
+        
+        Args:
+            result: Row from roller_data (see roller_queries), or None
+        """
+        if result:
+            self.update_roller_info(**format_roller(result))
+        else:
+            # Set to "No Data" if not found
+            self.update_roller_info(**NO_ROLLER_INFO)
     
     def update_from_shared_data(self, shared_data):
         """
         Update all results from shared_data dictionary.
         
         Args:
-            shared_data: Dictionary containing inspection statistics
+            shared_data: Dictionary (or Manager dict proxy) containing inspection statistics
         """
-        # Update BF results
+        # One manager round-trip for the whole dict instead of one per counter
+        if hasattr(shared_data, '_getvalue'):
+            shared_data = shared_data._getvalue()
+        
         bf_inspected = shared_data.get("bf_inspected", 0)
         bf_ok = shared_data.get("bf_ok_rollers", 0)
         bf_not_ok = shared_data.get("bf_not_ok_rollers", 0)
-        bf_percentage = (bf_ok / bf_inspected * 100) if bf_inspected > 0 else 0.0
-        
-        self.result_vars["bf_inspected"].set(str(bf_inspected))
-        self.result_vars["bf_ok"].set(str(bf_ok))
-        self.result_vars["bf_not_ok"].set(str(bf_not_ok))
-        self.result_vars["bf_percentage"].set(f"{bf_percentage:.1f}%")
-        
-        # Update OD results
         od_inspected = shared_data.get("od_inspected", 0)
         od_ok = shared_data.get("od_ok_rollers", 0)
         od_not_ok = shared_data.get("od_not_ok_rollers", 0)
-        od_percentage = (od_ok / od_inspected * 100) if od_inspected > 0 else 0.0
-
-        self.result_vars["od_inspected"].set(str(od_inspected))
-        self.result_vars["od_ok"].set(str(od_ok))
-        self.result_vars["od_not_ok"].set(str(od_not_ok))
-        self.result_vars["od_percentage"].set(f"{od_percentage:.1f}%")
         
-        # Update Overall results
+        # Skip the 12 StringVar writes (and their redraws) when nothing changed
+        stats = (bf_inspected, bf_ok, bf_not_ok, od_inspected, od_ok, od_not_ok)
+        if stats == self._last_stats:
+            return
+        self._last_stats = stats
+        
+        # Overall results; a roller is only OK overall if it passed both BF and OD,
+        # so the OD count is capped by the BF count the two processes update separately
         overall_inspected = bf_inspected
-        overall_ok = od_ok
+        overall_ok = min(bf_ok, od_ok)
         overall_not_ok = bf_not_ok + od_not_ok
-        overall_percentage = (overall_ok / overall_inspected * 100) if overall_inspected > 0 else 0.0
         
-        self.result_vars["overall_inspected"].set(str(overall_inspected))
-        self.result_vars["overall_ok"].set(str(overall_ok))
-        self.result_vars["overall_not_ok"].set(str(overall_not_ok))
-        self.result_vars["overall_percentage"].set(f"{overall_percentage:.1f}%")
+        # Format everything first (in _STAT_KEYS order), then touch only the
+        # StringVars whose text changed; percentages are only ever formatted
+        # once per displayed tenth
+        texts = (
+            str(bf_inspected), str(bf_ok), str(bf_not_ok),
+            _percent_text(_percent_tenths(bf_ok, bf_inspected)),
+            str(od_inspected), str(od_ok), str(od_not_ok),
+            _percent_text(_percent_tenths(od_ok, od_inspected)),
+            str(overall_inspected), str(overall_ok), str(overall_not_ok),
+            _percent_text(_percent_tenths(overall_ok, overall_inspected)),
+        )
+        for var, text, shown in zip(self._stat_vars, texts, self._stat_texts):
+            if text != shown:
+                var.set(text)
+        self._stat_texts = texts
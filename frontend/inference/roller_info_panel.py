@@ -5,8 +5,11 @@ Displays detailed roller information on the right side
 
 import tkinter as tk
 
-from frontend.utils.config import AppConfig
 from ..utils.styles import Colors, Fonts
+from .roller_queries import (
+    NO_ROLLER_INFO, format_roller, get_cached_roller, get_roller,
+    preload_rollers, query_async
+)
 
 
 class RollerInfoPanel:
@@ -22,7 +25,13 @@ class RollerInfoPanel:
         """
         self.parent = parent
         self.app = app_instance
-        self.info_vars = {}
+        self.info_labels = {}  # Value label of each info row
+        self._info_texts = {}  # Text last set on each info label
+        self._initial_load_done = False
+        
+        # Incremented per roller query (see roller_queries.query_async);
+        # only the latest result is shown
+        self._roller_request = 0
         
     def create(self):
         """Create the roller info panel UI."""
@@ -38,6 +47,9 @@ class RollerInfoPanel:
         )
         frame.pack(fill=tk.BOTH, expand=True, padx=5, pady=5)
         
+        # Load initial data once the panel is first on screen
+        frame.bind("<Map>", self._on_map, add="+")
+        
         inner_frame = tk.Frame(frame, bg=Colors.PRIMARY_BG)
         inner_frame.pack(padx=10, pady=10, fill=tk.BOTH, expand=True)
         
@@ -49,112 +61,69 @@ class RollerInfoPanel:
         self._create_info_row(inner_frame, "High Head (pixels):", "high_head", "No Data", 4)
         self._create_info_row(inner_frame, "Down Head (pixels):", "down_head", "No Data", 5)
         
-        # Load initial data from database (from first roller in status panel dropdown)
-        self._load_initial_data()
-        
         return frame
     
+    def _on_map(self, event=None):
+        """Load the initial roller data the first time the panel is shown."""
+        if not self._initial_load_done:
+            # Load initial data from database (from first roller in status panel
+            # dropdown) only once the panel is actually visible
+            self._initial_load_done = True
+            self._load_initial_data()
+    
     def _load_initial_data(self):
-        """Load initial roller data from database."""
-        try:
-            # Try to get the selected roller from status panel
-            if hasattr(self.app, 'inference_tab') and self.app.inference_tab:
-                if hasattr(self.app.inference_tab, 'status_panel') and self.app.inference_tab.status_panel:
-                    status_panel = self.app.inference_tab.status_panel
-                    if hasattr(status_panel, 'status_vars') and 'roller_type' in status_panel.status_vars:
-                        selected_roller = status_panel.status_vars['roller_type'].get()
-                        if selected_roller and selected_roller != "No Rollers":
-                            self.load_roller_from_db(selected_roller)
-                            return
-            
-            # Fallback: Load first roller from database
-            import mysql.connector
-            
-            connection = mysql.connector.connect(
-                host=AppConfig.DB_HOST,
-                user=AppConfig.DB_USER,
-                password=AppConfig.DB_PASSWORD,
-                database=AppConfig.DB_DATABASE
-            )
-            
-            cursor = connection.cursor(dictionary=True)
-            cursor.execute("""
-                SELECT roller_type, outer_diameter, dimple_diameter, small_diameter, 
-                       length_mm, high_head_pixels, down_head_pixels
-                FROM roller_data
-                ORDER BY roller_type
-                LIMIT 1
-            """)
-            result = cursor.fetchone()
-            
-            cursor.close()
-            connection.close()
-            
-            if result:
-                self.update_info(
-                    outer_diameter=f"{result['outer_diameter']} mm",
-                    dimple_diameter=f"{result['dimple_diameter']} mm",
-                    small_diameter=f"{result['small_diameter']} mm",
-                    roller_length=f"{result['length_mm']} mm",
-                    high_head=f"{result['high_head_pixels']} pixels",
-                    down_head=f"{result['down_head_pixels']} pixels"
-                )
-        
-        except Exception as e:
-            print(f"❌ Error loading initial roller data: {e}")
+        """Load initial roller data from database (without blocking the Tk thread)."""
+        # Try to get the selected roller from status panel
+        if hasattr(self.app, 'inference_tab') and self.app.inference_tab:
+            if hasattr(self.app.inference_tab, 'status_panel') and self.app.inference_tab.status_panel:
+                status_panel = self.app.inference_tab.status_panel
+                if hasattr(status_panel, 'status_vars') and 'roller_type' in status_panel.status_vars:
+                    selected_roller = status_panel.status_vars['roller_type'].get()
+                    if selected_roller and selected_roller not in ("No Rollers", "Loading..."):
+                        self.load_roller_from_db(selected_roller)
+                        return
+        
+        # Fallback: Load first roller from database
+        query_async(
+            self.parent, self, preload_rollers, self._show_roller,
+            "Error loading initial roller data"
+        )
     
     def load_roller_from_db(self, roller_type):
         """
         Load roller information from database by roller type.
         
+        Cached rollers are shown immediately; otherwise the query runs on a
+        worker thread and the panel is updated on the Tk thread.
+        
         Args:
             roller_type: Name of the roller type to load
         """
-        try:
-            import mysql.connector
-            
-            connection = mysql.connector.connect(
-                host=AppConfig.DB_HOST,
-                user=AppConfig.DB_USER,
-                password=AppConfig.DB_PASSWORD,
-                database=AppConfig.DB_DATABASE
-            )
-            
-            cursor = connection.cursor(dictionary=True)
-            query = """
-                SELECT outer_diameter, dimple_diameter, small_diameter, 
-                       length_mm, high_head_pixels, down_head_pixels
-                FROM roller_data
-                WHERE roller_type = %s
-            """
-            cursor.execute(query, (roller_type,))
-            result = cursor.fetchone()
-            
-            cursor.close()
-            connection.close()
-            
-            if result:
-                self.update_info(
-                    outer_diameter=f"{result['outer_diameter']} mm",
-                    dimple_diameter=f"{result['dimple_diameter']} mm",
-                    small_diameter=f"{result['small_diameter']} mm",
-                    roller_length=f"{result['length_mm']} mm",
-                    high_head=f"{result['high_head_pixels']} pixels",
-                    down_head=f"{result['down_head_pixels']} pixels"
-                )
-            else:
-                # Set to "No Data" if not found
-                self.update_info(
-                    outer_diameter="No Data",
-                    dimple_diameter="No Data",
-                    small_diameter="No Data",
-                    roller_length="No Data",
-                    high_head="No Data",
-                    down_head="No Data"
-                )
-        
-        except Exception as e:
-            print(f"❌ Error loading roller from database: {e}")
+        found, row = get_cached_roller(roller_type)
+        if found:
+            # Supersede any query still in flight for an earlier selection
+            self._roller_request += 1
+            self._show_roller(row)
+            return
+        
+        query_async(
+            self.parent, self, lambda: get_roller(roller_type), self._show_roller,
+            "Error loading roller from database"
+        )
+    
+    def _show_roller(self, result):
+        """
+        Show a roller's info, or "No Data" if it was not found.
+        
+        Serves both the selected roller and the first-roller fallback.
+        
+        Args:
+            result: Row from roller_data, or None
+        """
+        if result:
+            self.update_info(**format_roller(result))
+        else:
+            self.update_info(**NO_ROLLER_INFO)
     
     def _create_info_row(self, parent, label_text, var_key, default_value, row):
         """Create a single info row."""
@@ -172,17 +141,18 @@ class RollerInfoPanel:
         )
         label.pack(side=tk.LEFT, padx=(0, 10))
         
-        # Value
-        self.info_vars[var_key] = tk.StringVar(value=default_value)
+        # Value (plain label text, no StringVar: it only changes through update_info)
         value_label = tk.Label(
             row_frame,
-            textvariable=self.info_vars[var_key],
+            text=default_value,
             font=Fonts.TEXT_BOLD,  # Larger bold text
             fg=Colors.WHITE,
             bg=Colors.PRIMARY_BG,
             anchor="e"
         )
         value_label.pack(side=tk.RIGHT, padx=(10, 0))
+        self.info_labels[var_key] = value_label
+        self._info_texts[var_key] = default_value
     
     def update_info(self, **kwargs):
         """
@@ -191,6 +161,12 @@ class RollerInfoPanel:
         Args:
             **kwargs: Key-value pairs to update (e.g., outer_diameter="25 mm")
         """
+        # Only reconfigure the labels whose text actually changes; re-selecting a
+        # roller with the same geometry costs no Tcl calls
+        labels = self.info_labels
+        texts = self._info_texts
         for key, value in kwargs.items():
-            if key in self.info_vars:
-                self.info_vars[key].set(value)
+            label = labels.get(key)
+            if label is not None and texts.get(key) != value:
+                label.config(text=value)
+                texts[key] = value
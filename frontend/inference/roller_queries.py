@@ -0,0 +1,314 @@
+"""
+Roller Queries
+roller_data lookups shared by the inference panels, run on pooled connections
+"""
+
+import threading
+import time
+import tkinter as tk
+
+from ..utils.debug_logger import log_error
+
+
+# Roller info queries. Rows are plain tuples: the six geometry columns in this
+# order, then (for ALL_ROLLERS_QUERY only) the roller type.
+ALL_ROLLERS_QUERY = """
+    SELECT outer_diameter, dimple_diameter, small_diameter, 
+           length_mm, high_head_pixels, down_head_pixels, roller_type
+    FROM roller_data
+    ORDER BY roller_type
+"""
+ROLLER_BY_TYPE_QUERY = """
+    SELECT outer_diameter, dimple_diameter, small_diameter, 
+           length_mm, high_head_pixels, down_head_pixels
+    FROM roller_data
+    WHERE roller_type = %s
+"""
+
+
+# Info field name and label template for each geometry column, in row order
+_ROLLER_INFO_FIELDS = (
+    ("outer_diameter", "{} mm"),
+    ("dimple_diameter", "{} mm"),
+    ("small_diameter", "{} mm"),
+    ("roller_length", "{} mm"),
+    ("high_head", "{} pixels"),
+    ("down_head", "{} pixels"),
+)
+
+# Info texts shown when the roller type is not in roller_data
+NO_ROLLER_INFO = {field: "No Data" for field, _ in _ROLLER_INFO_FIELDS}
+
+
+def format_roller(row):
+    """
+    Format a roller row into the texts of the roller info fields.
+    
+    Args:
+        row: Row from ALL_ROLLERS_QUERY or ROLLER_BY_TYPE_QUERY
+        
+    Returns:
+        dict: Info field name -> display text (e.g. outer_diameter="25 mm")
+    """
+    return {
+        field: template.format(value)
+        for (field, template), value in zip(_ROLLER_INFO_FIELDS, row)
+    }
+
+
+# Consecutive query failures back further retries off exponentially, so an
+# unreachable server is not hit (and reported) on every roller selection
+_MAX_BACKOFF_S = 30
+_failure_lock = threading.Lock()
+_failure_count = 0
+_retry_after = 0.0
+
+
+class DatabaseBackoff(Exception):
+    """Raised instead of querying while backing off after database failures."""
+
+
+def fetch_one(query, params=()):
+    """
+    Run a query on a pooled connection and return its first row.
+    
+    Args:
+        query: SQL query
+        params: Query parameters
+        
+    Returns:
+        tuple: First row, or None if there are no rows
+    """
+    return _run_query(query, params, fetch_all=False)
+
+
+def fetch_all(query, params=()):
+    """
+    Run a query on a pooled connection and return all of its rows.
+    
+    Args:
+        query: SQL query
+        params: Query parameters
+        
+    Returns:
+        list: Rows as tuples
+    """
+    return _run_query(query, params, fetch_all=True)
+
+
+def _run_query(query, params, fetch_all):
+    """Execute a query on a pooled connection and fetch one or all rows."""
+    global _failure_count, _retry_after
+    if _failure_count and time.monotonic() < _retry_after:
+        raise DatabaseBackoff(f"retrying in {_retry_after - time.monotonic():.1f}s")
+    
+    try:
+        rows = _execute(query, params, fetch_all)
+    except Exception:
+        with _failure_lock:
+            _failure_count += 1
+            _retry_after = time.monotonic() + min(_MAX_BACKOFF_S, 2 ** _failure_count)
+        raise
+    
+    if _failure_count:
+        with _failure_lock:
+            _failure_count = 0
+    return rows
+
+
+def _execute(query, params, fetch_all):
+    """Run a query on a pooled connection (no failure bookkeeping)."""
+    from database import get_connection_pool
+    
+    connection = get_connection_pool().get_connection()
+    try:
+        # Tuple rows; a dictionary cursor would build a dict per row
+        cursor = connection.cursor()
+        try:
+            cursor.execute(query, params)
+            return cursor.fetchall() if fetch_all else cursor.fetchone()
+        finally:
+            cursor.close()
+    finally:
+        # Returns the connection to the pool
+        connection.close()
+
+
+# roller_data rows by roller_type (None when not found), preloaded with one
+# query on first use. Roller geometry only changes through the Data tab, after
+# which the cache is invalidated.
+_roller_cache = {}
+_roller_cache_lock = threading.Lock()
+_roller_cache_generation = 0
+_roller_cache_preloaded = False
+
+# Roller type names for the dropdown. Also re-read once they are older than
+# _ROLLER_TYPES_TTL_S, in case roller_data was edited from another station.
+_ROLLER_TYPES_TTL_S = 60
+_roller_types = None
+_roller_types_loaded_at = 0.0
+
+
+def preload_rollers():
+    """
+    Load every roller into the cache with a single query.
+    
+    Returns:
+        tuple: Row of the first roller by type (the fallback when none is
+               selected), or None if roller_data is empty
+    """
+    rows = _load_all_rollers()
+    return rows[0] if rows else None
+
+
+def _load_all_rollers():
+    """Query every roller and cache both the rows and the roller type list."""
+    global _roller_cache_preloaded, _roller_types, _roller_types_loaded_at
+    generation = _roller_cache_generation
+    rows = fetch_all(ALL_ROLLERS_QUERY)
+    with _roller_cache_lock:
+        # Don't store rows read before an invalidation that happened meanwhile
+        if generation == _roller_cache_generation:
+            _roller_cache.update((row[6], row) for row in rows)
+            _roller_cache_preloaded = True
+            _roller_types = [row[6] for row in rows]
+            _roller_types_loaded_at = time.monotonic()
+    return rows
+
+
+def get_cached_roller(roller_type):
+    """
+    Look up a roller in the cache without touching the database.
+    
+    Args:
+        roller_type: Name of the roller type
+        
+    Returns:
+        tuple: (found, row) - found is False on a cache miss
+    """
+    with _roller_cache_lock:
+        if roller_type in _roller_cache:
+            return True, _roller_cache[roller_type]
+    return False, None
+
+
+def get_roller(roller_type):
+    """
+    Get a roller's roller_data row, querying the database on a cache miss.
+    
+    The first miss preloads every roller; later misses (roller types added
+    since) fall back to a single-roller query.
+    
+    Args:
+        roller_type: Name of the roller type
+        
+    Returns:
+        tuple: Row from roller_data, or None if the roller type does not exist
+    """
+    found, row = get_cached_roller(roller_type)
+    if found:
+        return row
+    
+    if not _roller_cache_preloaded:
+        preload_rollers()
+        found, row = get_cached_roller(roller_type)
+        if found:
+            return row
+    
+    generation = _roller_cache_generation
+    row = fetch_one(ROLLER_BY_TYPE_QUERY, (roller_type,))
+    with _roller_cache_lock:
+        # Don't store a row read before an invalidation that happened meanwhile
+        if generation == _roller_cache_generation:
+            _roller_cache[roller_type] = row
+    return row
+
+
+def get_cached_roller_types():
+    """
+    Get the cached roller type names without touching the database.
+    
+    Returns:
+        list: Roller types (a new list), or None if missing or stale
+    """
+    with _roller_cache_lock:
+        if (_roller_types is not None
+                and time.monotonic() - _roller_types_loaded_at < _ROLLER_TYPES_TTL_S):
+            return list(_roller_types)
+    return None
+
+
+def get_roller_types():
+    """
+    Get the roller type names, querying the database when the cached list
+    is missing or stale. A query also preloads every roller's row.
+    
+    Returns:
+        list: Roller types in alphabetical order (a new list per call)
+    """
+    cached = get_cached_roller_types()
+    if cached is not None:
+        return cached
+    
+    # Same single query as preload_rollers, so selecting any of the listed
+    # roller types is then served from the row cache
+    return [row[6] for row in _load_all_rollers()]
+
+
+def invalidate_roller_cache(roller_type=None):
+    """
+    Drop cached roller rows (and the roller type list) so the next lookup
+    re-reads the database.
+    
+    Args:
+        roller_type: Roller type to drop, or None to drop all of them
+    """
+    global _roller_cache_generation, _roller_cache_preloaded, _roller_types
+    with _roller_cache_lock:
+        _roller_cache_generation += 1
+        # Any roller_data edit may add, remove or rename a roller type
+        _roller_types = None
+        if roller_type is None:
+            _roller_cache.clear()
+            _roller_cache_preloaded = False
+        else:
+            _roller_cache.pop(roller_type, None)
+
+
+def query_async(widget, owner, fetch, on_result, error_message):
+    """
+    Run a roller query off the Tk thread and hand the row back to it.
+    
+    Only the most recent request of each owner is applied, so a slow query
+    cannot overwrite the info of a roller type selected after it, and the
+    owner's widgets are only ever touched on the Tk thread.
+    
+    Args:
+        widget: Widget the result is delivered through (dropped once destroyed)
+        owner: Panel whose _roller_request counter identifies the latest query
+        fetch: Called on the worker thread; returns the row (or None)
+        on_result: Called on the Tk thread with the row (or None)
+        error_message: Logged with the exception if the query fails
+    """
+    owner._roller_request += 1
+    request = owner._roller_request
+    
+    def deliver(result):
+        if request != owner._roller_request or not widget.winfo_exists():
+            return  # Superseded, or the panel was destroyed meanwhile
+        on_result(result)
+    
+    def worker():
+        try:
+            result = fetch()
+        except DatabaseBackoff:
+            return  # Recent failures were already logged; keep the shown info
+        except Exception as e:
+            log_error("inference", error_message, e)
+            return
+        try:
+            widget.after(0, deliver, result)
+        except (RuntimeError, tk.TclError):
+            pass  # Main loop is gone (application closing)
+    
+    threading.Thread(target=worker, name="RollerInfoQuery", daemon=True).start()
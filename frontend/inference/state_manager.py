@@ -4,9 +4,26 @@ Manages button and tab states during inspection start/stop
 """
 
 import tkinter as tk
+from tkinter import messagebox
 from ..utils.styles import Colors
 
 
+# Button looks used on inspection start/stop (built once, passed as **options)
+_DISABLED_GREY = {"state": tk.DISABLED, "bg": "#6c757d", "fg": Colors.WHITE}
+_ENABLED_RED = {"state": tk.NORMAL, "bg": Colors.DANGER, "fg": Colors.WHITE}
+_ENABLED_GREEN = {"state": tk.NORMAL, "bg": Colors.SUCCESS, "fg": Colors.WHITE}
+
+# Control panel widgets: (attribute, options while inspecting, options after stop).
+# None leaves the widget as it is; the Reset button after a stop is decided by
+# ControlPanel._on_stop_inspection (enabled only if there is data to reset).
+_CONTROL_TRANSITIONS = (
+    ("start_button", _DISABLED_GREY, _ENABLED_GREEN),
+    ("stop_button", _ENABLED_RED, _DISABLED_GREY),
+    ("reset_button", _DISABLED_GREY, None),
+    ("allow_images_checkbox", {"state": tk.DISABLED}, {"state": tk.NORMAL}),
+)
+
+
 class InspectionStateManager:
     """Manages UI state changes during inspection."""
     
@@ -18,7 +35,16 @@ class InspectionStateManager:
             app_instance: Reference to main WelVisionApp instance
         """
         self.app = app_instance
-        self.original_close_handler = None
+        
+        # Close handlers registered as Tcl commands once, so start/stop neither
+        # query the current handler nor register a new command on every switch
+        default_close = getattr(app_instance, 'on_closing', None) or app_instance.destroy
+        self._default_close_cmd = app_instance.register(default_close)
+        self._disabled_close_cmd = app_instance.register(self._on_disabled_close)
+        
+        # Inference tab and its status panel as last resolved by _status_panel()
+        self._inference_tab = None
+        self._status_panel_ref = None
         
     def on_inspection_start(self, control_panel):
         """
@@ -60,33 +86,21 @@ class InspectionStateManager:
         Args:
             control_panel: Reference to ControlPanel instance
         """
-        # 1. Disable Start button with grey color and white text
-        if control_panel.start_button:
-            control_panel.start_button.config(
-                state=tk.DISABLED,
-                bg="#6c757d",  # Grey
-                fg=Colors.WHITE  # White text
-            )
-        
-        # 2. Enable Stop button with red color and white text
-        if control_panel.stop_button:
-            control_panel.stop_button.config(
-                state=tk.NORMAL,
-                bg=Colors.DANGER,  # Red
-                fg=Colors.WHITE  # White text
-            )
-        
-        # 3. Disable Reset button with grey color and white text during inspection
-        if control_panel.reset_button:
-            control_panel.reset_button.config(
-                state=tk.DISABLED,
-                bg="#6c757d",  # Grey
-                fg=Colors.WHITE  # White text
-            )
+        self._apply_control_transitions(control_panel, running=True)
     
-        # 4. Disable Allow All Images checkbox during inspection
-        if hasattr(control_panel, 'allow_images_checkbox') and control_panel.allow_images_checkbox:
-            control_panel.allow_images_checkbox.config(state=tk.DISABLED)
+    def _apply_control_transitions(self, control_panel, running):
+        """
+        Set the control panel widgets to their inspection running/stopped look.
+        
+        Args:
+            control_panel: Reference to ControlPanel instance
+            running: True for the inspection running state, False for stopped
+        """
+        for attr, running_options, stopped_options in _CONTROL_TRANSITIONS:
+            options = running_options if running else stopped_options
+            widget = getattr(control_panel, attr, None)
+            if widget and options:
+                control_panel.apply_button_state(widget, **options)
     
     def on_inspection_stop(self, control_panel):
         """
@@ -95,29 +109,8 @@ class InspectionStateManager:
         Args:
             control_panel: Reference to ControlPanel instance
         """
-        # 1. Enable Start button with green color and white text
-        if control_panel.start_button:
-            control_panel.start_button.config(
-                state=tk.NORMAL,
-                bg=Colors.SUCCESS,  # Green
-                fg=Colors.WHITE  # White text
-            )
-        
-        # 2. Disable Stop button with grey color and white text
-        if control_panel.stop_button:
-            control_panel.stop_button.config(
-                state=tk.DISABLED,
-                bg="#6c757d",  # Grey
-                fg=Colors.WHITE  # White text
-            )
-        
-        # 3. Reset button state will be handled by _on_stop_inspection
-        #    It will check if there's data and enable accordingly
-        #    We don't set it here to avoid race conditions
-        
-        # 4. Re-enable Allow All Images checkbox
-        if hasattr(control_panel, 'allow_images_checkbox') and control_panel.allow_images_checkbox:
-            control_panel.allow_images_checkbox.config(state=tk.NORMAL)
+        # Start/Stop/Allow All back to idle (Reset is handled by the control panel)
+        self._apply_control_transitions(control_panel, running=False)
         
         # Unlock roller type selection
         self._unlock_roller_selection()
@@ -131,45 +124,46 @@ class InspectionStateManager:
         # 7. Enable all tabs with normal colors
         self._enable_all_tabs()
     
+    def _status_panel(self):
+        """
+        Get the inference tab's status panel.
+        
+        The reference is cached and only re-resolved when the app's inference
+        tab is replaced (or its status panel was not created yet).
+        
+        Returns:
+            StatusPanel, or None if there is no inference tab
+        """
+        inference_tab = getattr(self.app, 'inference_tab', None)
+        if inference_tab is not self._inference_tab or self._status_panel_ref is None:
+            self._inference_tab = inference_tab
+            self._status_panel_ref = getattr(inference_tab, 'status_panel', None)
+        return self._status_panel_ref
+    
     def _disable_logout_button(self):
         """Disable the logout button with grey color and white text."""
-        if hasattr(self.app, 'logout_button') and self.app.logout_button:
-            self.app.logout_button.config(
-                state=tk.DISABLED,
-                bg="#6c757d",  # Grey
-                fg=Colors.WHITE  # White text
-            )
+        logout_button = getattr(self.app, 'logout_button', None)
+        if logout_button:
+            logout_button.config(**_DISABLED_GREY)
     
     def _enable_logout_button(self):
         """Enable the logout button with red color and white text."""
-        if hasattr(self.app, 'logout_button') and self.app.logout_button:
-            self.app.logout_button.config(
-                state=tk.NORMAL,
-                bg=Colors.DANGER,  # Red
-                fg=Colors.WHITE  # White text
-            )
+        logout_button = getattr(self.app, 'logout_button', None)
+        if logout_button:
+            logout_button.config(**_ENABLED_RED)
     
     def _disable_window_close(self):
         """Disable the window close button (top right X)."""
-        # Store original handler
-        self.original_close_handler = self.app.protocol("WM_DELETE_WINDOW")
-        
-        # Set new handler that shows warning
-        self.app.protocol("WM_DELETE_WINDOW", self._on_disabled_close)
+        # Set handler that shows warning
+        self.app.protocol("WM_DELETE_WINDOW", self._disabled_close_cmd)
     
     def _enable_window_close(self):
         """Enable the window close button (top right X)."""
-        # Restore original handler or set default
-        if self.original_close_handler:
-            self.app.protocol("WM_DELETE_WINDOW", self.original_close_handler)
-        elif hasattr(self.app, 'on_closing'):
-            self.app.protocol("WM_DELETE_WINDOW", self.app.on_closing)
-        else:
-            self.app.protocol("WM_DELETE_WINDOW", self.app.destroy)
+        # Restore the app's close handler
+        self.app.protocol("WM_DELETE_WINDOW", self._default_close_cmd)
     
     def _on_disabled_close(self):
         """Show warning when trying to close during inspection."""
-        from tkinter import messagebox
         messagebox.showwarning(
             "Inspection Running",
             "⚠️ Please stop the inspection before closing the application."
@@ -177,51 +171,29 @@ class InspectionStateManager:
     
     def _disable_other_tabs(self):
         """Disable all navigation tabs except Inference and Diagnosis with red color and white text."""
-        if hasattr(self.app, 'navbar_manager') and self.app.navbar_manager:
-            navbar = self.app.navbar_manager
-            
+        navbar = getattr(self.app, 'navbar_manager', None)
+        if navbar:
             # Disable all buttons except 'inference' and 'diagnosis'
             for button_id, nav_button in navbar.buttons.items():
                 if button_id not in ["inference", "diagnosis"]:
-                    # Disable the button
-                    nav_button.button.config(
-                        state=tk.DISABLED,
-                        bg=Colors.DANGER,  # Red
-                        fg=Colors.WHITE,  # White text
-                        disabledforeground=Colors.WHITE  # White text when disabled
-                    )
-                    
-                    # Unbind hover events to prevent color restoration
-                    nav_button.button.unbind("<Enter>")
-                    nav_button.button.unbind("<Leave>")
+                    nav_button.lock()
     
     def _enable_all_tabs(self):
-        """Enable all navigation tabs with normal colors and restore hover events."""
-        if hasattr(self.app, 'navbar_manager') and self.app.navbar_manager:
-            navbar = self.app.navbar_manager
-            
-            # Enable all buttons and restore colors
-            for button_id, nav_button in navbar.buttons.items():
-                nav_button.button.config(state=tk.NORMAL)
-                
-                # Restore active/inactive colors
-                if nav_button.is_active:
-                    nav_button.button.config(bg=nav_button.active_bg)
-                else:
-                    nav_button.button.config(bg=nav_button.inactive_bg)
-                
-                # Re-bind hover events
-                nav_button.button.bind("<Enter>", nav_button._on_hover)
-                nav_button.button.bind("<Leave>", nav_button._on_leave)
+        """Enable all navigation tabs with normal colors."""
+        navbar = getattr(self.app, 'navbar_manager', None)
+        if navbar:
+            # Enable all buttons and restore colors (no-op for buttons never locked)
+            for nav_button in navbar.buttons.values():
+                nav_button.unlock()
     
     def _lock_roller_selection(self):
         """Lock roller type dropdown during inspection."""
-        if hasattr(self.app, 'inference_tab') and self.app.inference_tab:
-            if hasattr(self.app.inference_tab, 'status_panel') and self.app.inference_tab.status_panel:
-                self.app.inference_tab.status_panel.lock_roller_selection()
+        status_panel = self._status_panel()
+        if status_panel:
+            status_panel.lock_roller_selection()
     
     def _unlock_roller_selection(self):
         """Unlock roller type dropdown after inspection stops."""
-        if hasattr(self.app, 'inference_tab') and self.app.inference_tab:
-            if hasattr(self.app.inference_tab, 'status_panel') and self.app.inference_tab.status_panel:
-                self.app.inference_tab.status_panel.unlock_roller_selection()
+        status_panel = self._status_panel()
+        if status_panel:
+            status_panel.unlock_roller_selection()
@@ -3,13 +3,43 @@ Status Panel Component
 Displays roller type, date/time, machine mode, disc status, confidence thresholds, and AI models
 """
 
+import threading
 import tkinter as tk
 import tkinter.ttk as ttk
 from datetime import datetime
+from functools import lru_cache
 
-from frontend.utils.config import AppConfig
 from ..utils.styles import Colors, Fonts
 from ..utils.db_error_handler import DatabaseErrorHandler
+from .roller_queries import get_cached_roller_types, get_roller_types
+
+# Date & time display, e.g. "01/31/2025 02:05:09 PM"
+_DATETIME_FORMAT = "%m/%d/%Y %I:%M:%S %p"
+
+# Options of the labeled frame around each status section
+_SECTION_FRAME_KW = {
+    "font": Fonts.TEXT_BOLD, "fg": Colors.WHITE, "bg": Colors.PRIMARY_BG,
+    "bd": 2, "relief": tk.RIDGE
+}
+
+# Roller dropdown text while the roller types are being queried
+_LOADING_TEXT = "Loading..."
+
+
+@lru_cache(maxsize=None)
+def _conf_display(threshold):
+    """
+    Text and color of a confidence threshold display (memoized per value).
+    
+    Args:
+        threshold: Confidence threshold as a fraction, or None if not loaded
+        
+    Returns:
+        tuple: (text, color)
+    """
+    if threshold is None:
+        return "Not Available", "#ffff00"  # Yellow
+    return f"{int(threshold * 100)}.0%", "#00bfff"  # Sky blue
 
 
 class StatusPanel:
@@ -27,112 +57,159 @@ class StatusPanel:
         self.app = app_instance
         self.status_vars = {}
         
+        # Last (text, color) shown for the polled status fields
+        self._last_disc_status = None
+        self._last_machine_mode = None
+        self._last_time_str = None
+        self._conf_shown = {}  # (text, color) last shown per confidence field
+        self._time_after_id = None
+        self._alive = False  # Widgets exist (set by create, cleared on <Destroy>)
+        
+        # Incremented per roller type query; only the latest result is applied
+        self._roller_types_request = 0
+        self._roller_types_loading = False
+        
     def create(self):
         """Create the status panel UI."""
         # Main container - not expanding to full width
         container = tk.Frame(self.parent, bg=Colors.PRIMARY_BG)
         container.pack(anchor=tk.W, padx=5, pady=5)
-        
-        # Create status sections
-        self._create_roller_type_section(container, 0)
-        self._create_datetime_section(container, 1)
-        self._create_machine_mode_section(container, 2)
-        self._create_disc_status_section(container, 3)
-        self._create_confidence_section(container, 4)
-        self._create_ai_models_section(container, 5)
-        
-        # Configure grid weights - optimized width for all columns
-        for i in range(5):
-            container.grid_columnconfigure(i, weight=0, minsize=200)
-        # AI Models column gets extra width
-        container.grid_columnconfigure(5, weight=0, minsize=250)
+        # Stop the clock and the updaters when the tab is torn down
+        container.bind("<Destroy>", self.destroy, add="+")
+        self._alive = True
+        
+        # Create status sections, one grid column each (title, builder, min width)
+        sections = (
+            ("Roller Type", self._create_roller_type_section, 200),
+            ("Date & Time", self._create_datetime_section, 200),
+            ("Machine Mode", self._create_machine_mode_section, 200),
+            ("Disc Status", self._create_disc_status_section, 200),
+            ("Confidence Thresholds", self._create_confidence_section, 200),
+            ("AI Models", self._create_ai_models_section, 250),  # Model names need extra width
+        )
+        for column, (title, build, minsize) in enumerate(sections):
+            build(self._create_section_frame(container, title, column))
+            container.grid_columnconfigure(column, weight=0, minsize=minsize)
         
         return container
     
     def _create_section_frame(self, parent, title, column):
         """Create a labeled frame for a status section."""
-        frame = tk.LabelFrame(
-            parent,
-            text=title,
-            font=Fonts.TEXT_BOLD,
-            fg=Colors.WHITE,
-            bg=Colors.PRIMARY_BG,
-            bd=2,
-            relief=tk.RIDGE
-        )
+        frame = tk.LabelFrame(parent, text=title, **_SECTION_FRAME_KW)
         frame.grid(row=0, column=column, padx=6, pady=2, sticky="nsew")
         return frame
     
-    def _create_roller_type_section(self, parent, column):
+    def _create_roller_type_section(self, frame):
         """Create roller type section with dropdown."""
-        frame = self._create_section_frame(parent, "Roller Type", column)
-        
-        # Get roller types from database
-        roller_types = self._get_roller_types()
-        
         self.status_vars['roller_type'] = tk.StringVar(value="")
         
-        # Create dropdown for roller selection
+        # Create dropdown for roller selection (filled by _apply_roller_types)
         self.roller_dropdown = ttk.Combobox(
             frame,
             textvariable=self.status_vars['roller_type'],
-            values=roller_types,
+            values=[],
             state="readonly",
             font=Fonts.TEXT,
-            width=15
+            width=15,
+            postcommand=self._refresh_values_on_open
         )
         self.roller_dropdown.pack(padx=8, pady=8, fill=tk.X)
         
         # Bind selection event
         self.roller_dropdown.bind("<<ComboboxSelected>>", self._on_roller_selected)
         
-        # Check if there's a previously selected roller type in app
-        previously_selected = getattr(self.app, 'selected_roller_type', None)
+        # Get roller types from database
+        self._load_roller_types()
+    
+    def _refresh_values_on_open(self):
+        """Re-read a stale roller type list when the dropdown is opened."""
+        if self._roller_types_loading or get_cached_roller_types() is not None:
+            return  # Already loading, or the shown list is still fresh
+        # The list opens with the current values; the new ones replace them
+        # when the query returns
+        self._load_roller_types(background=True)
+    
+    def _load_roller_types(self, background=False):
+        """
+        Fill the roller dropdown, querying the database off the Tk thread.
+        
+        A cached roller type list is applied immediately; otherwise the
+        dropdown shows "Loading..." (disabled) until the query returns.
         
-        if previously_selected and previously_selected in roller_types:
-            # Restore previous selection
-            self.roller_dropdown.set(previously_selected)
-            self._load_roller_info(previously_selected)
-        elif roller_types:
-            # No previous selection - use first roller
+        Args:
+            background: Keep the current list usable while querying, and
+                        keep it (without an error popup) if the query fails
+        """
+        self._roller_types_request += 1
+        request = self._roller_types_request
+        
+        cached = get_cached_roller_types()
+        if cached is not None:
+            self._apply_roller_types(cached)
+            return
+        
+        if not background:
+            self._roller_types_loading = True
+            self.roller_dropdown.config(values=[_LOADING_TEXT], state="disabled")
+            self.roller_dropdown.set(_LOADING_TEXT)
+        
+        def deliver(roller_types, error):
+            if request != self._roller_types_request or not self.roller_dropdown.winfo_exists():
+                return  # Superseded, or the tab was closed meanwhile
+            if error is not None:
+                print(f"❌ Database error during fetching roller types: {error}")
+                if background:
+                    return
+                DatabaseErrorHandler.handle_db_error(error, self.parent, "fetching roller types")
+                roller_types = []
+            self._apply_roller_types(roller_types)
+        
+        def worker():
+            # Never touches Tk; the result is handed back through after()
+            try:
+                roller_types, error = get_roller_types(), None
+            except Exception as e:
+                roller_types, error = None, e
+            try:
+                self.parent.after(0, deliver, roller_types, error)
+            except (RuntimeError, tk.TclError):
+                pass  # Main loop is gone (application closing)
+        
+        threading.Thread(target=worker, name="RollerTypesQuery", daemon=True).start()
+    
+    def _apply_roller_types(self, roller_types):
+        """
+        Show the roller types in the dropdown and preserve the selection.
+        
+        Args:
+            roller_types: Roller type names (may be empty)
+        """
+        self._roller_types_loading = False
+        roller_types = roller_types or ["No Rollers"]
+        
+        # Get current selection (from dropdown or app's saved selection)
+        current_selection = self.status_vars['roller_type'].get()
+        if current_selection in ("", "No Rollers", _LOADING_TEXT):
+            current_selection = getattr(self.app, 'selected_roller_type', None)
+        
+        # Block dropdown if inspection is already running
+        running = getattr(self.app, 'inspection_running', False)
+        self.roller_dropdown.config(values=roller_types, state="disabled" if running else "readonly")
+        
+        # Restore selection if it still exists, otherwise select first
+        if current_selection and current_selection in roller_types:
+            self.roller_dropdown.set(current_selection)
+            # Reload the roller info to get updated values
+            self._load_roller_info(current_selection)
+            # Ensure it's saved in app
+            self.app.selected_roller_type = current_selection
+        elif roller_types[0] != "No Rollers":
             self.roller_dropdown.set(roller_types[0])
             self._load_roller_info(roller_types[0])
             # Save to app
             self.app.selected_roller_type = roller_types[0]
-        
-        # Block dropdown if inspection is already running
-        if hasattr(self.app, 'inspection_running') and self.app.inspection_running:
-            self.roller_dropdown.config(state="disabled")
-    
-    def _get_roller_types(self):
-        """Get list of roller types from database."""
-        def _fetch_rollers():
-            import mysql.connector
-            
-            connection = mysql.connector.connect(
-                host=AppConfig.DB_HOST,
-                user=AppConfig.DB_USER,
-                password=AppConfig.DB_PASSWORD,
-                database=AppConfig.DB_DATABASE
-            )
-            
-            cursor = connection.cursor()
-            cursor.execute("SELECT roller_type FROM roller_data ORDER BY roller_type")
-            
-            roller_types = [row[0] for row in cursor.fetchall()]
-            
-            cursor.close()
-            connection.close()
-            
-            return roller_types if roller_types else ["No Rollers"]
-        
-        return DatabaseErrorHandler.safe_db_operation(
-            _fetch_rollers,
-            parent_widget=self.parent,
-            context="fetching roller types",
-            default_return=["No Rollers"],
-            show_error=True
-        )
+        else:
+            self.roller_dropdown.set("No Rollers")
     
     def _on_roller_selected(self, event=None):
         """Handle roller selection from dropdown."""
@@ -157,35 +234,12 @@ class StatusPanel:
     
     def refresh_roller_list(self):
         """Refresh the roller dropdown list from database and preserve selection."""
-        roller_types = self._get_roller_types()
-        
-        # Get current selection (from dropdown or app's saved selection)
-        current_selection = self.status_vars['roller_type'].get()
-        if not current_selection or current_selection == "No Rollers":
-            current_selection = getattr(self.app, 'selected_roller_type', None)
-        
-        self.roller_dropdown['values'] = roller_types
-        
-        # Restore selection if it still exists, otherwise select first
-        if current_selection and current_selection in roller_types:
-            self.roller_dropdown.set(current_selection)
-            # Reload the roller info to get updated values
-            self._load_roller_info(current_selection)
-            # Ensure it's saved in app
-            self.app.selected_roller_type = current_selection
-        elif roller_types and roller_types[0] != "No Rollers":
-            self.roller_dropdown.set(roller_types[0])
-            self._load_roller_info(roller_types[0])
-            # Save to app
-            self.app.selected_roller_type = roller_types[0]
-        else:
-            self.roller_dropdown.set("No Rollers")
+        self._load_roller_types()
     
-    def _create_datetime_section(self, parent, column):
+    def _create_datetime_section(self, frame):
         """Create date & time section."""
-        frame = self._create_section_frame(parent, "Date & Time", column)
-        
-        self.status_vars['datetime'] = tk.StringVar(value=datetime.now().strftime("%m/%d/%Y %I:%M:%S %p"))
+        self._last_time_str = datetime.now().strftime(_DATETIME_FORMAT)
+        self.status_vars['datetime'] = tk.StringVar(value=self._last_time_str)
         label = tk.Label(
             frame,
             textvariable=self.status_vars['datetime'],
@@ -201,13 +255,30 @@ class StatusPanel:
     
     def _update_time(self):
         """Update the time display."""
-        self.status_vars['datetime'].set(datetime.now().strftime("%m/%d/%Y %I:%M:%S %p"))
-        self.parent.after(1000, self._update_time)
+        self._time_after_id = None
+        if not self.parent.winfo_exists():
+            return
+        now = datetime.now()
+        time_str = now.strftime(_DATETIME_FORMAT)
+        if time_str != self._last_time_str:
+            self.status_vars['datetime'].set(time_str)
+            self._last_time_str = time_str
+        # Tick just after the next wall-clock second so timer drift never
+        # lands two ticks in one displayed second (or skips one)
+        self._time_after_id = self.parent.after(1000 - now.microsecond // 1000, self._update_time)
+    
+    def destroy(self, event=None):
+        """Cancel the pending clock update and stop the display updaters."""
+        self._alive = False
+        if self._time_after_id is not None:
+            try:
+                self.parent.after_cancel(self._time_after_id)
+            except tk.TclError:
+                pass  # Interpreter already gone
+            self._time_after_id = None
     
-    def _create_machine_mode_section(self, parent, column):
+    def _create_machine_mode_section(self, frame):
         """Create machine mode section."""
-        frame = self._create_section_frame(parent, "Machine Mode", column)
-        
         self.status_vars['machine_mode'] = tk.StringVar(value="Not Available")
         self.machine_mode_label = tk.Label(
             frame,
@@ -219,10 +290,8 @@ class StatusPanel:
         )
         self.machine_mode_label.pack(padx=8, pady=8, fill=tk.BOTH, expand=True)
     
-    def _create_disc_status_section(self, parent, column):
+    def _create_disc_status_section(self, frame):
         """Create disc status section."""
-        frame = self._create_section_frame(parent, "Disc Status", column)
-        
         self.status_vars['disc_status'] = tk.StringVar(value="Not Available")
         
         self.disc_label = tk.Label(
@@ -235,10 +304,8 @@ class StatusPanel:
         )
         self.disc_label.pack(padx=8, pady=8, fill=tk.BOTH, expand=True)
     
-    def _create_confidence_section(self, parent, column):
+    def _create_confidence_section(self, frame):
         """Create confidence thresholds section."""
-        frame = self._create_section_frame(parent, "Confidence Thresholds", column)
-        
         inner_frame = tk.Frame(frame, bg=Colors.PRIMARY_BG)
         inner_frame.pack(padx=8, pady=5, fill=tk.BOTH, expand=True)
         
@@ -255,12 +322,7 @@ class StatusPanel:
         ).pack(side=tk.LEFT, padx=(0, 5))
         
         # Check if BF confidence threshold is available
-        if self.app.bf_conf_threshold is not None:
-            bf_conf_value = f"{int(self.app.bf_conf_threshold * 100)}.0%"
-            bf_conf_color = "#00bfff"  # Sky blue
-        else:
-            bf_conf_value = "Not Available"
-            bf_conf_color = "#ffff00"  # Yellow
+        bf_conf_value, bf_conf_color = self._conf_shown['bf_conf'] = _conf_display(self.app.bf_conf_threshold)
         
         self.status_vars['bf_conf'] = tk.StringVar(value=bf_conf_value)
         self.bf_conf_label = tk.Label(
@@ -285,12 +347,7 @@ class StatusPanel:
         ).pack(side=tk.LEFT, padx=(0, 5))
         
         # Check if OD confidence threshold is available
-        if self.app.od_conf_threshold is not None:
-            od_conf_value = f"{int(self.app.od_conf_threshold * 100)}.0%"
-            od_conf_color = "#00bfff"  # Sky blue
-        else:
-            od_conf_value = "Not Available"
-            od_conf_color = "#ffff00"  # Yellow
+        od_conf_value, od_conf_color = self._conf_shown['od_conf'] = _conf_display(self.app.od_conf_threshold)
         
         self.status_vars['od_conf'] = tk.StringVar(value=od_conf_value)
         self.od_conf_label = tk.Label(
@@ -302,10 +359,8 @@ class StatusPanel:
         )
         self.od_conf_label.pack(side=tk.LEFT)
     
-    def _create_ai_models_section(self, parent, column):
+    def _create_ai_models_section(self, frame):
         """Create AI models section."""
-        frame = self._create_section_frame(parent, "AI Models", column)
-        
         inner_frame = tk.Frame(frame, bg=Colors.PRIMARY_BG)
         inner_frame.pack(padx=8, pady=5, fill=tk.BOTH, expand=True)
         
@@ -363,63 +418,55 @@ class StatusPanel:
     
     def update_disc_status(self, status, color=None):
         """Update disc status display."""
+        if (status, color) == self._last_disc_status:
+            return  # Unchanged since the last poll
+        self._last_disc_status = (status, color)
         self.status_vars['disc_status'].set(status)
         if color:
             self.disc_label.config(fg=color)
     
     def update_machine_mode(self, mode, color=None):
         """Update machine mode display."""
+        if (mode, color) == self._last_machine_mode:
+            return  # Unchanged since the last poll
+        self._last_machine_mode = (mode, color)
         self.status_vars['machine_mode'].set(mode)
         if color:
             self.machine_mode_label.config(fg=color)
     
     def update_confidence_thresholds(self):
         """Update confidence threshold displays."""
-        try:
-            # Update BF confidence
-            if self.app.bf_conf_threshold is not None:
-                self.status_vars['bf_conf'].set(f"{int(self.app.bf_conf_threshold * 100)}.0%")
-                if hasattr(self, 'bf_conf_label') and self.bf_conf_label.winfo_exists():
-                    self.bf_conf_label.config(fg="#00bfff")  # Sky blue
-            else:
-                self.status_vars['bf_conf'].set("Not Available")
-                if hasattr(self, 'bf_conf_label') and self.bf_conf_label.winfo_exists():
-                    self.bf_conf_label.config(fg="#ffff00")  # Yellow
-            
-            # Update OD confidence
-            if self.app.od_conf_threshold is not None:
-                self.status_vars['od_conf'].set(f"{int(self.app.od_conf_threshold * 100)}.0%")
-                if hasattr(self, 'od_conf_label') and self.od_conf_label.winfo_exists():
-                    self.od_conf_label.config(fg="#00bfff")  # Sky blue
-            else:
-                self.status_vars['od_conf'].set("Not Available")
-                if hasattr(self, 'od_conf_label') and self.od_conf_label.winfo_exists():
-                    self.od_conf_label.config(fg="#ffff00")  # Yellow
-        except tk.TclError as e:
-            # Widget was destroyed, ignore the error
-            print(f"⚠️ Could not update confidence thresholds: Widget no longer exists")
+        if not self._alive:
+            return  # Panel not built yet, or already destroyed
+        
+        # Update BF and OD confidence, touching Tk only when the display changes
+        for key, label, threshold in (
+            ('bf_conf', self.bf_conf_label, self.app.bf_conf_threshold),
+            ('od_conf', self.od_conf_label, self.app.od_conf_threshold),
+        ):
+            display = _conf_display(threshold)
+            if display != self._conf_shown.get(key):
+                text, color = display
+                self.status_vars[key].set(text)
+                label.config(fg=color)
+                self._conf_shown[key] = display
     
     def update_model_names(self):
         """Update AI model names from app."""
-        try:
-            # Update BF model
-            if hasattr(self.app, 'selected_bf_model_name'):
-                bf_model_name = self.app.selected_bf_model_name if self.app.selected_bf_model_name else "No Model Available"
-                bf_model_color = "#4CAF50" if self.app.selected_bf_model_path else "#ffff00"
-                self.status_vars['bf_model'].set(bf_model_name)
-                if hasattr(self, 'bf_model_label') and self.bf_model_label.winfo_exists():
-                    self.bf_model_label.config(fg=bf_model_color)
-            
-            # Update OD model
-            if hasattr(self.app, 'selected_od_model_name'):
-                od_model_name = self.app.selected_od_model_name if self.app.selected_od_model_name else "No Model Available"
-                od_model_color = "#4CAF50" if self.app.selected_od_model_path else "#ffff00"
-                self.status_vars['od_model'].set(od_model_name)
-                if hasattr(self, 'od_model_label') and self.od_model_label.winfo_exists():
-                    self.od_model_label.config(fg=od_model_color)
-        except tk.TclError as e:
-            # Widget was destroyed, ignore the error
-            print(f"⚠️ Could not update model names: Widget no longer exists")
+        if not self._alive:
+            return  # Panel not built yet, or already destroyed
+        
+        # Update BF model
+        bf_model_name = self.app.selected_bf_model_name if self.app.selected_bf_model_name else "No Model Available"
+        bf_model_color = "#4CAF50" if self.app.selected_bf_model_path else "#ffff00"
+        self.status_vars['bf_model'].set(bf_model_name)
+        self.bf_model_label.config(fg=bf_model_color)
+        
+        # Update OD model
+        od_model_name = self.app.selected_od_model_name if self.app.selected_od_model_name else "No Model Available"
+        od_model_color = "#4CAF50" if self.app.selected_od_model_path else "#ffff00"
+        self.status_vars['od_model'].set(od_model_name)
+        self.od_model_label.config(fg=od_model_color)
     
     def lock_roller_selection(self):
         """Lock the roller type dropdown during inspection."""
@@ -428,5 +475,7 @@ class StatusPanel:
     
     def unlock_roller_selection(self):
         """Unlock the roller type dropdown after inspection stops."""
+        if self._roller_types_loading:
+            return  # _apply_roller_types unlocks it once the list arrives
         if hasattr(self, 'roller_dropdown') and self.roller_dropdown:
             self.roller_dropdown.config(state="readonly")
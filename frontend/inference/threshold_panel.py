@@ -7,6 +7,22 @@ import tkinter as tk
 import tkinter.ttk as ttk
 from ..utils.styles import Colors, Fonts
 
+# Delay after the last slider movement before the threshold is stored
+_THRESHOLD_WRITE_DELAY_MS = 150
+
+# Options shared by every slider row's widgets, built once rather than per row
+_ROW_FRAME_KW = {"bg": Colors.PRIMARY_BG}
+_ROW_GRID_KW = {"column": 0, "sticky": "ew", "padx": 10, "pady": 5}
+_ROW_LABEL_KW = {"font": Fonts.SMALL, "fg": Colors.WHITE, "bg": Colors.PRIMARY_BG}
+_SLIDER_KW = {"from_": 0, "to": 100, "orient": tk.HORIZONTAL, "length": 200}
+
+
+def _add_bindtag(widget, tag):
+    """Put a bind tag first on a widget and all of its descendants."""
+    widget.bindtags((tag,) + widget.bindtags())
+    for child in widget.winfo_children():
+        _add_bindtag(child, tag)
+
 
 class ThresholdPanel:
     """Panel for displaying and adjusting defect thresholds."""
@@ -22,6 +38,8 @@ class ThresholdPanel:
         self.parent = parent
         self.app = app_instance
         self.slider_values = {}
+        self._pending_writes = {}  # (is_od, defect) -> after id of the threshold write
+        self._shown_values = {}  # (is_od, defect) -> whole percent shown on the value label
         
     def setup(self):
         """Setup the threshold panel UI."""
@@ -108,18 +126,17 @@ class ThresholdPanel:
         
         canvas.bind('<Configure>', update_scroll_region)
         
-        # Optimized mousewheel scrolling
+        # Mousewheel scrolling (Button-4/5 are the X11 wheel events)
         def on_mousewheel(event):
-            canvas.yview_scroll(-1 if event.delta > 0 else 1, "units")
+            up = event.num == 4 or (event.num != 5 and event.delta > 0)
+            canvas.yview_scroll(-1 if up else 1, "units")
         
-        def bind_mousewheel(event=None):
-            canvas.bind_all("<MouseWheel>", on_mousewheel)
-        
-        def unbind_mousewheel(event=None):
-            canvas.unbind_all("<MouseWheel>")
-        
-        canvas.bind("<Enter>", bind_mousewheel)
-        canvas.bind("<Leave>", unbind_mousewheel)
+        # Wheel events go to the widget under the pointer, so the section's
+        # widgets all share a bind tag that scrolls this canvas; no global
+        # bind_all/unbind_all on every <Enter>/<Leave>
+        wheel_tag = f"ThresholdWheel{'OD' if is_od else 'BF'}"
+        for sequence in ("<MouseWheel>", "<Button-4>", "<Button-5>"):
+            canvas.bind_class(wheel_tag, sequence, on_mousewheel)
         
         # Create frame for sliders
         sliders_frame = tk.Frame(canvas, bg=Colors.PRIMARY_BG)
@@ -141,6 +158,8 @@ class ThresholdPanel:
             )
             no_data_label.pack()
         
+        _add_bindtag(canvas, wheel_tag)
+        
         return section_frame
     
     def _create_slider(self, parent, defect_name, default_value, row, is_od):
@@ -155,48 +174,28 @@ class ThresholdPanel:
             is_od: Whether this is for OD camera
         """
         # Container frame
-        frame = tk.Frame(parent, bg=Colors.PRIMARY_BG)
-        frame.grid(row=row, column=0, sticky="ew", padx=10, pady=5)
+        frame = tk.Frame(parent, **_ROW_FRAME_KW)
+        frame.grid(row=row, **_ROW_GRID_KW)
         
         # Label
-        label = tk.Label(
-            frame,
-            text=defect_name,
-            font=Fonts.SMALL,
-            fg=Colors.WHITE,
-            bg=Colors.PRIMARY_BG,
-            width=20,
-            anchor="w"
-        )
-        label.pack(side=tk.LEFT, padx=5)
+        tk.Label(
+            frame, text=defect_name, width=20, anchor="w", **_ROW_LABEL_KW
+        ).pack(side=tk.LEFT, padx=5)
+        
+        # Value label
+        value_label = tk.Label(frame, text=f"{default_value}%", width=5, **_ROW_LABEL_KW)
         
-        # Slider
+        # Slider (value and command set at creation: no extra configure calls)
         slider = ttk.Scale(
             frame,
-            from_=0,
-            to=100,
-            orient=tk.HORIZONTAL,
-            length=200
+            value=default_value,
+            command=lambda val, lbl=value_label, defect=defect_name, is_od_val=is_od:
+                self._update_threshold(val, lbl, defect, is_od_val),
+            **_SLIDER_KW
         )
-        slider.set(default_value)
         slider.pack(side=tk.LEFT, fill=tk.X, expand=True, padx=5)
-        
-        # Value label
-        value_label = tk.Label(
-            frame,
-            text=f"{default_value}%",
-            font=Fonts.SMALL,
-            fg=Colors.WHITE,
-            bg=Colors.PRIMARY_BG,
-            width=5
-        )
         value_label.pack(side=tk.RIGHT, padx=5)
-        
-        # Configure slider command
-        slider.configure(
-            command=lambda val, lbl=value_label, defect=defect_name, is_od_val=is_od:
-                self._update_threshold(val, lbl, defect, is_od_val)
-        )
+        self._shown_values[(is_od, defect_name)] = int(default_value)
         
         # Store slider reference
         key = f"{'od' if is_od else 'bf'}_{defect_name}"
@@ -212,11 +211,40 @@ class ThresholdPanel:
             defect: Defect name
             is_od: Whether this is for OD camera
         """
-        # Update label
-        label.config(text=f"{int(float(val))}%")
+        value = int(float(val))
+        
+        # The scale is continuous, so most drag events stay within the same
+        # whole percent; those change neither the label nor the threshold
+        key = (is_od, defect)
+        if self._shown_values.get(key) == value:
+            return
+        self._shown_values[key] = value
+        
+        # Update label (live feedback while dragging)
+        label.config(text=f"{value}%")
+        
+        # Debounced threshold write: a drag fires on every pixel, so only the
+        # value the slider settles on is stored
+        pending_id = self._pending_writes.get(key)
+        if pending_id:
+            label.after_cancel(pending_id)
+        self._pending_writes[key] = label.after(
+            _THRESHOLD_WRITE_DELAY_MS, self._write_threshold, defect, is_od, value
+        )
+    
+    def _write_threshold(self, defect, is_od, value):
+        """
+        Store a settled slider value in the app's thresholds.
+        
+        Args:
+            defect: Defect name
+            is_od: Whether this is for OD camera
+            value: Threshold in percent
+        """
+        self._pending_writes.pop((is_od, defect), None)
         
         # Update threshold in app
         if is_od:
-            self.app.od_defect_thresholds[defect] = int(float(val))
+            self.app.od_defect_thresholds[defect] = value
         else:
-            self.app.bf_defect_thresholds[defect] = int(float(val))
+            self.app.bf_defect_thresholds[defect] = value
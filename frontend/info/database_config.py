@@ -296,6 +296,7 @@ User: {AppConfig.DB_USER}"""
         AppConfig.DB_DATABASE = database
         AppConfig.DB_USER = user
         AppConfig.DB_PASSWORD = password
+        self._apply_connection_settings()
         
         # Update config.py file
         try:
@@ -351,6 +352,18 @@ User: {AppConfig.DB_USER}"""
                 f"Failed to update config.py:\n{str(e)}"
             )
     
+    def _apply_connection_settings(self):
+        """Make pooled connections and cached roller data follow the new AppConfig."""
+        from database import reset_connection_pool
+        from ..inference.roller_queries import invalidate_roller_cache
+        from .info_database import InfoDatabase
+        
+        reset_connection_pool()
+        # Rows read from the previous database must not be shown for this one
+        invalidate_roller_cache()
+        # The new database may not have app_settings yet
+        InfoDatabase._schema_ready = False
+    
     def reset_to_default(self):
         """Reset database configuration to default values."""
         response = messagebox.askyesno(
@@ -394,6 +407,7 @@ User: {AppConfig.DB_USER}"""
             AppConfig.DB_DATABASE = default_database
             AppConfig.DB_USER = default_user
             AppConfig.DB_PASSWORD = default_password
+            self._apply_connection_settings()
             
             # Update config.py file
             try:
@@ -8,20 +8,45 @@ from datetime import datetime
 from ..utils.config import AppConfig
 from ..utils.db_error_handler import DatabaseErrorHandler
 
+# Threshold history rows of one table within a date range (BF/OD type label)
+_HISTORY_SELECT = """
+    SELECT id, '{label}' as type, model_name, employee_id, change_timestamp, 
+           defect_threshold, size_threshold, model_threshold
+    FROM {table}
+    WHERE DATE(change_timestamp) BETWEEN %s AND %s
+"""
+_BF_HISTORY = _HISTORY_SELECT.format(label="BF", table="bf_threshold_history")
+_OD_HISTORY = _HISTORY_SELECT.format(label="OD", table="od_threshold_history")
+
+# (query, number of date ranges it takes) per filter type. Newest first; on
+# equal timestamps BF rows precede OD rows.
+_THRESHOLD_HISTORY_QUERIES = {
+    'BF': (_BF_HISTORY + "ORDER BY change_timestamp DESC", 1),
+    'OD': (_OD_HISTORY + "ORDER BY change_timestamp DESC", 1),
+    'Overall': (_BF_HISTORY + "UNION ALL" + _OD_HISTORY + "ORDER BY change_timestamp DESC, type", 2),
+}
+
 
 class InfoDatabase:
     """Database handler for info tab operations."""
     
+    # Whether app_settings is known to exist in the configured database
+    _schema_ready = False
+    
     def __init__(self, host=None, user=None, password=None, database=None):
         """
         Initialize database connection.
         
+        Without explicit connection settings, connections are borrowed from
+        the shared pool for the duration of each operation.
+        
         Args:
             host: MySQL server host (defaults to AppConfig.DB_HOST)
             user: Database username (defaults to AppConfig.DB_USER)
             password: Database password (defaults to AppConfig.DB_PASSWORD)
             database: Database name (defaults to AppConfig.DB_DATABASE)
         """
+        self.use_pool = not any((host, user, password, database))
         self.host = host or AppConfig.DB_HOST
         self.user = user or AppConfig.DB_USER
         self.password = password or AppConfig.DB_PASSWORD
@@ -31,6 +56,13 @@ class InfoDatabase:
     def connect(self):
         """Establish database connection."""
         try:
+            if self.use_pool:
+                from database import get_connection_pool
+                
+                # The pool checks (and if needed reconnects) the socket on checkout
+                self.connection = get_connection_pool().get_connection()
+                return True
+            
             self.connection = mysql.connector.connect(
                 host=self.host,
                 user=self.user,
@@ -42,13 +74,38 @@ class InfoDatabase:
         except Exception as e:
             print(f"❌ Error connecting to MySQL database: {e}")
             DatabaseErrorHandler.handle_db_error(e, context="database connection")
+            self.connection = None
             return False
     
     def disconnect(self):
-        """Close database connection."""
-        if self.connection and self.connection.is_connected():
+        """Close database connection (returns it to the pool when pooled)."""
+        if self.use_pool:
+            if self.connection:
+                self.connection.close()
+                self.connection = None
+        elif self.connection and self.connection.is_connected():
             self.connection.close()
     
+    def _release(self):
+        """Hand a pooled connection back after an operation (direct ones stay open)."""
+        if self.use_pool:
+            self.disconnect()
+    
+    def _ensure_app_settings(self, cursor):
+        """Create the app_settings table unless this process already did."""
+        if InfoDatabase._schema_ready:
+            return
+        cursor.execute("""
+            CREATE TABLE IF NOT EXISTS app_settings (
+                id INT AUTO_INCREMENT PRIMARY KEY,
+                setting_key VARCHAR(100) UNIQUE,
+                setting_value TEXT,
+                updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
+                updated_by VARCHAR(100)
+            )
+        """)
+        InfoDatabase._schema_ready = True
+    
     def get_app_title(self):
         """
         Get current application title from database.
@@ -57,7 +114,7 @@ class InfoDatabase:
             str: Application title or default "WELVISION"
         """
         try:
-            if not self.connection or not self.connection.is_connected():
+            if self.use_pool or not self.connection or not self.connection.is_connected():
                 if not self.connect():
                     # Connection failed, return default
                     return "WELVISION"
@@ -68,16 +125,8 @@ class InfoDatabase:
             
             cursor = self.connection.cursor()
             
-            # Create table if not exists
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS app_settings (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    setting_key VARCHAR(100) UNIQUE,
-                    setting_value TEXT,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    updated_by VARCHAR(100)
-                )
-            """)
+            # Create table if not exists (once per process)
+            self._ensure_app_settings(cursor)
             
             # Get title
             cursor.execute("SELECT setting_value FROM app_settings WHERE setting_key = 'app_title'")
@@ -94,6 +143,9 @@ class InfoDatabase:
             print(f"❌ Error getting app title: {e}")
             DatabaseErrorHandler.handle_db_error(e, context="getting app title")
             return "WELVISION"
+        finally:
+            # Return a pooled connection as soon as the operation is done
+            self._release()
     
     def update_app_title(self, new_title, updated_by):
         """
@@ -107,7 +159,7 @@ class InfoDatabase:
             bool: True if successful, False otherwise
         """
         try:
-            if not self.connection or not self.connection.is_connected():
+            if self.use_pool or not self.connection or not self.connection.is_connected():
                 if not self.connect():
                     # Connection failed
                     return False
@@ -118,16 +170,8 @@ class InfoDatabase:
             
             cursor = self.connection.cursor()
             
-            # Create table if not exists
-            cursor.execute("""
-                CREATE TABLE IF NOT EXISTS app_settings (
-                    id INT AUTO_INCREMENT PRIMARY KEY,
-                    setting_key VARCHAR(100) UNIQUE,
-                    setting_value TEXT,
-                    updated_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP ON UPDATE CURRENT_TIMESTAMP,
-                    updated_by VARCHAR(100)
-                )
-            """)
+            # Create table if not exists (once per process)
+            self._ensure_app_settings(cursor)
             
             # Update or insert title
             cursor.execute("""
@@ -148,6 +192,9 @@ class InfoDatabase:
             print(f"❌ Error updating app title: {e}")
             DatabaseErrorHandler.handle_db_error(e, context="updating app title")
             return False
+        finally:
+            # Return a pooled connection as soon as the operation is done
+            self._release()
     
     def get_threshold_history(self, filter_type='Overall', from_date=None, to_date=None):
         """
@@ -162,7 +209,7 @@ class InfoDatabase:
             list: List of threshold history records
         """
         try:
-            if not self.connection or not self.connection.is_connected():
+            if self.use_pool or not self.connection or not self.connection.is_connected():
                 if not self.connect():
                     # Connection failed
                     return []
@@ -171,41 +218,16 @@ class InfoDatabase:
             if not self.connection:
                 return []
             
-            cursor = self.connection.cursor()
-            
-            results = []
-            
-            # Query BF history if needed
-            if filter_type in ['BF', 'Overall']:
-                query = """
-                    SELECT id, 'BF' as type, model_name, employee_id, change_timestamp, 
-                           defect_threshold, size_threshold, model_threshold
-                    FROM bf_threshold_history
-                    WHERE DATE(change_timestamp) BETWEEN %s AND %s
-                    ORDER BY change_timestamp DESC
-                """
-                cursor.execute(query, (from_date, to_date))
-                bf_results = cursor.fetchall()
-                results.extend(bf_results)
-            
-            # Query OD history if needed
-            if filter_type in ['OD', 'Overall']:
-                query = """
-                    SELECT id, 'OD' as type, model_name, employee_id, change_timestamp, 
-                           defect_threshold, size_threshold, model_threshold
-                    FROM od_threshold_history
-                    WHERE DATE(change_timestamp) BETWEEN %s AND %s
-                    ORDER BY change_timestamp DESC
-                """
-                cursor.execute(query, (from_date, to_date))
-                od_results = cursor.fetchall()
-                results.extend(od_results)
+            if filter_type not in _THRESHOLD_HISTORY_QUERIES:
+                return []
+            query, ranges = _THRESHOLD_HISTORY_QUERIES[filter_type]
             
+            # One round trip; 'Overall' merges BF and OD on the server
+            cursor = self.connection.cursor()
+            cursor.execute(query, (from_date, to_date) * ranges)
+            results = cursor.fetchall()
             cursor.close()
             
-            # Sort by timestamp descending
-            results.sort(key=lambda x: x[4], reverse=True)
-            
             return results
         
         except Exception as e:
@@ -214,6 +236,9 @@ class InfoDatabase:
             traceback.print_exc()
             DatabaseErrorHandler.handle_db_error(e, context="getting threshold history")
             return []
+        finally:
+            # Return a pooled connection as soon as the operation is done
+            self._release()
     
     def clear_threshold_history(self, filter_type='Overall'):
         """
@@ -226,7 +251,7 @@ class InfoDatabase:
             bool: True if successful, False otherwise
         """
         try:
-            if not self.connection or not self.connection.is_connected():
+            if self.use_pool or not self.connection or not self.connection.is_connected():
                 if not self.connect():
                     # Connection failed
                     return False
@@ -254,3 +279,6 @@ class InfoDatabase:
             print(f"❌ Error clearing threshold history: {e}")
             DatabaseErrorHandler.handle_db_error(e, context="clearing threshold history")
             return False
+        finally:
+            # Return a pooled connection as soon as the operation is done
+            self._release()
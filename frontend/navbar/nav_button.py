@@ -7,6 +7,15 @@ import tkinter as tk
 from ..utils.styles import Colors, Fonts
 
 
+# Look of a tab button locked while an inspection is running (red, white text)
+_LOCKED_OPTIONS = {
+    "state": tk.DISABLED,
+    "bg": Colors.DANGER,
+    "fg": Colors.WHITE,
+    "disabledforeground": Colors.WHITE,
+}
+
+
 class NavButton:
     """Individual navigation button component."""
     
@@ -26,6 +35,7 @@ class NavButton:
         self.button_id = button_id
         self.button = None
         self.is_active = False
+        self.is_locked = False
         
         # Button styling (matching expected UI style)
         self.inactive_bg = "#2563a8"  # Blue for inactive
@@ -92,6 +102,25 @@ class NavButton:
         else:
             self.button.config(bg=self.inactive_bg)
     
+    def lock(self):
+        """Disable the button (red) while an inspection is running."""
+        if self.is_locked:
+            return
+        # One configure call; the hover handlers ignore disabled buttons, so
+        # they can stay bound
+        self.button.config(**_LOCKED_OPTIONS)
+        self.is_locked = True
+    
+    def unlock(self):
+        """Re-enable the button with its normal active/inactive color."""
+        if not self.is_locked:
+            return
+        self.button.config(
+            state=tk.NORMAL,
+            bg=self.active_bg if self.is_active else self.inactive_bg
+        )
+        self.is_locked = False
+    
     def pack(self, **kwargs):
         """Pack the button with the given kwargs."""
         if self.button:
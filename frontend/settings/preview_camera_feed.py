@@ -32,6 +32,7 @@ class PreviewCameraFeed:
         self._last_update_time = 0
         self._frame_skip_counter = 0
         self._image_id = None  # Track canvas image ID for efficient updates
+        self._resize_buf = np.empty((AppConfig.CAMERA_HEIGHT, AppConfig.CAMERA_WIDTH, 3), dtype=np.uint8)
         
     def create(self, row, column):
         """
@@ -95,8 +96,13 @@ class PreviewCameraFeed:
             
             self._last_update_time = current_time
             
-            # Resize frame to fit canvas
-            resized_frame = cv2.resize(frame, (AppConfig.CAMERA_WIDTH, AppConfig.CAMERA_HEIGHT))
+            # Downsample to the canvas size into the preallocated buffer
+            resized_frame = cv2.resize(
+                frame,
+                (AppConfig.CAMERA_WIDTH, AppConfig.CAMERA_HEIGHT),
+                dst=self._resize_buf,
+                interpolation=cv2.INTER_AREA
+            )
             
             # Convert from BGR to RGB
             img = PIL.Image.fromarray(cv2.cvtColor(resized_frame, cv2.COLOR_BGR2RGB))
@@ -55,6 +55,7 @@ class SettingsTab:
         self.preview_od_thread = None
         self.preview_bf_thread = None
         self.preview_stop_flag = None  # Thread stop flag
+        self._black_frame = None  # Shared read-only black frame (see _get_black_frame)
         
         # Preview models (loaded when preview starts)
         self.preview_bf_model = None
@@ -979,19 +980,25 @@ class SettingsTab:
     def _update_od_preview(self):
         """Update OD camera preview feed with model inference."""
         od_feed = self.preview_camera_manager.get_feed('od') if self.preview_camera_manager else None
+        black_frame = self._get_black_frame()
+        
+        # Loop-invariant lookups bound once: the view onto the shared capture
+        # frame and its lock
+        frame_lock = self.app.frame_lock_od
+        shared_frame = np.frombuffer(
+            self.app.shared_frame_od.get_obj(), 
+            dtype=np.uint8
+        ).reshape(self.app.frame_shape)
+        preview_stop_flag = self.preview_stop_flag
         
         # Keep thread running until stop flag is set or canvas is destroyed
-        while od_feed and od_feed.canvas and od_feed.canvas.winfo_exists() and not self.preview_stop_flag.is_set():
+        while od_feed and od_feed.canvas and od_feed.canvas.winfo_exists() and not preview_stop_flag.is_set():
             try:
                 # Check if preview is active
                 if self.preview_active:
                     # Preview is running - get frame and run inference
-                    with self.app.frame_lock_od:
-                        np_frame = np.frombuffer(
-                            self.app.shared_frame_od.get_obj(), 
-                            dtype=np.uint8
-                        ).reshape(self.app.frame_shape)
-                        frame = np_frame.copy()
+                    with frame_lock:
+                        frame = shared_frame.copy()
         
                     # Get real-time threshold values from sliders
                     current_od_conf = self.app.od_conf_slider_value.get() / 100.0
@@ -1001,7 +1008,6 @@ class SettingsTab:
                     # Double-check model is still loaded before prediction
                     if self.preview_od_model is None:
                         # Model unloaded - show black screen
-                        black_frame = np.zeros(self.app.frame_shape, dtype=np.uint8)
                         od_feed.update_frame(black_frame)
                         time.sleep(0.03)
                         continue
@@ -1028,7 +1034,6 @@ class SettingsTab:
                     od_feed.update_frame(annotated_frame)
                 else:
                     # Preview is stopped - show black screen
-                    black_frame = np.zeros(self.app.frame_shape, dtype=np.uint8)
                     od_feed.update_frame(black_frame)
                 
                     time.sleep(0.03)  # ~30 FPS
@@ -1045,19 +1050,25 @@ class SettingsTab:
     def _update_bf_preview(self):
         """Update Bigface camera preview feed with model inference."""
         bf_feed = self.preview_camera_manager.get_feed('bf') if self.preview_camera_manager else None
+        black_frame = self._get_black_frame()
+        
+        # Loop-invariant lookups bound once: the view onto the shared capture
+        # frame and its lock
+        frame_lock = self.app.frame_lock_bigface
+        shared_frame = np.frombuffer(
+            self.app.shared_frame_bigface.get_obj(), 
+            dtype=np.uint8
+        ).reshape(self.app.frame_shape)
+        preview_stop_flag = self.preview_stop_flag
         
         # Keep thread running until stop flag is set or canvas is destroyed
-        while bf_feed and bf_feed.canvas and bf_feed.canvas.winfo_exists() and not self.preview_stop_flag.is_set():
+        while bf_feed and bf_feed.canvas and bf_feed.canvas.winfo_exists() and not preview_stop_flag.is_set():
             try:
                 # Check if preview is active
                 if self.preview_active:
                     # Preview is running - get frame and run inference
-                    with self.app.frame_lock_bigface:
-                        np_frame = np.frombuffer(
-                            self.app.shared_frame_bigface.get_obj(), 
-                            dtype=np.uint8
-                        ).reshape(self.app.frame_shape)
-                        frame = np_frame.copy()
+                    with frame_lock:
+                        frame = shared_frame.copy()
                     
                     # Get real-time threshold values from sliders
                     current_bf_conf = self.app.bf_conf_slider_value.get() / 100.0
@@ -1067,7 +1078,6 @@ class SettingsTab:
                     # Double-check model is still loaded before prediction
                     if self.preview_bf_model is None:
                         # Model unloaded - show black screen
-                        black_frame = np.zeros(self.app.frame_shape, dtype=np.uint8)
                         bf_feed.update_frame(black_frame)
                         time.sleep(0.03)
                         continue
@@ -1096,7 +1106,6 @@ class SettingsTab:
                     bf_feed.update_frame(annotated_frame)
                 else:
                     # Preview is stopped - show black screen
-                    black_frame = np.zeros(self.app.frame_shape, dtype=np.uint8)
                     bf_feed.update_frame(black_frame)
                 
                     time.sleep(0.03)  # ~30 FPS
@@ -1110,10 +1119,24 @@ class SettingsTab:
                     self.app.shared_data['system_error'] = True
                 break
 
+    def _get_black_frame(self):
+        """
+        Get the black frame shown while preview is stopped.
+        
+        Allocated once and marked read-only, since the preview feeds only read it.
+        
+        Returns:
+            numpy.ndarray: Black BGR frame of the camera frame shape
+        """
+        if self._black_frame is None or self._black_frame.shape != tuple(self.app.frame_shape):
+            black_frame = np.zeros(self.app.frame_shape, dtype=np.uint8)
+            black_frame.flags.writeable = False
+            self._black_frame = black_frame
+        return self._black_frame
+    
     def _display_black_screens(self):
         """Display black screens on both camera feeds when preview is stopped."""
-        # Create a black frame
-        black_frame = np.zeros(self.app.frame_shape, dtype=np.uint8)
+        black_frame = self._get_black_frame()
         
         # Update both feeds with black screen
         od_feed = self.preview_camera_manager.get_feed('od')
@@ -0,0 +1,72 @@
+"""
+Camera Probe Utilities
+Detects connected video capture devices without opening a video stream
+"""
+
+import glob
+import sys
+
+# struct v4l2_capability is 104 bytes; VIDIOC_QUERYCAP = _IOR('V', 0, struct v4l2_capability)
+_VIDIOC_QUERYCAP = 0x80685600
+_V4L2_CAPABILITY_SIZE = 104
+_V4L2_CAP_VIDEO_CAPTURE = 0x00000001
+_V4L2_CAP_DEVICE_CAPS = 0x80000000
+
+
+def _count_v4l2_capture_devices():
+    """Count /dev/video* nodes that report video capture capability."""
+    import fcntl
+    import os
+    import struct
+
+    count = 0
+    for path in sorted(glob.glob("/dev/video*")):
+        try:
+            fd = os.open(path, os.O_RDONLY | os.O_NONBLOCK)
+        except OSError:
+            continue
+        try:
+            buf = bytearray(_V4L2_CAPABILITY_SIZE)
+            fcntl.ioctl(fd, _VIDIOC_QUERYCAP, buf)
+            capabilities, device_caps = struct.unpack_from("<II", buf, 84)
+            # Per-node caps are authoritative when the driver provides them
+            if capabilities & _V4L2_CAP_DEVICE_CAPS:
+                capabilities = device_caps
+            if capabilities & _V4L2_CAP_VIDEO_CAPTURE:
+                count += 1
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+    return count
+
+
+def _count_directshow_devices():
+    """Count DirectShow video input devices."""
+    import comtypes
+    from pygrabber.dshow_graph import FilterGraph
+
+    # May run on a worker thread, which needs its own COM initialization
+    comtypes.CoInitialize()
+    try:
+        return len(FilterGraph().get_input_devices())
+    finally:
+        comtypes.CoUninitialize()
+
+
+def count_camera_devices():
+    """
+    Count connected cameras using OS device enumeration.
+
+    Returns:
+        int: Number of capture devices, or None if enumeration is unavailable
+             on this platform (callers should fall back to opening the camera)
+    """
+    try:
+        if sys.platform.startswith("win"):
+            return _count_directshow_devices()
+        if sys.platform.startswith("linux"):
+            return _count_v4l2_capture_devices()
+    except Exception:
+        return None
+    return None
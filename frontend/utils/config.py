@@ -14,6 +14,7 @@ class AppConfig:
     # Camera settings
     CAMERA_WIDTH = 580
     CAMERA_HEIGHT = 380
+    UI_TARGET_FPS = 20  # Max redraw rate of the inference camera canvases
     
     # PLC settings
     PLC_IP = "172.17.8.17"